@@ -0,0 +1,35 @@
+"""Benchmark of TextChunker._build_chunks with many text parts per chunk.
+
+Chunk building keeps running size totals, so its cost is linear in the number of text parts:
+the time per text part should stay flat as the chunk size (i.e. the number of parts per chunk) grows.
+
+Run it from the project folder with:
+
+    python -m benchmarks.bench_build_chunks
+"""
+import timeit
+
+from chunkipy import TextChunker, TextPart
+from chunkipy.size_estimators import CharSizeEstimator
+
+
+NUM_TEXT_PARTS = 200_000
+CHUNK_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def build_chunks(text_chunker: TextChunker, text_parts):
+    return text_chunker._build_chunks(text_parts)
+
+
+if __name__ == "__main__":
+    text_parts = [TextPart(size=1, text="x") for _ in range(NUM_TEXT_PARTS)]
+
+    print(f"{'chunk_size':>10} {'overlap':>8} {'chunks':>8} {'total (s)':>10} {'per part (us)':>14}")
+    for overlap_ratio in [0.0, 0.5]:
+        for chunk_size in CHUNK_SIZES:
+            text_chunker = TextChunker(chunk_size=chunk_size, overlap_ratio=overlap_ratio,
+                                       size_estimator=CharSizeEstimator())
+            num_chunks = len(build_chunks(text_chunker, text_parts))
+            elapsed = min(timeit.repeat(lambda: build_chunks(text_chunker, text_parts), number=1, repeat=3))
+            print(f"{chunk_size:>10} {overlap_ratio:>8} {num_chunks:>8} {elapsed:>10.3f} "
+                  f"{elapsed / NUM_TEXT_PARTS * 1e6:>14.3f}")
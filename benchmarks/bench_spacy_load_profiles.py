@@ -0,0 +1,40 @@
+"""Benchmark of the "full" and "lean" load profiles of SpacySentenceTextSplitter.
+
+The full profile loads the whole spaCy pipeline (tagger, NER, lemmatizer, ...) and disables the pipes not needed
+for sentence boundaries on each call; the lean profile excludes them at load time. For each profile, it reports
+the load time and resident size of the model (from the model registry) and the per-document latency
+on the example texts.
+
+It requires the optional dependencies (pip install chunkipy[spacy,langdetect]) and the en_core_web_sm model.
+Run it from the project folder with:
+
+    python -m benchmarks.bench_spacy_load_profiles
+"""
+import time
+from pathlib import Path
+
+from chunkipy.text_splitters.semantic import ModelRegistry
+from chunkipy.text_splitters.semantic.sentences import SpacySentenceTextSplitter
+
+
+EXAMPLE_TEXTS = Path(__file__).parent.parent / "examples" / "texts" / "napoleon.txt"
+REPEAT = 5
+
+
+if __name__ == "__main__":
+    text = EXAMPLE_TEXTS.read_text(encoding="utf-8")
+    print(f"{len(text)} characters, {REPEAT} runs")
+
+    print(f"{'profile':>8} {'load (s)':>9} {'resident (MB)':>14} {'sentences':>10} {'per document (s)':>17}")
+    for load_profile in SpacySentenceTextSplitter.LOAD_PROFILES:
+        model_registry = ModelRegistry()
+        splitter = SpacySentenceTextSplitter(model_registry=model_registry, load_profile=load_profile)
+        splitter.warmup(["en"])
+        model_info = model_registry.model_info()[0]
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            sentences = splitter.split(text)
+        per_document = (time.perf_counter() - start) / REPEAT
+        print(f"{load_profile:>8} {model_info.load_time:>9.2f} {model_info.resident_size / 2 ** 20:>14.1f} "
+              f"{len(sentences):>10} {per_document:>17.3f}")
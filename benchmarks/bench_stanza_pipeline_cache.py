@@ -0,0 +1,66 @@
+"""Benchmark of the per-language Stanza Pipeline cache of StanzaSentenceTextSplitter.
+
+Without the cache, a Stanza Pipeline was built for every text_limit window of every document, so each
+window paid a model load. With the cache, the pipeline is built once per language (at construction with
+preload_langs) and the per-document latency is the sentence splitting alone.
+
+It requires the optional dependencies (pip install chunkipy[stanza,langdetect]) and the English Stanza model.
+Run it from the project folder with:
+
+    python -m benchmarks.bench_stanza_pipeline_cache
+"""
+import time
+
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry
+from chunkipy.text_splitters.semantic.sentences import StanzaSentenceTextSplitter
+
+
+NUM_DOCUMENTS = 5
+TEXT_LIMIT = 1_000
+DOCUMENT = "Chunkipy splits long documents into chunks. Each chunk is made of whole sentences, when possible. " * 50
+
+
+class UncachedStanzaSentenceTextSplitter(StanzaSentenceTextSplitter):
+    """The previous behaviour: each text_limit window split on its own, with a new Pipeline.
+
+    The pipelines are loaded through a private ModelRegistry, cleared before each window.
+    """
+    BULK_WINDOWS = False
+
+    def __init__(self, text_limit: int):
+        super().__init__(text_limit=text_limit, model_registry=ModelRegistry())
+        self.pipeline_loads = 0
+
+    def _split_batch(self, texts, langs):
+        texts_parts = []
+        for text, lang in zip(texts, langs):
+            self.model_registry.clear()
+            self.pipeline_loads += 1
+            pipeline = self._load_model(lang or self._detect_language(text))
+            texts_parts.append(self._split_with_model(pipeline, text))
+        return texts_parts
+
+
+def per_document_latency(splitter: StanzaSentenceTextSplitter) -> float:
+    start = time.perf_counter()
+    for _ in range(NUM_DOCUMENTS):
+        splitter.split(DOCUMENT)
+    return (time.perf_counter() - start) / NUM_DOCUMENTS
+
+
+if __name__ == "__main__":
+    windows = -(-len(DOCUMENT) // TEXT_LIMIT)
+    print(f"{NUM_DOCUMENTS} documents of {len(DOCUMENT)} characters, {windows} windows each")
+
+    uncached_splitter = UncachedStanzaSentenceTextSplitter(text_limit=TEXT_LIMIT)
+    uncached = per_document_latency(uncached_splitter)
+    print(f"{'uncached':>10}: {uncached:.3f} s/document "
+          f"({uncached_splitter.pipeline_loads / NUM_DOCUMENTS:.0f} pipeline loads/document)")
+
+    start = time.perf_counter()
+    model_registry = ModelRegistry()
+    splitter = StanzaSentenceTextSplitter(text_limit=TEXT_LIMIT, preload_langs=["en"], model_registry=model_registry)
+    print(f"{'preload':>10}: {time.perf_counter() - start:.3f} s")
+    cached = per_document_latency(splitter)
+    print(f"{'cached':>10}: {cached:.3f} s/document ({uncached / cached:.1f}x, "
+          f"{model_registry.loads} pipeline load in total)")
@@ -0,0 +1,119 @@
+"""Synthetic corpora for the benchmarks.
+
+Every corpus is generated from a seed, so runs (and saved baselines) are comparable across machines and versions.
+Kinds of documents:
+
+- ``prose``: paragraphs of sentences with commas, semicolons and colons;
+- ``logs``: log lines, with timestamps, levels, paths and key=value pairs, and no sentence punctuation;
+- ``run_on``: long sentences of words with no punctuation at all, which have to be split at the word level;
+- ``multilingual``: prose in Latin, Cyrillic, Greek, Arabic and CJK scripts.
+"""
+import random
+from typing import Dict, List
+
+
+KINDS = ("prose", "logs", "run_on", "multilingual")
+
+_LATIN_WORDS = ["the", "of", "chunk", "text", "model", "data", "a", "is", "with", "sentence", "token", "limit",
+                "semantic", "split", "and", "in", "to", "for", "on", "document", "retrieval", "embedding"]
+_SCRIPTS = {
+    "cyrillic": "".join(chr(c) for c in range(0x0430, 0x0450)),
+    "greek": "".join(chr(c) for c in range(0x03B1, 0x03CA)),
+    "arabic": "".join(chr(c) for c in range(0x0627, 0x064B)),
+}
+_CJK_CHARS = "".join(chr(c) for c in range(0x4E00, 0x4E00 + 2000))
+
+
+def _sentence(rng: random.Random, words: List[str], min_words: int, max_words: int, punctuation: bool) -> str:
+    sentence_words = [rng.choice(words) for _ in range(rng.randint(min_words, max_words))]
+    if punctuation:
+        for i in range(1, len(sentence_words) - 1):
+            if rng.random() < 0.08:
+                sentence_words[i] += rng.choice([",", ",", ";", ":"])
+        return " ".join(sentence_words).capitalize() + "."
+    return " ".join(sentence_words)
+
+
+def _words(rng: random.Random, alphabet: str, num_words: int = 200) -> List[str]:
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(2, 9))) for _ in range(num_words)]
+
+
+def _prose(rng: random.Random, num_chars: int, words: List[str]) -> str:
+    paragraphs = []
+    size = 0
+    while size < num_chars:
+        paragraph = " ".join(_sentence(rng, words, 5, 30, punctuation=True) for _ in range(rng.randint(2, 8)))
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def _logs(rng: random.Random, num_chars: int) -> str:
+    lines = []
+    size = 0
+    while size < num_chars:
+        line = (f"2024-0{rng.randint(1, 9)}-{rng.randint(10, 28)}T{rng.randint(10, 23)}:{rng.randint(10, 59)}:"
+                f"{rng.randint(10, 59)}.{rng.randint(100, 999)}Z {rng.choice(['INFO', 'DEBUG', 'WARN', 'ERROR'])} "
+                f"[worker-{rng.randint(0, 31)}] /srv/app/{rng.choice(_LATIN_WORDS)}/{rng.choice(_LATIN_WORDS)}.py "
+                f"request_id={rng.getrandbits(64):016x} latency_ms={rng.randint(1, 5000)} "
+                f"status={rng.choice([200, 200, 201, 404, 500])}")
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def _run_on(rng: random.Random, num_chars: int) -> str:
+    return _sentence(rng, _LATIN_WORDS, num_chars // 6, num_chars // 6, punctuation=False)
+
+
+def _multilingual(rng: random.Random, num_chars: int) -> str:
+    script = rng.choice(["latin", "cyrillic", "greek", "arabic", "cjk"])
+    if script == "latin":
+        return _prose(rng, num_chars, _LATIN_WORDS)
+    if script == "cjk":
+        sentences = []
+        size = 0
+        while size < num_chars:
+            sentence = "".join(rng.choice(_CJK_CHARS) for _ in range(rng.randint(8, 40))) + "\u3002"
+            sentences.append(sentence)
+            size += len(sentence)
+        return "".join(sentences)
+    return _prose(rng, num_chars, _words(rng, _SCRIPTS[script]))
+
+
+def generate_documents(kind: str, num_docs: int, doc_chars: int, seed: int = 0) -> List[str]:
+    """Generate a synthetic corpus.
+
+    Args:
+        kind (str): One of KINDS.
+        num_docs (int): The number of documents.
+        doc_chars (int): The approximate number of characters of each document.
+        seed (int): The seed of the generator.
+
+    Returns:
+        List[str]: The documents.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}. Current value: {kind}")
+    rng = random.Random(f"{kind}-{seed}")
+    if kind == "prose":
+        return [_prose(rng, doc_chars, _LATIN_WORDS) for _ in range(num_docs)]
+    if kind == "logs":
+        return [_logs(rng, doc_chars) for _ in range(num_docs)]
+    if kind == "run_on":
+        return [_run_on(rng, doc_chars) for _ in range(num_docs)]
+    return [_multilingual(rng, doc_chars) for _ in range(num_docs)]
+
+
+def generate_corpus(num_docs: int, doc_chars: int, seed: int = 0) -> Dict[str, List[str]]:
+    """Generate a synthetic corpus of each kind.
+
+    Args:
+        num_docs (int): The number of documents of each kind.
+        doc_chars (int): The approximate number of characters of each document.
+        seed (int): The seed of the generator.
+
+    Returns:
+        Dict[str, List[str]]: The documents of each kind.
+    """
+    return {kind: generate_documents(kind, num_docs, doc_chars, seed) for kind in KINDS}
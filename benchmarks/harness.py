@@ -0,0 +1,180 @@
+"""Measurement helpers of the benchmark suite: throughput, peak memory, size estimator calls and baselines."""
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from chunkipy.size_estimators import BaseSizeEstimator
+
+
+BASELINES_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+@dataclass
+class BenchmarkResult:
+    """The measures of a benchmark over a list of documents.
+
+    :param name: The name of the benchmark.
+    :param docs: The number of documents processed per run.
+    :param chars: The number of characters processed per run.
+    :param seconds: The time of the fastest run.
+    :param peak_memory: The peak memory allocated during a run, in bytes (None if not measured).
+    :param estimator_calls: The number of calls of the size estimator during a run (None if not counted).
+    :param estimated_texts: The number of texts estimated by the size estimator during a run (None if not counted).
+    """
+    name: str
+    docs: int
+    chars: int
+    seconds: float
+    peak_memory: Optional[int] = None
+    estimator_calls: Optional[int] = None
+    estimated_texts: Optional[int] = None
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.seconds if self.seconds else float("inf")
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.docs / self.seconds if self.seconds else float("inf")
+
+
+class CountingSizeEstimator(BaseSizeEstimator):
+    """Size estimator counting the calls to another size estimator.
+
+    Args:
+        inner (BaseSizeEstimator): The counted size estimator.
+    """
+
+    def __init__(self, inner: BaseSizeEstimator):
+        super().__init__()
+        self.inner = inner
+        self.calls = 0
+        self.estimated_texts = 0
+
+    def reset(self):
+        self.calls = self.estimated_texts = 0
+
+    def estimate_size(self, text: str) -> int:
+        self.calls += 1
+        self.estimated_texts += 1
+        return self.inner.estimate_size(text)
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        self.calls += 1
+        self.estimated_texts += len(texts)
+        return self.inner.estimate_sizes(texts)
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        self.calls += 1
+        self.estimated_texts += 1
+        return self.inner.token_spans(text)
+
+    @property
+    def supports_token_spans(self) -> bool:
+        return self.inner.supports_token_spans
+
+
+def measure(name: str, fn: Callable[[Any], Any], inputs: List[Any], chars: int, repeat: int = 3,
+            memory: bool = True, size_estimator: CountingSizeEstimator = None) -> BenchmarkResult:
+    """Run fn on each input, repeat times, and measure the fastest run.
+
+    Args:
+        name (str): The name of the benchmark.
+        fn (Callable[[Any], Any]): The benchmarked function, called on each input.
+        inputs (List[Any]): The inputs, usually one per document.
+        chars (int): The number of characters of the inputs, for the throughput.
+        repeat (int): The number of timed runs.
+        memory (bool): Whether to measure the peak memory, in an additional run traced by tracemalloc.
+        size_estimator (CountingSizeEstimator): The size estimator used by fn, whose calls are counted.
+
+    Returns:
+        BenchmarkResult: The measures.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        if size_estimator is not None:
+            size_estimator.reset()
+        start = time.perf_counter()
+        for fn_input in inputs:
+            fn(fn_input)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    result = BenchmarkResult(name=name, docs=len(inputs), chars=chars, seconds=seconds)
+    if size_estimator is not None:
+        result.estimator_calls = size_estimator.calls
+        result.estimated_texts = size_estimator.estimated_texts
+    if memory:
+        tracemalloc.start()
+        try:
+            for fn_input in inputs:
+                fn(fn_input)
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def baseline_path(baseline: str) -> str:
+    return baseline if baseline.endswith(".json") else os.path.join(BASELINES_DIR, f"{baseline}.json")
+
+
+def save_baseline(results: List[BenchmarkResult], baseline: str, metadata: Dict[str, Any] = None):
+    """Save the results as a baseline, i.e. a JSON file, for later comparisons.
+
+    Args:
+        results (List[BenchmarkResult]): The results to save.
+        baseline (str): The name of the baseline (saved in benchmarks/baselines) or the path of a JSON file.
+        metadata (Dict[str, Any]): The parameters of the run, saved along the results.
+    """
+    path = baseline_path(baseline)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        json.dump({"metadata": metadata or {}, "results": [asdict(result) for result in results]}, file, indent=2)
+
+
+def load_baseline(baseline: str) -> Tuple[Dict[str, Any], Dict[str, BenchmarkResult]]:
+    """Load a baseline saved by save_baseline.
+
+    Args:
+        baseline (str): The name of the baseline or the path of its JSON file.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, BenchmarkResult]]: The parameters of the run and the results by name.
+    """
+    with open(baseline_path(baseline)) as file:
+        data = json.load(file)
+    return data["metadata"], {result["name"]: BenchmarkResult(**result) for result in data["results"]}
+
+
+def format_results(results: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult] = None) -> str:
+    """Format the results as a table, with the speedup over the baseline if any.
+
+    Args:
+        results (List[BenchmarkResult]): The results.
+        baseline (Dict[str, BenchmarkResult]): The baseline results by name.
+
+    Returns:
+        str: The table.
+    """
+    name_width = max([len(result.name) for result in results] + [9])
+    header = (f"{'benchmark':<{name_width}} {'docs/s':>10} {'Mchars/s':>9} {'peak KiB':>9} "
+              f"{'est. calls':>10} {'est. texts':>10}")
+    if baseline is not None:
+        header += f" {'speedup':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = (f"{result.name:<{name_width}} {result.docs_per_second:>10.1f} {result.chars_per_second / 1e6:>9.2f} "
+                f"{_optional(result.peak_memory, 1024):>9} {_optional(result.estimator_calls):>10} "
+                f"{_optional(result.estimated_texts):>10}")
+        if baseline is not None:
+            baseline_result = baseline.get(result.name)
+            line += f" {baseline_result.seconds / result.seconds:>7.2f}x" if baseline_result else f" {'-':>8}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _optional(value: Optional[int], unit: int = 1) -> str:
+    return "-" if value is None else str(value // unit)
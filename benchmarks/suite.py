@@ -0,0 +1,158 @@
+"""Benchmark suite of chunkipy: micro benchmarks of each text splitter, each size estimator, split_text and
+_build_chunks (with and without overlap), and macro benchmarks of the whole chunk(), on a synthetic corpus
+of prose, logs, run-on sentences and many scripts (see benchmarks.corpus).
+
+Each benchmark reports its throughput (documents and characters per second), its peak memory and the calls
+to the size estimator. Results can be saved as a baseline and compared with a later run, e.g. before and
+after a change. The default run only needs the core dependencies: the benchmarks of optional size
+estimators (tiktoken) are added when they are installed.
+
+Run it from the project folder with:
+
+    python -m benchmarks.suite                           # full run
+    python -m benchmarks.suite --quick                   # small corpus, single run
+    python -m benchmarks.suite --save main               # save benchmarks/baselines/main.json
+    python -m benchmarks.suite --compare main            # speedups over the saved baseline
+    python -m benchmarks.suite --filter build_chunks     # only the matching benchmarks
+"""
+import argparse
+import sys
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from benchmarks.corpus import KINDS, generate_corpus
+from benchmarks.harness import BenchmarkResult, CountingSizeEstimator, format_results, load_baseline, measure, \
+    save_baseline
+from chunkipy import TextChunker
+from chunkipy.size_estimators import (
+    BaseSizeEstimator,
+    CachedSizeEstimator,
+    CharSizeEstimator,
+    OpenAISizeEstimator,
+    TieredSizeEstimator,
+    WordSizeEstimator
+)
+from chunkipy.text_splitters import (
+    BaseTextSplitter,
+    ColonTextSplitter,
+    CommaTextSplitter,
+    FullStopTextSplitter,
+    NewlineTextSplitter,
+    SemicolonTextSplitter,
+    WordTextSplitter
+)
+from chunkipy.utils import MissingDependencyError
+
+
+CHUNK_SIZE = 200
+
+# name -> (benchmarked function, inputs, size estimator whose calls are counted)
+Benchmark = Tuple[Callable, List, CountingSizeEstimator]
+
+
+def text_splitters() -> Dict[str, BaseTextSplitter]:
+    return {text_splitter.__class__.__name__: text_splitter for text_splitter in [
+        NewlineTextSplitter(), FullStopTextSplitter(), SemicolonTextSplitter(), ColonTextSplitter(),
+        CommaTextSplitter(), WordTextSplitter()]}
+
+
+def size_estimators() -> Dict[str, Callable[[], BaseSizeEstimator]]:
+    factories = {
+        "CharSizeEstimator": CharSizeEstimator,
+        "WordSizeEstimator": WordSizeEstimator,
+        "CachedSizeEstimator(Word)": lambda: CachedSizeEstimator(WordSizeEstimator()),
+        "TieredSizeEstimator(Word)": lambda: TieredSizeEstimator(WordSizeEstimator(), chunk_size=CHUNK_SIZE),
+    }
+    try:
+        OpenAISizeEstimator()
+        factories["OpenAISizeEstimator"] = OpenAISizeEstimator
+    except MissingDependencyError:
+        pass
+    return factories
+
+
+def chunkers() -> Dict[str, Callable[[BaseSizeEstimator], TextChunker]]:
+    return {
+        "words": lambda size_estimator: TextChunker(CHUNK_SIZE, size_estimator=size_estimator),
+        "words+overlap": lambda size_estimator: TextChunker(CHUNK_SIZE, size_estimator=size_estimator,
+                                                            overlap_ratio=0.25),
+        "words+newline+full_stop": lambda size_estimator: TextChunker(
+            CHUNK_SIZE, size_estimator=size_estimator, text_splitters=[NewlineTextSplitter(), FullStopTextSplitter()]),
+        "words+scanner": lambda size_estimator: TextChunker(CHUNK_SIZE, size_estimator=size_estimator,
+                                                            engine="scanner"),
+    }
+
+
+def benchmarks(corpus: Dict[str, List[str]]) -> Iterator[Tuple[str, str, Benchmark]]:
+    """Yields (name, kind of documents, benchmark) for each benchmark of the suite."""
+    for kind, docs in corpus.items():
+        # Micro: text splitters, on whole documents
+        for name, text_splitter in text_splitters().items():
+            yield f"splitter/{name}/{kind}", kind, (text_splitter.split_spans, docs, None)
+
+        # Micro: size estimators, on the sentences of the documents as split_text would batch them
+        sentences = [[doc[start:end] for start, end in FullStopTextSplitter().split_spans(doc)] for doc in docs]
+        for name, size_estimator_factory in size_estimators().items():
+            size_estimator = CountingSizeEstimator(size_estimator_factory())
+            yield f"estimator/{name}/{kind}", kind, (size_estimator.estimate_sizes, sentences, size_estimator)
+
+        # Micro: splitting and chunk building, separately
+        size_estimator = CountingSizeEstimator(WordSizeEstimator())
+        text_chunker = TextChunker(CHUNK_SIZE, size_estimator=size_estimator)
+        yield f"split_text/{kind}", kind, (lambda doc: list(text_chunker.split_text(doc)), docs, size_estimator)
+        text_parts = [list(text_chunker.split_text(doc)) for doc in docs]
+        for overlap_ratio in [0.0, 0.25]:
+            chunk_builder = TextChunker(CHUNK_SIZE, overlap_ratio=overlap_ratio)
+            yield (f"build_chunks/overlap={overlap_ratio}/{kind}", kind,
+                   (chunk_builder._build_chunks, text_parts, None))
+
+        # Macro: the whole chunk()
+        for name, chunker_factory in chunkers().items():
+            size_estimator = CountingSizeEstimator(WordSizeEstimator())
+            text_chunker = chunker_factory(size_estimator)
+            yield f"chunk/{name}/{kind}", kind, (text_chunker.chunk, docs, size_estimator)
+
+
+def run(num_docs: int, doc_chars: int, repeat: int, memory: bool, name_filter: str = None,
+        seed: int = 0) -> List[BenchmarkResult]:
+    corpus = generate_corpus(num_docs, doc_chars, seed)
+    corpus_chars = {kind: sum(len(doc) for doc in docs) for kind, docs in corpus.items()}
+    results = []
+    for name, kind, (fn, inputs, size_estimator) in benchmarks(corpus):
+        if name_filter and name_filter not in name:
+            continue
+        results.append(measure(name, fn, inputs, corpus_chars[kind], repeat=repeat, memory=memory,
+                               size_estimator=size_estimator))
+        print(f"  {name}: {results[-1].seconds:.3f}s", file=sys.stderr)
+    return results
+
+
+def main(args: List[str] = None):
+    parser = argparse.ArgumentParser(description="chunkipy benchmark suite")
+    parser.add_argument("--docs", type=int, default=20, help="documents of each kind")
+    parser.add_argument("--doc-chars", type=int, default=20_000, help="characters of each document")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic corpus")
+    parser.add_argument("--quick", action="store_true", help="small corpus and a single run")
+    parser.add_argument("--no-memory", action="store_true", help="do not measure the peak memory")
+    parser.add_argument("--filter", default=None, help="run only the benchmarks whose name contains it")
+    parser.add_argument("--save", default=None, help="save the results as this baseline (name or .json path)")
+    parser.add_argument("--compare", default=None, help="compare the results with this baseline")
+    options = parser.parse_args(args)
+    if options.quick:
+        options.docs, options.doc_chars, options.repeat = 3, 5_000, 1
+
+    baseline = None
+    metadata = dict(docs=options.docs, doc_chars=options.doc_chars, seed=options.seed, kinds=list(KINDS))
+    if options.compare:
+        baseline_metadata, baseline = load_baseline(options.compare)
+        if baseline_metadata != metadata:
+            print(f"Warning: the baseline was run with {baseline_metadata}", file=sys.stderr)
+
+    results = run(options.docs, options.doc_chars, options.repeat, not options.no_memory, options.filter, options.seed)
+    print(format_results(results, baseline))
+    if options.save:
+        save_baseline(results, options.save, metadata)
+
+
+if __name__ == "__main__":
+    main()
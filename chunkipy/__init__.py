@@ -1,6 +1,6 @@
 import logging
-from chunkipy.text_chunker import TextChunker
-from chunkipy.text_chunker.data_models import TextPart, Chunk, Chunks, Overlap
+from chunkipy.text_chunker import TextChunker, TextChunkerConfig, ChunkingStats, ChunkTable
+from chunkipy.text_chunker.data_models import TextPart, Chunk, Chunks, Overlap, FrozenChunk
 
 
 # Configure logging
@@ -8,9 +8,13 @@ logging.basicConfig(level=logging.INFO)
 
 
 __all__ = ["TextChunker",
+        "TextChunkerConfig",
         "TextPart",
         "Chunk",
         "Chunks",
-        "Overlap"]
+        "Overlap",
+        "FrozenChunk",
+        "ChunkingStats",
+        "ChunkTable"]
 
 
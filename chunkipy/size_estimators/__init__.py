@@ -1,7 +1,20 @@
 from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+from chunkipy.size_estimators.async_base_size_estimator import AsyncBaseSizeEstimator
 from chunkipy.size_estimators.word_size_estimator import WordSizeEstimator
 from chunkipy.size_estimators.char_size_estimator import CharSizeEstimator
 from chunkipy.size_estimators.openai_size_estimator import OpenAISizeEstimator
+from chunkipy.size_estimators.huggingface_size_estimator import HuggingFaceSizeEstimator
+from chunkipy.size_estimators.cached_size_estimator import CachedSizeEstimator
+from chunkipy.size_estimators.token_spans_index import TokenSpansIndex
+from chunkipy.size_estimators.tiered_size_estimator import PointEstimate, TieredSizeEstimator
+from chunkipy.size_estimators.remote_size_estimator import (
+    RemoteSizeEstimationError,
+    RemoteSizeEstimator,
+    SizeEstimatorServer
+)
 
 
-__all__ = ["BaseSizeEstimator", "WordSizeEstimator", "CharSizeEstimator", "OpenAISizeEstimator"]
\ No newline at end of file
+__all__ = ["BaseSizeEstimator", "AsyncBaseSizeEstimator", "WordSizeEstimator", "CharSizeEstimator", "OpenAISizeEstimator",
+           "HuggingFaceSizeEstimator", "CachedSizeEstimator", "TokenSpansIndex", "TieredSizeEstimator",
+           "PointEstimate",
+           "RemoteSizeEstimator", "RemoteSizeEstimationError", "SizeEstimatorServer"]
\ No newline at end of file
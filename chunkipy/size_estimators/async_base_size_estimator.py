@@ -0,0 +1,76 @@
+import asyncio
+from typing import Awaitable, List, TypeVar
+
+from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+
+
+T = TypeVar("T")
+
+
+class AsyncBaseSizeEstimator(BaseSizeEstimator):
+    """
+    Base class for size estimators waiting on I/O, e.g. a tokenizer running behind an RPC.
+
+    Subclasses implement the coroutine aestimate_size (and, if the backend accepts batches, aestimate_sizes):
+    TextChunker.achunk awaits them, so that the estimations of many text parts and texts overlap
+    instead of blocking the event loop. The synchronous methods run the coroutines in a new event loop,
+    so the size estimator can still be used by TextChunker.chunk, but not from a running event loop.
+    """
+
+    async def aestimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The estimated size of the text.
+        """
+        raise NotImplementedError("Subclasses must implement the aestimate_size method.")
+
+    async def aestimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts.
+        The default implementation awaits aestimate_size on all the texts concurrently.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text, in the same order.
+        """
+        return list(await asyncio.gather(*(self.aestimate_size(text) for text in texts)))
+
+    def estimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text, running aestimate_size to completion.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The estimated size of the text.
+        """
+        return self._run(self.aestimate_size(text))
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, running aestimate_sizes to completion.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text, in the same order.
+        """
+        return self._run(self.aestimate_sizes(texts))
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError(f"{self.__class__.__name__} cannot estimate sizes synchronously from a running event loop. "
+                           f"Use TextChunker.achunk or await aestimate_sizes instead.")
@@ -1,5 +1,6 @@
 
 from abc import ABC
+from typing import List, Tuple
 
 
 class BaseSizeEstimator(ABC):
@@ -17,4 +18,68 @@ class BaseSizeEstimator(ABC):
         Returns:
             int: The estimated size of the text in bytes.
         """
-        raise NotImplementedError("Subclasses must implement the estimate_size method.")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement the estimate_size method.")
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts.
+
+        The default implementation calls estimate_size on each text: size estimators
+        that can process many texts at once (e.g. batched tokenizers) should override it.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text, in the same order.
+        """
+        return [self.estimate_size(text) for text in texts]
+
+    async def aestimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, from a coroutine.
+
+        The default implementation calls estimate_sizes, which is fine for the in-process size estimators.
+        Size estimators waiting on I/O (e.g. a tokenizer behind an RPC) should extend AsyncBaseSizeEstimator,
+        so that they do not block the event loop.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text, in the same order.
+        """
+        return self.estimate_sizes(texts)
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Tokenize the given text and return the character offsets of each token.
+
+        Size estimators that implement it can be used to tokenize a text once and derive the size
+        of any of its parts from the offsets (see TokenSpansIndex), instead of estimating each part again.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token, in order.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not provide token offsets.")
+
+    async def atoken_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Tokenize the given text and return the character offsets of each token, from a coroutine.
+        The default implementation calls token_spans.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token, in order.
+        """
+        return self.token_spans(text)
+
+    @property
+    def supports_token_spans(self) -> bool:
+        """Whether this size estimator implements token_spans."""
+        return type(self).token_spans is not BaseSizeEstimator.token_spans
\ No newline at end of file
@@ -0,0 +1,175 @@
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import nullcontext
+from typing import List, Tuple
+
+from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "bytes"])
+
+
+class CachedSizeEstimator(BaseSizeEstimator):
+    """
+    Size estimator that memoizes the sizes computed by another size estimator.
+
+    Sizes are kept in an LRU cache keyed by the text (i.e. by its hash, as any dict), which is bounded
+    both by the number of entries and by the memory taken by the cached texts.
+    Useful when the same texts (boilerplate paragraphs, headers, disclaimers, ...) are estimated again
+    and again with an expensive estimator, e.g. a tokenizer.
+
+    Args:
+        inner (BaseSizeEstimator): The size estimator whose results are cached.
+        max_entries (int): The maximum number of cached texts. If None, the number of entries is unbounded.
+        max_bytes (int): The maximum memory taken by the cached texts. If None, the memory is unbounded.
+        thread_safe (bool): If True, the cache can be shared among threads.
+
+    Attributes:
+        hits (int): The number of sizes served from the cache.
+        misses (int): The number of sizes computed by the inner size estimator.
+        evictions (int): The number of texts evicted from the cache.
+    """
+    DEFAULT_MAX_ENTRIES = 100_000
+
+    def __init__(self, inner: BaseSizeEstimator, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = None, thread_safe: bool = False):
+        super().__init__()
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer. Current value: {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be a positive integer. Current value: {max_bytes}")
+        self.inner = inner
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.thread_safe = thread_safe
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio of sizes served from the cache.
+
+        Returns:
+            float: hits / (hits + misses), or 0.0 if nothing has been estimated yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the cache statistics.
+
+        Returns:
+            CacheInfo: The number of hits, misses, evictions, cached entries and cached bytes.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._cache), self._bytes)
+
+    def cache_clear(self):
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def estimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text, using the cached value if available.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The estimated size of the text, as computed by the inner size estimator.
+        """
+        with self._lock:
+            size = self._cache.get(text)
+            if size is not None:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return size
+            self.misses += 1
+
+        size = self.inner.estimate_size(text)
+
+        with self._lock:
+            self._store(text, size)
+        return size
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, using the cached values if available.
+        The texts missing from the cache are estimated in a single batch by the inner size estimator.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text, in the same order.
+        """
+        sizes = [None] * len(texts)
+        missing = dict()  # text -> indexes of its occurrences, to estimate each missing text once
+        with self._lock:
+            for i, text in enumerate(texts):
+                size = self._cache.get(text)
+                if size is not None:
+                    self._cache.move_to_end(text)
+                    self.hits += 1
+                    sizes[i] = size
+                else:
+                    self.misses += 1
+                    missing.setdefault(text, []).append(i)
+
+        if missing:
+            missing_texts = list(missing)
+            missing_sizes = self.inner.estimate_sizes(missing_texts)
+            with self._lock:
+                for text, size in zip(missing_texts, missing_sizes):
+                    self._store(text, size)
+                    for i in missing[text]:
+                        sizes[i] = size
+        return sizes
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the token offsets computed by the inner size estimator (they are not cached).
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token.
+        """
+        return self.inner.token_spans(text)
+
+    @property
+    def supports_token_spans(self) -> bool:
+        """Whether the inner size estimator implements token_spans."""
+        return self.inner.supports_token_spans
+
+    def _store(self, text: str, size: int):
+        if text in self._cache:
+            return
+        text_bytes = sys.getsizeof(text)
+        if self.max_bytes is not None and text_bytes > self.max_bytes:
+            return  # it would evict the whole cache
+        self._cache[text] = size
+        self._bytes += text_bytes
+        while (self.max_entries is not None and len(self._cache) > self.max_entries) \
+                or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            evicted_text, _ = self._cache.popitem(last=False)
+            self._bytes -= sys.getsizeof(evicted_text)
+            self.evictions += 1
+
+    def __getstate__(self):
+        # Locks cannot be pickled: the cache is not shipped, only its configuration
+        state = self.__dict__.copy()
+        state.update(_lock=None, _cache=OrderedDict(), _bytes=0, hits=0, misses=0, evictions=0)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock() if self.thread_safe else nullcontext()
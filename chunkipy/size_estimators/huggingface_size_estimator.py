@@ -0,0 +1,79 @@
+from typing import List, Tuple
+from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+from chunkipy.utils import import_dependencies
+
+
+class HuggingFaceSizeEstimator(BaseSizeEstimator):
+    """
+    Size estimator that counts the tokens of a HuggingFace tokenizer, loaded from its tokenizer.json
+    with the tokenizers library (no need for transformers).
+
+    Special tokens (e.g. [CLS] and [SEP]) are not counted, and the truncation and padding configured
+    in the tokenizer.json are disabled, so sizes are the actual number of tokens of each text.
+    Batches are encoded with encode_batch, in parallel (Rust) and without holding the GIL.
+
+    Args:
+        tokenizer_file (str): The path of the tokenizer.json file.
+    """
+
+    def __init__(self, tokenizer_file: str):
+        super().__init__()
+        self.tokenizer_file = tokenizer_file
+        self.tokenizer = self._load_tokenizer(tokenizer_file)
+
+    @staticmethod
+    def _load_tokenizer(tokenizer_file: str):
+        _, Tokenizer = import_dependencies(extra="tokenizers", package_name="tokenizers", attribute_names=["Tokenizer"])
+        tokenizer = Tokenizer.from_file(tokenizer_file)
+        tokenizer.no_truncation()
+        tokenizer.no_padding()
+        return tokenizer
+
+    def __getstate__(self):
+        # The tokenizer is rebuilt from its file, so it is never pickled
+        state = self.__dict__.copy()
+        del state["tokenizer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.tokenizer = self._load_tokenizer(self.tokenizer_file)
+
+    def estimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text using the HuggingFace tokenizer.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The estimated size of the text in tokens, special tokens excluded.
+        """
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, encoding them in a single parallel batch.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text in tokens, in the same order.
+        """
+        if not texts:
+            return []
+        return [len(encoding.ids) for encoding in self.tokenizer.encode_batch(texts, add_special_tokens=False)]
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Tokenize the text and return the character offsets of each token, from the tokenizer offset mapping.
+        Tokens made of parts of the same character (e.g. byte-level tokens) share its offsets.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token.
+        """
+        return [tuple(offsets) for offsets in self.tokenizer.encode(text, add_special_tokens=False).offsets]
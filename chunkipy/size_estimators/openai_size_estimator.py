@@ -1,3 +1,4 @@
+from typing import List, Tuple
 from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
 from chunkipy.utils import import_dependencies
 
@@ -5,11 +6,33 @@ from chunkipy.utils import import_dependencies
 class OpenAISizeEstimator(BaseSizeEstimator):
     """
     Size estimator that uses OpenAI's tokenization to estimate the size of the text.
+
+    Args:
+        encoding (str): The name of the tiktoken encoding.
+        num_threads (int): The number of threads used by tiktoken to encode batches of texts.
     """
-    def __init__(self, encoding: str = "cl100k_base"):
+    DEFAULT_NUM_THREADS = 8
+
+    def __init__(self, encoding: str = "cl100k_base", num_threads: int = DEFAULT_NUM_THREADS):
         super().__init__()
+        self.encoding = encoding
+        self.num_threads = num_threads
+        self.tokenizer = self._load_tokenizer(encoding)
+
+    @staticmethod
+    def _load_tokenizer(encoding: str):
         tiktoken = import_dependencies(extra="tiktoken", package_name="tiktoken")
-        self.tokenizer = tiktoken.get_encoding(encoding)
+        return tiktoken.get_encoding(encoding)
+
+    def __getstate__(self):
+        # The tokenizer is rebuilt from the encoding name, so it is never pickled
+        state = self.__dict__.copy()
+        del state["tokenizer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.tokenizer = self._load_tokenizer(self.encoding)
 
     def estimate_size(self, text: str) -> int:
         """
@@ -21,4 +44,36 @@ class OpenAISizeEstimator(BaseSizeEstimator):
         Returns:
             int: The estimated size of the text in tokens.
         """
-        return len(self.tokenizer.encode(text))
\ No newline at end of file
+        return len(self.tokenizer.encode(text))
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, encoding them in a single multi-threaded batch.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The estimated size of each text in tokens, in the same order.
+        """
+        if not texts:
+            return []
+        return [len(tokens) for tokens in self.tokenizer.encode_batch(texts, num_threads=self.num_threads)]
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Tokenize the text and return the character offsets of each token.
+        A token ends where the next one starts. Tokens holding only some bytes of a multi-byte character
+        (e.g. CJK, emoji) start where the next one starts: they are given the width of that character,
+        so that they are counted in the parts containing it.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token.
+        """
+        tokens = self.tokenizer.encode(text)
+        _, starts = self.tokenizer.decode_with_offsets(tokens)
+        return [(start, min(max(end, start + 1), len(text)))
+                for start, end in zip(starts, starts[1:] + [len(text)])]
\ No newline at end of file
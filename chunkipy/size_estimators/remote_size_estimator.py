@@ -0,0 +1,367 @@
+import asyncio
+import http.client
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+
+
+class RemoteSizeEstimationError(Exception):
+    pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    # HTTP connection over a UNIX socket
+
+    def __init__(self, unix_socket: str, timeout: float = None):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_socket = unix_socket
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.unix_socket)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _Batch:
+    # Texts of concurrent calls, sent to the tokenizer service in a single request
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.sizes: Optional[List[int]] = None
+        self.error: Optional[BaseException] = None
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class RemoteSizeEstimator(BaseSizeEstimator):
+    """
+    Size estimator asking the sizes to a tokenizer service (e.g. a sidecar shared by all the workers),
+    over HTTP or over a UNIX socket, so that workers do not each hold a copy of the tokenizer.
+
+    The service receives a POST with the JSON body {"texts": [...]} and answers with {"sizes": [...]},
+    as SizeEstimatorServer does. Connections are kept alive and pooled. Concurrent calls (from threads,
+    or from coroutines through aestimate_sizes) are micro-batched: while all the connections are busy,
+    the texts of new calls are gathered and sent in a single request as soon as a connection is free.
+    Failed requests (connection errors, timeouts, 5xx responses) are retried with exponential backoff.
+
+    Args:
+        url (str): The URL of the endpoint, e.g. "http://127.0.0.1:8080/estimate". With unix_socket,
+            only its path is used.
+        unix_socket (str): The path of the UNIX socket the service listens on. If None, the service is reached over TCP.
+        max_connections (int): The maximum number of concurrent requests, i.e. of pooled connections.
+        max_batch_size (int): The maximum number of texts sent in a single request.
+        batch_wait (float): The time, in seconds, a request waits for more texts before being sent.
+            With the default 0, texts are only gathered while all the connections are busy.
+        timeout (float): The timeout of each request, in seconds.
+        retries (int): The number of times a failed request is retried.
+        backoff (float): The delay before the first retry, in seconds, doubled at each retry.
+    """
+    DEFAULT_MAX_CONNECTIONS = 4
+    DEFAULT_MAX_BATCH_SIZE = 256
+
+    def __init__(self, url: str = "http://127.0.0.1:8080/estimate", unix_socket: str = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 batch_wait: float = 0.0, timeout: float = 10.0, retries: int = 2, backoff: float = 0.05):
+        super().__init__()
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be a positive integer. Current value: {max_connections}")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer. Current value: {max_batch_size}")
+        if retries < 0:
+            raise ValueError(f"retries must be a non-negative integer. Current value: {retries}")
+        split_url = urlsplit(url)
+        if split_url.scheme != "http" or (not split_url.hostname and unix_socket is None):
+            raise ValueError(f"url must be an http URL. Current value: {url}")
+        self.url = url
+        self.unix_socket = unix_socket
+        self.max_connections = max_connections
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._host = split_url.hostname
+        self._port = split_url.port
+        self._path = split_url.path or "/"
+        self._init_pool()
+
+    def _init_pool(self):
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._open_batch: Optional[_Batch] = None
+        self.requests = 0
+
+    def estimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text with the tokenizer service.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The size of the text, as computed by the service.
+        """
+        return self.estimate_sizes([text])[0]
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts with the tokenizer service,
+        together with the texts of the concurrent calls.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The size of each text, in the same order.
+        """
+        if len(texts) > self.max_batch_size:
+            return [size for i in range(0, len(texts), self.max_batch_size)
+                    for size in self.estimate_sizes(texts[i:i + self.max_batch_size])]
+        if not texts:
+            return []
+        with self._lock:
+            # The first call of a batch sends it, the next ones wait for its result
+            batch = self._open_batch
+            is_leader = batch is None or len(batch.texts) + len(texts) > self.max_batch_size
+            if is_leader:
+                batch = self._open_batch = _Batch()
+            offset = len(batch.texts)
+            batch.texts.extend(texts)
+            if len(batch.texts) >= self.max_batch_size:
+                self._close_batch(batch)
+
+        if is_leader:
+            self._send_batch(batch)
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.sizes[offset:offset + len(texts)]
+
+    async def aestimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts with the tokenizer service, from a coroutine.
+        The request runs in a thread, so the calls of concurrent coroutines are micro-batched too.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The size of each text, in the same order.
+        """
+        return await asyncio.to_thread(self.estimate_sizes, texts)
+
+    def close(self):
+        """Closes the idle pooled connections."""
+        with self._lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for connection in connections:
+            connection.close()
+
+    def _close_batch(self, batch: _Batch):
+        # Called with the lock held: no more texts are added to the batch
+        if self._open_batch is batch:
+            self._open_batch = None
+        batch.full.set()
+
+    def _send_batch(self, batch: _Batch):
+        try:
+            # Texts of other calls keep being gathered while waiting for a free connection
+            with self._slots:
+                if self.batch_wait > 0:
+                    batch.full.wait(self.batch_wait)
+                with self._lock:
+                    self._close_batch(batch)
+                batch.sizes = self._post(batch.texts)
+        except BaseException as e:
+            batch.error = e
+        finally:
+            with self._lock:
+                self._close_batch(batch)
+            batch.done.set()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.unix_socket is not None:
+            return _UnixHTTPConnection(self.unix_socket, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _post(self, texts: List[str]) -> List[int]:
+        # Send one request, on an idle connection if any, retrying on connection errors and server errors
+        body = json.dumps({"texts": texts}).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            with self._lock:
+                connection = self._idle_connections.pop() if self._idle_connections else None
+            connection = connection or self._new_connection()
+            try:
+                connection.request("POST", self._path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                last_error = e
+                logging.debug(f"Request to {self.url} failed (attempt {attempt + 1}): {e!r}")
+                continue
+
+            with self._lock:
+                self.requests += 1
+                if not response.will_close:
+                    self._idle_connections.append(connection)
+            if response.will_close:
+                connection.close()
+            if response.status >= 500:
+                last_error = RemoteSizeEstimationError(f"{self.url} answered {response.status}: {data[:200]!r}")
+                logging.debug(f"Request to {self.url} failed (attempt {attempt + 1}): {last_error}")
+                continue
+            if response.status != 200:
+                raise RemoteSizeEstimationError(f"{self.url} answered {response.status}: {data[:200]!r}")
+            sizes = json.loads(data)["sizes"]
+            if len(sizes) != len(texts):
+                raise RemoteSizeEstimationError(f"{self.url} returned {len(sizes)} sizes for {len(texts)} texts.")
+            return sizes
+
+        raise RemoteSizeEstimationError(f"Request to {self.url} failed after {self.retries + 1} attempts.") \
+            from last_error
+
+    def __getstate__(self):
+        # Locks and connections cannot be pickled: the pool is rebuilt empty
+        state = self.__dict__.copy()
+        for name in ("_lock", "_slots", "_idle_connections", "_open_batch"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_pool()
+
+
+class _SizeEstimatorRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    wbufsize = -1  # headers and body are sent together, avoiding Nagle's delays
+
+    def do_POST(self):
+        size_estimator_server = self.server.size_estimator_server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != size_estimator_server.path:
+            return self._send(404, {"error": f"Unknown path {self.path}"})
+        try:
+            texts = json.loads(body)["texts"]
+        except (ValueError, KeyError, TypeError) as e:
+            return self._send(400, {"error": f"Invalid request: {e}"})
+        try:
+            sizes = size_estimator_server.size_estimator.estimate_sizes(texts)
+        except Exception as e:
+            return self._send(500, {"error": repr(e)})
+        size_estimator_server.requests += 1
+        self._send(200, {"sizes": sizes})
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # UNIX socket clients have no address
+        logging.debug("SizeEstimatorServer: " + format % args)
+
+
+class _ThreadingTCPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # e.g. clients closing the connection on timeout
+        logging.debug("SizeEstimatorServer: error while handling a request", exc_info=True)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    handle_error = _ThreadingTCPHTTPServer.handle_error
+
+
+class SizeEstimatorServer:
+    """
+    Reference tokenizer service for RemoteSizeEstimator: an HTTP server, over TCP or over a UNIX socket,
+    estimating the sizes of the received texts with a local size estimator.
+
+    Args:
+        size_estimator (BaseSizeEstimator): The size estimator computing the sizes.
+        host (str): The host to listen on, when unix_socket is None.
+        port (int): The port to listen on, when unix_socket is None. If 0, a free port is chosen.
+        unix_socket (str): The path of the UNIX socket to listen on.
+        path (str): The path of the endpoint.
+
+    Attributes:
+        requests (int): The number of requests served.
+    """
+
+    def __init__(self, size_estimator: BaseSizeEstimator, host: str = "127.0.0.1", port: int = 0,
+                 unix_socket: str = None, path: str = "/estimate"):
+        self.size_estimator = size_estimator
+        self.unix_socket = unix_socket
+        self.path = path
+        self.requests = 0
+        if unix_socket is not None:
+            self._server = _ThreadingUnixHTTPServer(unix_socket, _SizeEstimatorRequestHandler)
+        else:
+            self._server = _ThreadingTCPHTTPServer((host, port), _SizeEstimatorRequestHandler)
+        self._server.size_estimator_server = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the endpoint, to be used together with unix_socket when listening on a UNIX socket."""
+        if self.unix_socket is not None:
+            return f"http://localhost{self.path}"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> "SizeEstimatorServer":
+        """Serves requests in a background thread.
+
+        Returns:
+            SizeEstimatorServer: This server.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serves requests until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stops serving requests and releases the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if self.unix_socket is not None and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+
+    def __enter__(self) -> "SizeEstimatorServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,279 @@
+import math
+import re
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+
+
+_CJK_PATTERN = re.compile("[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")  # kana, CJK ideographs, hangul
+_NON_LATIN_PATTERN = re.compile("[^\u0000-\u024f]")  # beyond Latin Extended-B
+
+
+def script_key(text: str) -> str:
+    """Returns a coarse script class of the text, as a cheap stand-in of its language.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: "ascii", "latin", "cjk" or "other".
+    """
+    if text.isascii():
+        return "ascii"
+    if _CJK_PATTERN.search(text):
+        return "cjk"
+    if _NON_LATIN_PATTERN.search(text):
+        return "other"
+    return "latin"
+
+
+class PointEstimate(int):
+    """A size estimated by a TieredSizeEstimator from the sizes per character, rather than exactly.
+
+    It is an int, so it can be used as any size, which also carries the upper bound of the size, as bounded when
+    it was estimated: later calibrations change the bounds, not the guarantee given at estimation time.
+
+    :param size: The point estimate of the size.
+    :param upper_bound: The upper bound of the size, within chunk_size.
+    """
+
+    def __new__(cls, size: int, upper_bound: int):
+        point_estimate = super().__new__(cls, size)
+        point_estimate.upper_bound = upper_bound
+        return point_estimate
+
+    def __reduce__(self):
+        return self.__class__, (int(self), self.upper_bound)
+
+
+class _Calibration:
+    # Lowest, highest and mean sizes per character observed with the exact size estimator
+
+    __slots__ = ("samples", "min_ratio", "max_ratio", "chars", "size")
+
+    def __init__(self):
+        self.samples = 0
+        self.min_ratio = math.inf
+        self.max_ratio = 0.0
+        self.chars = 0
+        self.size = 0
+
+    def observe(self, chars: int, size: int):
+        ratio = size / chars
+        self.samples += 1
+        self.min_ratio = min(self.min_ratio, ratio)
+        self.max_ratio = max(self.max_ratio, ratio)
+        self.chars += chars
+        self.size += size
+
+    @property
+    def mean_ratio(self) -> float:
+        return self.size / self.chars
+
+
+class TieredSizeEstimator(BaseSizeEstimator):
+    """
+    Size estimator that only runs an expensive exact size estimator (e.g. a tokenizer) on the texts
+    whose size is close to the chunk size.
+
+    The size of each text is first bounded from its number of characters, with the lowest and highest
+    sizes per character observed so far with the exact size estimator, for the class of the text
+    (by default its script, see script_key), widened by margin and slack. Then:
+
+    - texts surely within chunk_size get a point estimate, from the mean size per character observed, as a
+      PointEstimate carrying the upper bound of the size;
+    - texts surely above chunk_size get their lower bound, which still exceeds chunk_size, so they are split further;
+    - only the texts whose bounds straddle chunk_size are estimated exactly.
+
+    Point estimates may be a little off, so the TextChunker packs chunks with them only while the upper bounds of
+    the text parts of a chunk surely fit in chunk_size. When they come near it, the text parts of the chunk are
+    estimated exactly (see resolve_sizes), so chunks are filled about as with the exact size estimator, and a chunk
+    found above chunk_size is cut where it fits.
+
+    The bounds are learned: until min_samples texts of a class have been estimated exactly, the texts of the class
+    are estimated exactly, and every exact estimation widens the bounds it falls outside of. Texts can also be
+    estimated ahead of time with calibrate. The guarantee holds as long as the texts are as tokenizable as the
+    observed ones: a text whose size exceeds its upper bound may be left unsplit, and make a chunk of its own
+    above chunk_size. Widen margin, or raise min_samples, for heterogeneous corpora.
+    It must be used by a TextChunker with the same chunk_size.
+
+    Args:
+        exact (BaseSizeEstimator): The exact size estimator.
+        chunk_size (int): The chunk size of the TextChunker using this size estimator.
+        margin (float): The relative margin added to the observed sizes per character.
+        slack (int): The absolute margin added to the bounds, dominant for short texts.
+        min_samples (int): The number of exact estimations of a class of texts before its bounds are used.
+        min_chars (int): The minimum length of the texts whose exact estimation is used for calibration.
+        key (Callable[[str], Hashable]): Returns the class of a text, e.g. its script or its language.
+
+    Attributes:
+        exact_estimations (int): The number of texts estimated exactly.
+        approximate_estimations (int): The number of texts estimated from their bounds.
+        resolutions (int): The number of times the text parts of a chunk near chunk_size were estimated exactly.
+    """
+
+    def __init__(self, exact: BaseSizeEstimator, chunk_size: int, margin: float = 0.1, slack: int = 2,
+                 min_samples: int = 20, min_chars: int = 20, key: Callable[[str], Hashable] = script_key):
+        super().__init__()
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer. Current value: {chunk_size}")
+        if margin < 0:
+            raise ValueError(f"margin must be non-negative. Current value: {margin}")
+        self.exact = exact
+        self.chunk_size = chunk_size
+        self.margin = margin
+        self.slack = slack
+        self.min_samples = min_samples
+        self.min_chars = min_chars
+        self.key = key
+        self._calibrations: Dict[Hashable, _Calibration] = dict()
+        self.exact_estimations = 0
+        self.approximate_estimations = 0
+        self.resolutions = 0
+
+    def calibrate(self, texts: List[str]):
+        """
+        Estimate the given texts exactly to learn the bounds of their classes, e.g. with a sample of the corpus.
+
+        Args:
+            texts (List[str]): Representative texts, ideally of about the chunk size.
+        """
+        self._observe(texts, self.exact.estimate_sizes(texts))
+
+    def bounds(self, text: str) -> Optional[Tuple[int, int]]:
+        """
+        Bound the size of the text from its number of characters.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            Optional[Tuple[int, int]]: The lower and upper bounds of the size, or None if the class of the text
+                is not calibrated yet.
+        """
+        calibration = self._calibrations.get(self.key(text))
+        if calibration is None or calibration.samples < self.min_samples:
+            return None
+        chars = len(text)
+        lower = max(math.floor(calibration.min_ratio * (1 - self.margin) * chars) - self.slack, 0)
+        upper = math.ceil(calibration.max_ratio * (1 + self.margin) * chars) + self.slack
+        return lower, upper
+
+    def estimate_size(self, text: str) -> int:
+        """
+        Estimate the size of the given text, exactly only if it may be close to the chunk size.
+
+        Args:
+            text (str): The text to estimate the size of.
+
+        Returns:
+            int: The exact size, or a PointEstimate if surely within chunk_size, or a lower bound if surely above.
+        """
+        return self.estimate_sizes([text])[0]
+
+    def estimate_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate the size of each of the given texts, the ones that may be close to the chunk size
+        being estimated exactly in a single batch.
+
+        Args:
+            texts (List[str]): The texts to estimate the size of.
+
+        Returns:
+            List[int]: The size of each text (see estimate_size), in the same order.
+        """
+        sizes = [0] * len(texts)
+        # The classes of texts not calibrated yet are calibrated on a sample of the batch
+        sample_sizes = self._calibrate_on_sample(texts)
+        exact_idxs = []
+        for i, text in enumerate(texts):
+            text_bounds = self.bounds(text)
+            if i in sample_sizes:
+                sizes[i] = sample_sizes[i]
+            elif text_bounds is None:
+                exact_idxs.append(i)
+            elif text_bounds[1] <= self.chunk_size:
+                sizes[i] = PointEstimate(self._point_estimate(text, text_bounds), text_bounds[1])
+            elif text_bounds[0] > self.chunk_size:
+                sizes[i] = text_bounds[0]
+            else:
+                exact_idxs.append(i)
+
+        self.approximate_estimations += len(texts) - len(exact_idxs) - len(sample_sizes)
+        if exact_idxs:
+            exact_texts = [texts[i] for i in exact_idxs]
+            exact_sizes = self.exact.estimate_sizes(exact_texts)
+            self._observe(exact_texts, exact_sizes)
+            for i, size in zip(exact_idxs, exact_sizes):
+                sizes[i] = size
+        return sizes
+
+    def resolve_sizes(self, texts: List[str]) -> List[int]:
+        """
+        Estimate exactly the texts of a chunk whose upper bounds come near chunk_size, as the TextChunker does.
+
+        Args:
+            texts (List[str]): The texts whose sizes are point estimates.
+
+        Returns:
+            List[int]: The exact size of each text, in the same order.
+        """
+        self.resolutions += 1
+        sizes = self.exact.estimate_sizes(texts)
+        self._observe(texts, sizes)
+        return sizes
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the token offsets computed by the exact size estimator.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each token.
+        """
+        return self.exact.token_spans(text)
+
+    @property
+    def supports_token_spans(self) -> bool:
+        """Whether the exact size estimator implements token_spans."""
+        return self.exact.supports_token_spans
+
+    def _point_estimate(self, text: str, text_bounds: Tuple[int, int]) -> int:
+        calibration = self._calibrations[self.key(text)]
+        return min(max(round(calibration.mean_ratio * len(text)), text_bounds[0]), text_bounds[1])
+
+    def _calibrate_on_sample(self, texts: List[str]) -> Dict[int, int]:
+        # Estimate exactly the missing samples of each class, evenly spread over the batch,
+        # and return the sizes of the sampled texts by index
+        idxs_by_key: Dict[Hashable, List[int]] = dict()
+        for i, text in enumerate(texts):
+            if len(text) >= self.min_chars:
+                idxs_by_key.setdefault(self.key(text), []).append(i)
+
+        sample_idxs = []
+        for key, idxs in idxs_by_key.items():
+            calibration = self._calibrations.get(key)
+            missing_samples = self.min_samples - (calibration.samples if calibration is not None else 0)
+            if missing_samples <= 0:
+                continue
+            if missing_samples >= len(idxs):
+                sample_idxs.extend(idxs)
+            else:
+                stride = len(idxs) / missing_samples
+                sample_idxs.extend(idxs[int(j * stride)] for j in range(missing_samples))
+
+        if not sample_idxs:
+            return dict()
+        sample_texts = [texts[i] for i in sample_idxs]
+        sample_sizes = self.exact.estimate_sizes(sample_texts)
+        self._observe(sample_texts, sample_sizes)
+        return dict(zip(sample_idxs, sample_sizes))
+
+    def _observe(self, texts: List[str], sizes: List[int]):
+        self.exact_estimations += len(texts)
+        for text, size in zip(texts, sizes):
+            if len(text) >= self.min_chars:
+                self._calibrations.setdefault(self.key(text), _Calibration()).observe(len(text), size)
+
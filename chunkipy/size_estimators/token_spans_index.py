@@ -0,0 +1,56 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+
+class TokenSpansIndex:
+    """
+    Index over the character spans of the tokens of a text, tokenized once.
+
+    It derives the size of any part of the text from the token offsets, instead of tokenizing the part again.
+    The tokens within a part are counted once each. A token that crosses the boundary of a part (e.g. a split point
+    in the middle of a token) is counted in each part it overlaps, but re-tokenizing its piece on its own can give
+    several tokens: with the text, the piece is counted as one token per UTF-8 byte, which byte-level tokenizers
+    cannot exceed (and other tokenizers give at most one token per character). Without the text, each piece is
+    counted as a single token, which may underestimate the size of the part.
+
+    Args:
+        token_spans (List[Tuple[int, int]]): The (start, end) character offsets of each token, in order.
+        text (Optional[str]): The tokenized text, to count the pieces of the tokens crossing the boundaries of a part.
+    """
+
+    def __init__(self, token_spans: List[Tuple[int, int]], text: Optional[str] = None):
+        self.text = text
+        self.starts = [start for start, _ in token_spans]
+        # Zero-width tokens (e.g. holding part of the bytes of a character) are counted in the part of that character
+        self.ends = [max(end, start + 1) for start, end in token_spans]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def count(self, start: int, end: int) -> int:
+        """
+        Count the tokens overlapping the text between the start and end offsets.
+
+        Args:
+            start (int): The offset where the part starts.
+            end (int): The offset where the part ends.
+
+        Returns:
+            int: The number of tokens overlapping text[start:end], the pieces of the tokens crossing its boundaries
+                being counted per UTF-8 byte if the text is known.
+        """
+        if end <= start:
+            return 0
+        # tokens starting before end, minus tokens ending before (or at) start
+        first, last = bisect_right(self.ends, start), bisect_left(self.starts, end)
+        count = last - first
+        if self.text is not None and count > 0:
+            if self.starts[first] < start or self.ends[first] > end:
+                count += self._piece_size(start, min(self.ends[first], end)) - 1
+            if last - 1 > first and self.ends[last - 1] > end:
+                count += self._piece_size(self.starts[last - 1], end) - 1
+        return count
+
+    def _piece_size(self, start: int, end: int) -> int:
+        # Upper bound of the tokens of a piece of a token, re-tokenized on its own
+        return max(len(self.text[start:end].encode("utf-8")), 1)
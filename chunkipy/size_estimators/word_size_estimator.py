@@ -1,6 +1,11 @@
+import re
+from typing import List, Tuple
 from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
 
 
+WORD_PATTERN = re.compile(r"\S+")
+
+
 class WordSizeEstimator(BaseSizeEstimator):
     """
     Size estimator that counts the number of words in the text.
@@ -16,4 +21,16 @@ class WordSizeEstimator(BaseSizeEstimator):
         Returns:
             int: The estimated size of the text in words.
         """
-        return len([t for t in text.split() if t != ' ' and t != '']) 
\ No newline at end of file
+        return len([t for t in text.split() if t != ' ' and t != ''])
+
+    def token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the character offsets of each word in the text.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) character offsets of each word.
+        """
+        return [match.span() for match in WORD_PATTERN.finditer(text)] 
\ No newline at end of file
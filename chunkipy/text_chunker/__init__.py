@@ -1,4 +1,7 @@
-from chunkipy.text_chunker.text_chunker import TextChunker  
-from chunkipy.text_chunker.data_models import TextPart, Chunk, Chunks, Overlap
+from chunkipy.text_chunker.text_chunker import TextChunker, TextChunkerConfig
+from chunkipy.text_chunker.data_models import TextPart, Chunk, Chunks, Overlap, FrozenChunk
+from chunkipy.text_chunker.chunking_stats import ChunkingStats
+from chunkipy.text_chunker.chunk_table import ChunkTable, ChunkView
 
-__all__ = ["TextChunker", "TextPart", "Chunk", "Chunks", "Overlap"]
\ No newline at end of file
+__all__ = ["TextChunker", "TextChunkerConfig", "TextPart", "Chunk", "Chunks", "Overlap", "FrozenChunk", "ChunkingStats",
+           "ChunkTable", "ChunkView"]
\ No newline at end of file
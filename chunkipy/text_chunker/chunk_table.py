@@ -0,0 +1,276 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+from chunkipy.text_chunker.data_models import Chunk, Chunks, Overlap, TextPart, TextParts
+
+
+class ChunkView:
+    """A lightweight, read-only view of a chunk of a ChunkTable, with the API of Chunk.
+
+    Text parts are materialized as TextPart objects only when overlap, content or text_parts are accessed.
+
+    :param table: The ChunkTable the chunk belongs to.
+    :param index: The index of the chunk in the table.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "ChunkTable", index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def overlap_range(self) -> range:
+        """Returns the indexes of the text parts of the overlap, in the table.
+
+        Returns:
+            range: The indexes of the overlapping text parts.
+        """
+        return range(self.table.overlap_starts[self.index], self.table.content_starts[self.index])
+
+    @property
+    def content_range(self) -> range:
+        """Returns the indexes of the text parts of the content, in the table.
+
+        Returns:
+            range: The indexes of the content text parts.
+        """
+        return range(self.table.content_starts[self.index], self.table.content_starts[self.index + 1])
+
+    @property
+    def overlap(self) -> Overlap:
+        return Overlap(self.table.text_part(i) for i in self.overlap_range)
+
+    @property
+    def content(self) -> TextParts:
+        return TextParts(self.table.text_part(i) for i in self.content_range)
+
+    @property
+    def text_parts(self) -> TextParts:
+        return TextParts(self.table.text_part(i) for i in self._range)
+
+    @property
+    def size(self) -> int:
+        return self.table.range_size(self._range)
+
+    @property
+    def text(self) -> str:
+        return self.table.range_text(self._range)
+
+    @property
+    def start(self) -> Optional[int]:
+        text_parts_range = self._range
+        return self.table.part_starts[text_parts_range.start] if text_parts_range else None
+
+    @property
+    def end(self) -> Optional[int]:
+        text_parts_range = self._range
+        return self.table.part_ends[text_parts_range.stop - 1] if text_parts_range else None
+
+    @property
+    def _range(self) -> range:
+        return range(self.table.overlap_starts[self.index], self.table.content_starts[self.index + 1])
+
+    def to_chunk(self) -> Chunk:
+        """Returns the chunk as a Chunk, with span TextParts over the source of the table.
+
+        Returns:
+            Chunk: The chunk.
+        """
+        return Chunk(overlap=self.overlap, content=self.content)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ChunkView, Chunk)):
+            return ((tuple(self.overlap), tuple(self.content))
+                    == (tuple(other.overlap), tuple(other.content)))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ChunkView(index={self.index}, size={self.size}, text={self.text!r})"
+
+
+class ChunkTable:
+    """A compact, columnar representation of the chunks of a text, for holding huge numbers of chunks in memory.
+
+    The text parts are stored once, as arrays of offsets into a single source buffer and of cumulative sizes,
+    and each chunk as the index of its first overlapping and of its first content text part: the overlap of
+    a chunk is a suffix of the content of the previous one, as built by TextChunker. Chunks are accessed
+    through ChunkView objects, created on demand, which have the API of Chunk.
+
+    :param source: The text the offsets refer to.
+    :param part_starts: The offset where each text part starts.
+    :param part_ends: The offset where each text part ends.
+    :param size_prefix: The cumulative sizes of the text parts: the size of text part i is size_prefix[i + 1] - size_prefix[i].
+    :param overlap_starts: The index of the first overlapping text part of each chunk.
+    :param content_starts: The index of the first content text part of each chunk, followed by the number of text parts.
+    """
+
+    TYPECODE = "q"
+
+    def __init__(self, source: str, part_starts: array, part_ends: array, size_prefix: array,
+                 overlap_starts: array, content_starts: array):
+        if not (len(part_starts) == len(part_ends) == len(size_prefix) - 1
+                and len(overlap_starts) == len(content_starts) - 1):
+            raise ValueError("Inconsistent column lengths.")
+        self.source = source
+        self.part_starts = part_starts
+        self.part_ends = part_ends
+        self.size_prefix = size_prefix
+        self.overlap_starts = overlap_starts
+        self.content_starts = content_starts
+        # When the text parts cover the source without gaps, the text of any chunk is a single slice
+        self.contiguous = all(part_ends[i] == part_starts[i + 1] for i in range(len(part_starts) - 1))
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Chunk], source: str = None) -> "ChunkTable":
+        """Builds a ChunkTable from chunks, e.g. the ones of TextChunker.chunk or TextChunker.iter_chunks.
+
+        The chunks are consumed one at a time, so an iterator of chunks is never held in memory at once.
+        If the text parts are spans of a source text, their offsets are kept; otherwise (e.g. chunks of
+        chunk_stream) their texts are concatenated into a new source buffer and the offsets refer to it.
+
+        Args:
+            chunks (Iterable[Chunk]): The chunks, where the overlap of each chunk is a suffix of the content of the previous one.
+            source (str): The source text of the text parts. If None, the source of the first text part.
+
+        Returns:
+            ChunkTable: The table of the chunks.
+        """
+        typecode = cls.TYPECODE
+        part_starts, part_ends = array(typecode), array(typecode)
+        size_prefix = array(typecode, [0])
+        overlap_starts, content_starts = array(typecode), array(typecode)
+        buffer: Optional[List[str]] = None  # texts of the text parts, when they are not spans of a source
+        buffer_length = 0
+        prev_content: List[TextPart] = []
+
+        for chunk in chunks:
+            num_text_parts = len(part_starts)
+            overlap = list(chunk.overlap)
+            if overlap != prev_content[len(prev_content) - len(overlap):] or len(overlap) > len(prev_content):
+                raise ValueError(f"The overlap of chunk {len(content_starts)} is not a suffix "
+                                 f"of the content of the previous chunk.")
+            overlap_starts.append(num_text_parts - len(overlap))
+            content_starts.append(num_text_parts)
+
+            for text_part in chunk.content:
+                if source is None and buffer is None:
+                    if text_part.source is not None:
+                        source = text_part.source
+                    else:
+                        buffer = []
+                if buffer is None:
+                    if text_part.source is not source:
+                        raise ValueError("All the text parts must be spans of the same source text.")
+                    part_starts.append(text_part.start)
+                    part_ends.append(text_part.end)
+                else:
+                    part_starts.append(buffer_length)
+                    buffer_length += len(text_part.text)
+                    part_ends.append(buffer_length)
+                    buffer.append(text_part.text)
+                size_prefix.append(size_prefix[-1] + text_part.size)
+            prev_content = list(chunk.content)
+
+        content_starts.append(len(part_starts))
+        if buffer is not None:
+            source = "".join(buffer)
+        return cls(source if source is not None else "", part_starts, part_ends, size_prefix,
+                   overlap_starts, content_starts)
+
+    def to_chunks(self) -> Chunks:
+        """Converts the table back to Chunks, whose text parts are spans of the source of the table.
+
+        Returns:
+            Chunks: The chunks.
+        """
+        text_parts = [self.text_part(i) for i in range(len(self.part_starts))]
+        return Chunks(Chunk(overlap=Overlap(text_parts[self.overlap_starts[i]:self.content_starts[i]]),
+                            content=TextParts(text_parts[self.content_starts[i]:self.content_starts[i + 1]]))
+                      for i in range(len(self)))
+
+    def text_part(self, index: int) -> TextPart:
+        """Materializes a text part of the table.
+
+        Args:
+            index (int): The index of the text part.
+
+        Returns:
+            TextPart: The text part, as a span of the source of the table.
+        """
+        return TextPart(size=self.size_prefix[index + 1] - self.size_prefix[index],
+                        start=self.part_starts[index], end=self.part_ends[index], source=self.source)
+
+    def range_size(self, text_parts_range: range) -> int:
+        """Returns the total size of a range of text parts, in O(1).
+
+        Args:
+            text_parts_range (range): The indexes of the text parts.
+
+        Returns:
+            int: The sum of their sizes.
+        """
+        return self.size_prefix[text_parts_range.stop] - self.size_prefix[text_parts_range.start]
+
+    def range_text(self, text_parts_range: range) -> str:
+        """Returns the concatenated text of a range of text parts.
+
+        Args:
+            text_parts_range (range): The indexes of the text parts.
+
+        Returns:
+            str: Their text.
+        """
+        if not text_parts_range:
+            return ""
+        if self.contiguous:
+            return self.source[self.part_starts[text_parts_range.start]:self.part_ends[text_parts_range.stop - 1]]
+        return "".join(self.source[self.part_starts[i]:self.part_ends[i]] for i in text_parts_range)
+
+    def get_all_text(self) -> List[str]:
+        """Returns the full text of each chunk.
+
+        Returns:
+            List[str]: The text of each chunk.
+        """
+        return [chunk.text for chunk in self]
+
+    def get_all_text_parts(self) -> List[TextParts]:
+        """Returns the text parts of each chunk.
+
+        Returns:
+            List[TextParts]: The text parts of each chunk.
+        """
+        return [chunk.text_parts for chunk in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the memory taken by the columns, in bytes (the source text excluded).
+
+        Returns:
+            int: The size of the arrays.
+        """
+        return sum(column.itemsize * len(column) for column in (
+            self.part_starts, self.part_ends, self.size_prefix, self.overlap_starts, self.content_starts))
+
+    def __len__(self) -> int:
+        return len(self.overlap_starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ChunkView, List[ChunkView]]:
+        if isinstance(index, slice):
+            return [ChunkView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ChunkTable index out of range")
+        return ChunkView(self, index)
+
+    def __iter__(self) -> Iterator[ChunkView]:
+        return (ChunkView(self, i) for i in range(len(self)))
+
+    def __reduce__(self):
+        return self.__class__, (self.source, self.part_starts, self.part_ends, self.size_prefix,
+                                self.overlap_starts, self.content_starts)
+
+    def __repr__(self) -> str:
+        return f"ChunkTable(chunks={len(self)}, text_parts={len(self.part_starts)}, nbytes={self.nbytes})"
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+
+@dataclass
+class ChunkingStats:
+    """Statistics of the chunking of a text, collected by TextChunker.chunk_with_stats and sent to its observers.
+
+    :param chunk_size: The chunk size of the TextChunker.
+    :param text_length: The number of characters of the text.
+    :param splitter_seconds: The time spent in each text splitter, by level (index in TextChunker.text_splitters).
+    :param splitter_calls: The number of calls of each text splitter, by level.
+    :param estimate_calls: The number of calls of the size estimator (each one estimates a batch of text parts,
+        or tokenizes the whole text with tokenize_once).
+    :param estimated_texts: The number of texts estimated by the size estimator.
+    :param estimate_seconds: The time spent in the size estimator.
+    :param index_lookups: With tokenize_once, the number of batches of text parts sized from the token offsets.
+    :param index_lookup_seconds: The time spent sizing text parts from the token offsets.
+    :param max_depth: The deepest level of text splitters used, 0 if the first text splitter was enough.
+    :param resplit_parts: The number of text parts exceeding the chunk size, which were split again.
+    :param text_parts: The number of text parts the chunks are made of.
+    :param chunks: The number of chunks.
+    :param total_seconds: The total time of the chunking.
+    :param fill_ratio: The mean size of the chunks (overlap included) over the chunk size.
+    """
+    chunk_size: int
+    text_length: int = 0
+    splitter_seconds: List[float] = field(default_factory=list)
+    splitter_calls: List[int] = field(default_factory=list)
+    estimate_calls: int = 0
+    estimated_texts: int = 0
+    estimate_seconds: float = 0.0
+    index_lookups: int = 0
+    index_lookup_seconds: float = 0.0
+    max_depth: int = 0
+    resplit_parts: int = 0
+    text_parts: int = 0
+    chunks: int = 0
+    total_seconds: float = 0.0
+    fill_ratio: float = 0.0
+
+    @property
+    def split_seconds(self) -> float:
+        """Returns the time spent in all the text splitters.
+
+        Returns:
+            float: The sum of splitter_seconds.
+        """
+        return sum(self.splitter_seconds)
+
+    @property
+    def build_seconds(self) -> float:
+        """Returns the time spent outside of text splitters, size estimator and token index, i.e. chunk building.
+
+        Returns:
+            float: The total time minus the splitting, estimation and index lookup times.
+        """
+        return max(self.total_seconds - self.split_seconds - self.estimate_seconds - self.index_lookup_seconds, 0.0)
+
+
+ChunkingObserver = Callable[[ChunkingStats], None]
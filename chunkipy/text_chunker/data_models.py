@@ -1,43 +1,109 @@
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
+from functools import cached_property
 from itertools import chain
-from typing import Deque, List
+from typing import Deque, Iterable, List, Optional, Tuple
 
-@dataclass
 class TextPart:
     """Represents a fragment or segment of a complete text, along with its character size.
 
+    A TextPart is either a span, i.e. a (start, end) range into a shared source text, whose text is only
+    materialized on demand, or it holds its own text (with optional offsets).
+
     :param size: The size of the text based on the SizeEstimator used.
-    :param text: The text of the segment.
+    :param text: The text of the segment. If None, it is sliced from source on demand.
+    :param start: The character offset where the segment starts in the source text, if known.
+    :param end: The character offset where the segment ends in the source text, if known.
+    :param source: The source text the segment belongs to, shared among all the spans of a document.
     """
-    size: int
-    text: str
+
+    __slots__ = ("size", "_text", "start", "end", "source")
+
+    def __init__(self, size: int, text: Optional[str] = None,
+                 start: Optional[int] = None, end: Optional[int] = None,
+                 source: Optional[str] = None):
+        if text is None and (source is None or start is None or end is None):
+            raise ValueError("Provide either the text or the source with start and end offsets.")
+        self.size = size
+        self._text = text
+        self.start = start
+        self.end = end
+        self.source = source
+
+    @property
+    def text(self) -> str:
+        """Returns the text of the segment, slicing it from the source if needed.
+
+        Returns:
+            str: The text of the segment.
+        """
+        return self._text if self._text is not None else self.source[self.start:self.end]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TextPart):
+            return NotImplemented
+        return (self.size, self.start, self.end, self.text) == (other.size, other.start, other.end, other.text)
+
+    def __repr__(self) -> str:
+        return f"TextPart(size={self.size}, text={self.text!r}, start={self.start}, end={self.end})"
+
 
 
+def _are_contiguous_spans(text_parts: List[TextPart]) -> bool:
+    source = text_parts[0].source
+    prev_end = text_parts[0].start
+    for text_part in text_parts:
+        if text_part._text is not None or text_part.source is not source or text_part.start != prev_end:
+            return False
+        prev_end = text_part.end
+    return True
+
+
+def _join_text_parts(text_parts: Iterable[TextPart]) -> str:
+    # Contiguous spans of the same source are sliced at once, instead of joining their texts
+    text_parts = list(text_parts)
+    if text_parts and _are_contiguous_spans(text_parts):
+        return text_parts[0].source[text_parts[0].start:text_parts[-1].end]
+    return ''.join(text_part.text for text_part in text_parts)
+
+
+def _total_size(text_parts: Iterable[TextPart]) -> int:
+    return sum(text_part.size for text_part in text_parts)
+
 
 class TextPartsMixin:
-    """A base class with utilities for handling collections of TextPart."""
+    """A base class with utilities for handling collections of TextPart.
+
+    The total size is kept up to date by every mutating method of the collection, so reading it is O(1).
+    """
+
+    _size: int = 0
 
     @property
     def size(self) -> int:
-        """Calculates the total size of all TextPart objects in the collection.
+        """Returns the total size of all TextPart objects in the collection.
         
         Returns:
             int: The total size of all TextPart objects.
         """
-        return sum(text_part.size for text_part in self)
+        return self._size
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
 
     @property
     def text(self) -> str:
         """Concatenates and returns the full text of all TextParts in the collection.
 
+        If the TextParts are contiguous spans of the same source, the text is sliced at once from it.
+
         Returns:
             str: A single string containing the concatenated text of all TextParts.
         """
-        return ''.join(text_part.text for text_part in self)
+        return _join_text_parts(self)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(size={self.size}, elements={list(self)}"
+        return f"{self.__class__.__name__}(size={self.size}, elements={list(self)})"
 
 
 
@@ -47,15 +113,131 @@ class TextParts (TextPartsMixin, List[TextPart]):
     """A list-like collection of TextParts.
     Inherits from list to act as a standard list, and from TextPartsMixin to provide additional methods for aggregated operations (e.g. size, text).
     """
-    pass
+
+    def __init__(self, iterable: Iterable[TextPart] = ()):
+        super().__init__(iterable)
+        self._size = _total_size(self)
+
+    def append(self, text_part: TextPart):
+        super().append(text_part)
+        self._size += text_part.size
+
+    def extend(self, text_parts: Iterable[TextPart]):
+        text_parts = list(text_parts)
+        super().extend(text_parts)
+        self._size += _total_size(text_parts)
+
+    def __iadd__(self, text_parts: Iterable[TextPart]):
+        self.extend(text_parts)
+        return self
+
+    def insert(self, index: int, text_part: TextPart):
+        super().insert(index, text_part)
+        self._size += text_part.size
+
+    def __imul__(self, n: int):
+        super().__imul__(n)
+        self._size = _total_size(self)
+        return self
+
+    def pop(self, index: int = -1) -> TextPart:
+        text_part = super().pop(index)
+        self._size -= text_part.size
+        return text_part
+
+    def remove(self, text_part: TextPart):
+        super().remove(text_part)
+        self._size -= text_part.size
+
+    def clear(self):
+        super().clear()
+        self._size = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._size = _total_size(self)
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._size = _total_size(self)
 
 
 class Overlap (TextPartsMixin, Deque [TextPart]):
     """A deque-like collection of TextParts with utility methods for aggregation.
     Inherits from deque to act as a standard deque, and from TextParts to provide additional methods for aggregated operations (e.g. size, text).
     """
-    pass
 
+    def __init__(self, iterable: Iterable[TextPart] = ()):
+        super().__init__(iterable)
+        self._size = _total_size(self)
+
+    def append(self, text_part: TextPart):
+        super().append(text_part)
+        self._size += text_part.size
+
+    def appendleft(self, text_part: TextPart):
+        super().appendleft(text_part)
+        self._size += text_part.size
+
+    def extend(self, text_parts: Iterable[TextPart]):
+        text_parts = list(text_parts)
+        super().extend(text_parts)
+        self._size += _total_size(text_parts)
+
+    def extendleft(self, text_parts: Iterable[TextPart]):
+        text_parts = list(text_parts)
+        super().extendleft(text_parts)
+        self._size += _total_size(text_parts)
+
+    def insert(self, index: int, text_part: TextPart):
+        super().insert(index, text_part)
+        self._size += text_part.size
+
+    def __iadd__(self, text_parts: Iterable[TextPart]):
+        self.extend(text_parts)
+        return self
+
+    def __imul__(self, n: int):
+        super().__imul__(n)
+        self._size = _total_size(self)
+        return self
+
+    def pop(self) -> TextPart:
+        text_part = super().pop()
+        self._size -= text_part.size
+        return text_part
+
+    def popleft(self) -> TextPart:
+        text_part = super().popleft()
+        self._size -= text_part.size
+        return text_part
+
+    def remove(self, text_part: TextPart):
+        super().remove(text_part)
+        self._size -= text_part.size
+
+    def clear(self):
+        super().clear()
+        self._size = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._size = _total_size(self)
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._size = _total_size(self)
+
+
+class FrozenTextParts (TextPartsMixin, Tuple[TextPart, ...]):
+    """An immutable, tuple-like collection of TextParts, used by FrozenChunk.
+    Inherits from tuple, and from TextPartsMixin to provide additional methods for aggregated operations (e.g. size, text).
+    """
+
+    def __new__(cls, iterable: Iterable[TextPart] = ()):
+        text_parts = super().__new__(cls, iterable)
+        text_parts._size = _total_size(text_parts)
+        return text_parts
 
 
 @dataclass
@@ -71,15 +253,22 @@ class Chunk:
     overlap: Overlap = field(default_factory=Overlap) # Ensure proper initialization
     content: TextParts = field(default_factory=TextParts) # Ensure proper initialization
 
+    def __setattr__(self, name, value):
+        # Keep overlap and content as size-tracking collections, even if plain lists or deques are assigned
+        if name == "overlap" and not isinstance(value, Overlap):
+            value = Overlap(value)
+        elif name == "content" and not isinstance(value, TextParts):
+            value = TextParts(value)
+        super().__setattr__(name, value)
 
     @property
     def size(self) -> int:
-        """Calculates and returns the total size of all TextPart objects within text_parts.
+        """Returns the total size of all TextPart objects within text_parts, in O(1).
         
         Returns:
             int: The total size of all TextPart objects.
         """
-        return self.text_parts.size
+        return self.overlap.size + self.content.size
 
     @property
     def text(self) -> str:
@@ -88,7 +277,7 @@ class Chunk:
         Returns:
             str: The full text of the chunk, concatenated from all text parts.
         """
-        return self.text_parts.text
+        return _join_text_parts(chain(self.overlap, self.content))
     
     @property
     def text_parts(self) -> TextParts:
@@ -99,9 +288,107 @@ class Chunk:
         """
         return TextParts (chain(self.overlap, self.content))
 
+    @property
+    def start(self) -> Optional[int]:
+        """Returns the character offset where the chunk (including its overlap) starts in the source text.
+
+        Returns:
+            Optional[int]: The start offset of the first text part, or None if unknown.
+        """
+        first_text_part = next(chain(self.overlap, self.content), None)
+        return first_text_part.start if first_text_part is not None else None
+
+    @property
+    def end(self) -> Optional[int]:
+        """Returns the character offset where the chunk ends in the source text.
+
+        Returns:
+            Optional[int]: The end offset of the last text part, or None if unknown.
+        """
+        last_text_parts = self.content or self.overlap
+        return last_text_parts[-1].end if last_text_parts else None
+
+    def freeze(self) -> "FrozenChunk":
+        """Returns an immutable copy of the chunk, whose text, size and text parts are computed once.
+
+        Returns:
+            FrozenChunk: The finalized chunk.
+        """
+        return FrozenChunk(overlap=self.overlap, content=self.content)
+
     def __repr__(self) -> str:
         return f"Chunk(size={self.size}, text='{self.text}, overlap={self.overlap}, content={self.content}"
-        
+
+
+class FrozenChunk(Chunk):
+    """An immutable, finalized Chunk, as returned by a TextChunker built with frozen=True.
+
+    Overlap, content and text parts are FrozenTextParts; the size is computed when the chunk is created, and the
+    text on first access, then both are cached. Frozen chunks are hashable, by text and offsets.
+    Use `thaw` to get a mutable Chunk back.
+
+    :param overlap: The overlapping TextParts, from the previous chunk.
+    :param content: The TextParts that make up the chunk.
+    """
+
+    def __init__(self, overlap: Iterable[TextPart] = (), content: Iterable[TextPart] = ()):
+        overlap, content = FrozenTextParts(overlap), FrozenTextParts(content)
+        object.__setattr__(self, "overlap", overlap)
+        object.__setattr__(self, "content", content)
+        object.__setattr__(self, "_text_parts", FrozenTextParts(overlap + content))
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}' of a FrozenChunk")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}' of a FrozenChunk")
+
+    @property
+    def size(self) -> int:
+        return self._text_parts.size
+
+    @cached_property
+    def text(self) -> str:
+        return _join_text_parts(self._text_parts)
+
+    @property
+    def text_parts(self) -> FrozenTextParts:
+        return self._text_parts
+
+    @property
+    def start(self) -> Optional[int]:
+        return self._text_parts[0].start if self._text_parts else None
+
+    @property
+    def end(self) -> Optional[int]:
+        return self._text_parts[-1].end if self._text_parts else None
+
+    def freeze(self) -> "FrozenChunk":
+        return self
+
+    def thaw(self) -> Chunk:
+        """Returns a mutable copy of the chunk.
+
+        Returns:
+            Chunk: The chunk, with an Overlap and a TextParts.
+        """
+        return Chunk(overlap=Overlap(self.overlap), content=TextParts(self.content))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return (self.overlap, self.content) == (tuple(other.overlap), tuple(other.content))
+
+    def __hash__(self) -> int:
+        return hash((self.text, self.start, self.end))
+
+    def __reduce__(self):
+        return self.__class__, (tuple(self.overlap), tuple(self.content))
+
+    def __repr__(self) -> str:
+        return f"FrozenChunk(size={self.size}, text={self.text!r}, overlap={self.overlap}, content={self.content})"
+
+
 
 class Chunks(List[Chunk]):
     """A list-like collection of chunks with utility methods for aggregation.
@@ -125,22 +412,3 @@ class Chunks(List[Chunk]):
             List[str]: A list of strings, where each string is the full text of a chunk.
         """
         return [chunk.text for chunk in self]
-
-
-class Overlap(Deque[TextPart]):
-    """A deque-like collection of TextParts with utility methods for aggregation.
-    Inherits from deque to act as a standard deque, while providing additional
-    methods for aggregated operations (e.g. size).
-    """
-    
-    @property
-    def size(self) -> str:
-        """Calculates and returns the total size of all TextPart objects.
-        
-        Returns:
-            int: The total size of all TextPart objects.
-        """
-        return sum(part.size for part in self) if self else 0
-
-    def __repr__(self) -> str:
-        return f"Overlap(size={self.size}, elements={list(self)})"
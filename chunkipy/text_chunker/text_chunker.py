@@ -1,12 +1,28 @@
+import asyncio
 import logging
-from typing import Generator, Iterable, List
-from chunkipy.text_chunker.data_models import Chunk, Chunks, Overlap, TextPart
+import os
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields
+from itertools import accumulate, islice
+from typing import (AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Generator, Iterable,
+                    Iterator, List, Optional, TextIO, Tuple, Union)
+from chunkipy.text_chunker.chunk_table import ChunkTable
+from chunkipy.text_chunker.chunking_stats import ChunkingObserver, ChunkingStats
+from chunkipy.text_chunker.data_models import Chunk, Chunks, FrozenChunk, Overlap, TextPart, TextParts
 from chunkipy.text_splitters import *
-from chunkipy.size_estimators import BaseSizeEstimator, WordSizeEstimator
+from chunkipy.text_splitters.semantic.base_semantic_text_splitter import BaseSemanticTextSplitter
+from chunkipy.size_estimators import (BaseSizeEstimator, PointEstimate, TieredSizeEstimator, TokenSpansIndex,
+                                     WordSizeEstimator)
 
 
 DEFAULT_CHUNK_SIZE = 1000  
 
+DEFAULT_STREAM_BUFFER_SIZE = 1 << 20  # characters
+
 DEFAULT_TEXT_SPLITTERS = [
     SemicolonTextSplitter(),
     ColonTextSplitter(),
@@ -14,12 +30,62 @@ DEFAULT_TEXT_SPLITTERS = [
     WordTextSplitter()
 ]
 
+EXECUTORS = ("process", "thread")
+
+ENGINES = ("recursive", "scanner")
+
+DEFAULT_ASYNC_CONCURRENCY = 16
+
+
+@dataclass
+class TextChunkerConfig:
+    """Picklable description of a TextChunker, used to rebuild it inside worker processes.
+
+    Size estimators and text splitters are expected to drop any heavy, lazily loaded
+    resource (e.g. tiktoken encodings, spaCy models) when pickled and to reload it on first use.
+    Observers are not part of the configuration: they live in the calling process, so the texts chunked
+    by process workers are not observed.
+
+    :param chunk_size: The maximum size of each chunk.
+    :param size_estimator: The size estimator used to measure text parts.
+    :param overlap_ratio: The ratio of the chunk size used for overlapping.
+    :param text_splitters: The custom text splitters, applied before the default ones.
+    :param tokenize_once: Whether each text is tokenized once and the sizes of its parts derived from the token offsets.
+    :param engine: How text parts are split: "recursive" (each text splitter in turn) or "scanner" (single-pass BoundaryScanner).
+    :param frozen: Whether the chunks are returned as immutable FrozenChunk objects, with cached text and size.
+    """
+    chunk_size: int = None
+    size_estimator: BaseSizeEstimator = None
+    overlap_ratio: float = 0.0
+    text_splitters: List[BaseTextSplitter] = field(default_factory=list)
+    tokenize_once: bool = False
+    engine: str = "recursive"
+    frozen: bool = False
+
+
+# Chunker rebuilt once per worker process by _init_worker
+_worker_text_chunker: Optional["TextChunker"] = None
+
+
+def _init_worker(config: TextChunkerConfig):
+    global _worker_text_chunker
+    _worker_text_chunker = TextChunker.from_config(config)
+
+
+def _chunk_batch_in_worker(texts: List[str]) -> List[Chunks]:
+    return _worker_text_chunker._chunk_batch(texts)
+
+
 class TextChunker:
 
     def __init__(self, chunk_size: int = None,
                 size_estimator: BaseSizeEstimator = None,
                 overlap_ratio: float = 0.0,
-                text_splitters: List [BaseTextSplitter] = []):
+                text_splitters: List [BaseTextSplitter] = [],
+                tokenize_once: bool = False,
+                engine: str = "recursive",
+                frozen: bool = False,
+                observers: List[ChunkingObserver] = []):
 
         if overlap_ratio < 0 or overlap_ratio > 1:
             raise ValueError(f"overlap_ratio must be between 0 and 1. Current value: {overlap_ratio}")
@@ -28,14 +94,66 @@ class TextChunker:
             raise ValueError(f"chunk_size must be between a positive integer. Current value: {chunk_size}")
 
         self.chunk_size = chunk_size if chunk_size is not None else DEFAULT_CHUNK_SIZE
+        self.overlap_ratio = overlap_ratio
         self.overlap_size = int(self.chunk_size * overlap_ratio)
         self.overlap_enabled = True if self.overlap_size > 0 else False
         self.size_estimator = size_estimator
 
         if size_estimator is None:
             self.size_estimator = WordSizeEstimator()
+
+        if isinstance(self.size_estimator, TieredSizeEstimator) and self.size_estimator.chunk_size != self.chunk_size:
+            raise ValueError(f"The TieredSizeEstimator must have the chunk_size of the TextChunker. "
+                             f"Current values: {self.size_estimator.chunk_size} and {self.chunk_size}")
         
-        self.text_splitters = list(text_splitters) + DEFAULT_TEXT_SPLITTERS
+        self.custom_text_splitters = list(text_splitters)
+        self.text_splitters = self.custom_text_splitters + DEFAULT_TEXT_SPLITTERS
+
+        if tokenize_once and not self.size_estimator.supports_token_spans:
+            raise ValueError(f"tokenize_once requires a size estimator providing token offsets. "
+                             f"{self.size_estimator.__class__.__name__} does not implement token_spans.")
+        self.tokenize_once = tokenize_once
+
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}. Current value: {engine}")
+        self.engine = engine
+        self.boundary_scanner = BoundaryScanner(self.text_splitters) if engine == "scanner" else None
+
+        # Chunks are built mutable and, if frozen, finalized as they are yielded
+        self.frozen = frozen
+
+        # Called with the ChunkingStats of each text chunked by chunk, chunk_with_stats, iter_chunks or chunk_many with
+        # thread workers: statistics are only collected if there are observers (see chunk_with_stats)
+        self.observers = list(observers)
+
+    @property
+    def config(self) -> TextChunkerConfig:
+        """Returns the picklable configuration this TextChunker was built from.
+
+        Returns:
+            TextChunkerConfig: The configuration, suitable to rebuild an equivalent TextChunker.
+        """
+        return TextChunkerConfig(
+            chunk_size=self.chunk_size,
+            size_estimator=self.size_estimator,
+            overlap_ratio=self.overlap_ratio,
+            text_splitters=self.custom_text_splitters,
+            tokenize_once=self.tokenize_once,
+            engine=self.engine,
+            frozen=self.frozen
+        )
+
+    @classmethod
+    def from_config(cls, config: TextChunkerConfig) -> "TextChunker":
+        """Builds a TextChunker from a TextChunkerConfig.
+
+        Args:
+            config (TextChunkerConfig): The configuration to build the TextChunker from.
+
+        Returns:
+            TextChunker: A new TextChunker instance.
+        """
+        return cls(**{config_field.name: getattr(config, config_field.name) for config_field in fields(config)})
 
     def chunk(self, text: str) -> Chunks:
         """ Chunk the provided text into smaller parts based on the configured chunk size and overlap.
@@ -46,21 +164,488 @@ class TextChunker:
         Returns:
             Chunks: A list containing the chunks and for each chunks the list of text parts the made it up.
         """
+        if self.observers:
+            return self.chunk_with_stats(text)[0]
         self._validate_text(text)
         text_parts_and_counts = self.split_text(text)
         return self._build_chunks(text_parts_and_counts)
 
+    def chunk_with_stats(self, text: str) -> Tuple[Chunks, ChunkingStats]:
+        """ Chunk the provided text as `chunk` does, collecting statistics on where the time goes.
+
+        The text splitters and the size estimator are timed and counted, level by level, and the statistics
+        are sent to the observers of this TextChunker. Statistics are only collected by this method and, when
+        there are observers, by `chunk`, `iter_chunks` and `chunk_many` with thread workers, so they cost nothing
+        otherwise. The async methods, `chunk_stream` and process workers never collect them.
+
+        Args:
+            text (str): The text to be chunked
+
+        Returns:
+            Tuple[Chunks, ChunkingStats]: The chunks, and the statistics of the chunking.
+        """
+        self._validate_text(text)
+        return self._chunk_with_stats(text)
+
+    def _chunk_with_stats(self, text: str, first_spans: List[Tuple[int, int]] = None) -> Tuple[Chunks, ChunkingStats]:
+        stats = self._new_stats(text)
+        chunks = Chunks(self._iter_observed_chunks(self._split_text(text, first_spans, stats=stats), stats))
+        return chunks, stats
+
+    def _new_stats(self, text: str) -> ChunkingStats:
+        return ChunkingStats(chunk_size=self.chunk_size, text_length=len(text),
+                             splitter_seconds=[0.0] * len(self.text_splitters),
+                             splitter_calls=[0] * len(self.text_splitters))
+
+    def _iter_observed_chunks(self, text_parts: Iterable[TextPart], stats: ChunkingStats) -> Generator[Chunk, None, None]:
+        # Build the chunks, completing the statistics with them, and send them to the observers after the last one.
+        # The time spent by the caller between two chunks is not counted.
+        total_size = 0
+        resumed = time.perf_counter()
+        for chunk in self._iter_build_chunks(text_parts):
+            stats.total_seconds += time.perf_counter() - resumed
+            stats.chunks += 1
+            stats.text_parts += len(chunk.content)
+            total_size += chunk.size
+            yield chunk
+            resumed = time.perf_counter()
+        stats.total_seconds += time.perf_counter() - resumed
+
+        stats.fill_ratio = total_size / (stats.chunks * self.chunk_size) if stats.chunks else 0.0
+        for observer in self.observers:
+            observer(stats)
+
+    def iter_chunks(self, text: str) -> Generator[Chunk, None, None]:
+        """ Chunk the provided text, yielding each chunk as soon as it is complete.
+
+        Unlike `chunk`, the chunks are not collected in memory: each Chunk (together with the
+        Overlap carried from the previous one) is yielded as soon as the next text part does not fit in it,
+        so downstream processing can start immediately and memory stays bounded for long texts.
+
+        Args:
+            text (str): The text to be chunked
+
+        Yields:
+            Generator [Chunk, None, None]: A generator yielding the chunks in order.
+        """
+        self._validate_text(text)
+        if self.observers:
+            # The observers receive the statistics once the last chunk is yielded
+            stats = self._new_stats(text)
+            yield from self._iter_observed_chunks(self._split_text(text, stats=stats), stats)
+            return
+        yield from self._iter_build_chunks(self.split_text(text))
+
+    def chunk_table(self, text: str) -> ChunkTable:
+        """ Chunk the provided text into a ChunkTable, a compact columnar representation of the chunks.
+
+        The chunks are built one at a time and stored as arrays of offsets and sizes over the text,
+        so holding the chunks of huge corpora takes a fraction of the memory of Chunks.
+
+        Args:
+            text (str): The text to be chunked
+
+        Returns:
+            ChunkTable: The chunks, as a table.
+        """
+        self._validate_text(text)
+        typecode = ChunkTable.TYPECODE
+        part_starts, part_ends = array(typecode), array(typecode)
+        size_prefix = array(typecode, [0])
+        overlap_starts, content_starts = array(typecode), array(typecode)
+
+        window: List[TextPart] = []  # Text parts whose size is not stored yet, from the current chunk content on
+
+        def recorded_text_parts() -> Generator[TextPart, None, None]:
+            for text_part in self.split_text(text):
+                part_starts.append(text_part.start)
+                part_ends.append(text_part.end)
+                window.append(text_part)
+                yield text_part
+
+        # No Chunk is built and the text parts are only kept until their chunk is complete:
+        # the chunks are the index ranges into the text parts
+        for overlap_start, content_start, content_end in self._iter_chunk_ranges(recorded_text_parts()):
+            overlap_starts.append(overlap_start)
+            content_starts.append(content_start)
+            # The sizes of the content text parts are final once the chunk is complete
+            for text_part in window[:content_end - content_start]:
+                size_prefix.append(size_prefix[-1] + text_part.size)
+            del window[:content_end - content_start]
+        content_starts.append(len(part_starts))
+        return ChunkTable(text, part_starts, part_ends, size_prefix, overlap_starts, content_starts)
+
+    def chunk_stream(self, source: Union[TextIO, Iterable[str]],
+                     buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE) -> Generator[Chunk, None, None]:
+        """ Chunk a text read from a file-like object or from an iterator of string blocks, with bounded memory.
+
+        The source is read into a buffer of about ``buffer_size`` characters. Only the text parts that
+        are complete according to the first text splitter are consumed: the last, possibly truncated,
+        part is carried over and completed with the next block. If a single part exceeds the buffer,
+        the buffer is cut at the boundaries of the next text splitters (or, as a last resort, hard cut),
+        so memory usage never depends on the size of the source.
+        The text parts of the yielded chunks have character offsets relative to the whole source.
+
+        Args:
+            source (TextIO | Iterable[str]): A file-like object opened in text mode, or an iterable of string blocks.
+            buffer_size (int): The number of characters read and buffered at once.
+
+        Yields:
+            Generator [Chunk, None, None]: A generator yielding the chunks in order.
+        """
+        if not isinstance(buffer_size, int) or buffer_size < 1:
+            raise ValueError(f"buffer_size must be a positive integer. Current value: {buffer_size}")
+        if isinstance(source, str):
+            raise TypeError("source must be a file-like object or an iterable of strings, not a string. Use chunk() instead.")
+        yield from self._iter_build_chunks(self._split_stream(source, buffer_size))
+
+    def chunk_many(self, texts: Iterable[str],
+                   workers: int = None,
+                   executor: str = "process",
+                   chunksize: int = 1,
+                   ordered: bool = True) -> Iterator[Union[Chunks, Tuple[int, Chunks]]]:
+        """ Chunk many texts in parallel, fanning them out to a pool of workers.
+
+        Process workers are initialized once from the picklable config of this TextChunker,
+        so loaded models and tokenizers are never sent over the wire. Texts are submitted in
+        batches of ``chunksize`` and only a bounded number of batches is in flight at any time,
+        so ``texts`` can be a lazy iterable of any length. When the first text splitter is a semantic
+        text splitter, the texts of each batch are split together with its split_spans_many.
+
+        Args:
+            texts (Iterable[str]): The texts to be chunked.
+            workers (int): The number of workers. Defaults to the number of CPUs.
+            executor (str): Either "process" or "thread".
+            chunksize (int): The number of texts sent to a worker at once.
+            ordered (bool): If True, results are yielded in input order; otherwise they are yielded
+                as soon as they are ready, together with the index of the input text.
+
+        Returns:
+            Iterator[Chunks | Tuple[int, Chunks]]: The chunks of each text, or (index, chunks) pairs if not ordered.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}. Current value: {executor}")
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer. Current value: {chunksize}")
+        workers = workers or os.cpu_count() or 1
+        return self._iter_chunk_many(texts, workers, executor, chunksize, ordered)
+
+    def _iter_chunk_many(self, texts: Iterable[str], workers: int, executor: str,
+                         chunksize: int, ordered: bool) -> Generator[Union[Chunks, Tuple[int, Chunks]], None, None]:
+        if executor == "process":
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config,))
+            chunk_batch = _chunk_batch_in_worker
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            chunk_batch = self._chunk_batch
+
+        with pool:
+            results = self._iter_batch_results(pool, chunk_batch, texts, chunksize,
+                                               max_pending=2 * workers, ordered=ordered)
+            for idx, chunks in results:
+                yield chunks if ordered else (idx, chunks)
+
+    def _chunk_batch(self, texts: List[str]) -> List[Chunks]:
+        first_text_splitter = self.text_splitters[0]
+        if len(texts) < 2 or not isinstance(first_text_splitter, BaseSemanticTextSplitter):
+            return [self.chunk(text) for text in texts]
+
+        for text in texts:
+            self._validate_text(text)
+        # The (slow) semantic text splitter splits all the texts together, the lower levels go text by text
+        texts_spans = first_text_splitter.split_spans_many(texts)
+        if self.observers:
+            return [self._chunk_with_stats(text, spans)[0] for text, spans in zip(texts, texts_spans)]
+        return [self._build_chunks(self._split_text(text, spans)) for text, spans in zip(texts, texts_spans)]
+
+    @staticmethod
+    def _iter_batch_results(pool, chunk_batch, texts: Iterable[str], chunksize: int,
+                            max_pending: int, ordered: bool) -> Generator[Tuple[int, Chunks], None, None]:
+        texts_iter = iter(texts)
+        pending: Deque[Tuple[int, Future]] = deque()
+        next_idx = 0
+
+        def submit_next_batch() -> bool:
+            nonlocal next_idx
+            batch = list(islice(texts_iter, chunksize))
+            if not batch:
+                return False
+            pending.append((next_idx, pool.submit(chunk_batch, batch)))
+            next_idx += len(batch)
+            return True
+
+        while len(pending) < max_pending and submit_next_batch():
+            pass
+
+        while pending:
+            if ordered:
+                batch_idx, future = pending.popleft()
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                batch_idx, future = next((i, f) for i, f in pending if f in done)
+                pending.remove((batch_idx, future))
+            for i, chunks in enumerate(future.result()):
+                yield batch_idx + i, chunks
+            submit_next_batch()
+
+    async def achunk(self, text: str) -> Chunks:
+        """ Chunk the provided text from a coroutine, see `chunk`.
+
+        Text splitters and size estimators are awaited through their async hooks (asplit_spans,
+        aestimate_sizes), and the text parts exceeding the chunk size are split further concurrently,
+        so the calls of I/O bound size estimators (see AsyncBaseSizeEstimator) overlap.
+
+        Args:
+            text (str): The text to be chunked
+
+        Returns:
+            Chunks: A list containing the chunks and for each chunks the list of text parts the made it up.
+        """
+        self._validate_text(text)
+        return self._build_chunks(await self._asplit_text(text))
+
+    def achunk_many(self, texts: Union[Iterable[str], AsyncIterable[str]],
+                    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+                    ordered: bool = True) -> AsyncIterator[Union[Chunks, Tuple[int, Chunks]]]:
+        """ Chunk many texts from a coroutine, with at most ``concurrency`` texts in flight at any time.
+
+        ``texts`` is consumed lazily, so it can be an iterable or an async iterable of any length.
+
+        Args:
+            texts (Iterable[str] | AsyncIterable[str]): The texts to be chunked.
+            concurrency (int): The maximum number of texts chunked concurrently.
+            ordered (bool): If True, results are yielded in input order; otherwise they are yielded
+                as soon as they are ready, together with the index of the input text.
+
+        Returns:
+            AsyncIterator[Chunks | Tuple[int, Chunks]]: The chunks of each text, or (index, chunks) pairs if not ordered.
+        """
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError(f"concurrency must be a positive integer. Current value: {concurrency}")
+        return self._aiter_chunk_many(texts, concurrency, ordered)
+
+    async def _aiter_chunk_many(self, texts: Union[Iterable[str], AsyncIterable[str]], concurrency: int,
+                                ordered: bool) -> AsyncGenerator[Union[Chunks, Tuple[int, Chunks]], None]:
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+
+        async def next_result() -> Tuple[int, Chunks]:
+            if ordered:
+                idx, task = pending.popleft()
+            else:
+                done, _ = await asyncio.wait([t for _, t in pending], return_when=asyncio.FIRST_COMPLETED)
+                idx, task = next((i, t) for i, t in pending if t in done)
+                pending.remove((idx, task))
+            return idx, await task
+
+        try:
+            idx = 0
+            async for text in self._aiter_texts(texts):
+                pending.append((idx, asyncio.ensure_future(self.achunk(text))))
+                idx += 1
+                if len(pending) >= concurrency:
+                    idx_chunks = await next_result()
+                    yield idx_chunks[1] if ordered else idx_chunks
+            while pending:
+                idx_chunks = await next_result()
+                yield idx_chunks[1] if ordered else idx_chunks
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _aiter_texts(texts: Union[Iterable[str], AsyncIterable[str]]) -> AsyncGenerator[str, None]:
+        if hasattr(texts, "__aiter__"):
+            async for text in texts:
+                yield text
+        else:
+            for text in texts:
+                yield text
+
+    async def _asplit_text(self, text: str) -> List[TextPart]:
+        split_spans = self._aspan_splitter(text)
+        estimate_spans = await self._aspan_size_estimator(text)
+        spans = await split_spans(0, 0, len(text))
+        return await self._avalidate_spans(text, spans, 0, split_spans, estimate_spans)
+
+    def _aspan_splitter(self, source: str) -> Callable[[int, int, int], Awaitable[List[Tuple[int, int]]]]:
+        # Async counterpart of _span_splitter
+        if self.boundary_scanner is not None:
+            boundary_scan = self.boundary_scanner.scan(source)
+
+            async def split_spans(split_strategy_idx: int, start: int, end: int) -> List[Tuple[int, int]]:
+                return boundary_scan.split_spans(split_strategy_idx, start, end)
+            return split_spans
+        return lambda split_strategy_idx, start, end: \
+            self.text_splitters[split_strategy_idx].asplit_spans(source, start, end)
+
+    async def _aspan_size_estimator(self, source: str) -> Callable[[List[Tuple[int, int]]], Awaitable[List[int]]]:
+        # Async counterpart of _span_size_estimator
+        if self.tokenize_once:
+            token_spans_index = TokenSpansIndex(await self.size_estimator.atoken_spans(source), source)
+
+            async def estimate_spans(spans: List[Tuple[int, int]]) -> List[int]:
+                return [token_spans_index.count(start, end) for start, end in spans]
+            return estimate_spans
+        return lambda spans: self.size_estimator.aestimate_sizes([source[start:end] for start, end in spans])
+
+    async def _avalidate_spans(self, source: str, spans: List[Tuple[int, int]], split_strategy_idx: int,
+                               split_spans: Callable[[int, int, int], Awaitable[List[Tuple[int, int]]]],
+                               estimate_spans: Callable[[List[Tuple[int, int]]], Awaitable[List[int]]]) -> List[TextPart]:
+        text_part_sizes = await estimate_spans(spans)
+        # Each item is a text part, or the position in resplits of the text parts it is split into
+        items = []
+        resplits = []
+        for (start, end), text_part_size in zip(spans, text_part_sizes):
+            if split_strategy_idx < len(self.text_splitters)-1 \
+                    and text_part_size > self.chunk_size:
+                items.append(len(resplits))
+                resplits.append(self._avalidate_and_split(source, start, end, split_strategy_idx+1,
+                                                          split_spans, estimate_spans))
+            else:
+                items.append(TextPart(size=text_part_size, start=start, end=end, source=source))
+
+        if not resplits:
+            return items
+        # The text parts exceeding the chunk size are split further concurrently
+        resplit_text_parts = await asyncio.gather(*resplits)
+        text_parts = []
+        for item in items:
+            if isinstance(item, TextPart):
+                text_parts.append(item)
+            else:
+                text_parts.extend(resplit_text_parts[item])
+        return text_parts
+
+    async def _avalidate_and_split(self, source: str, start: int, end: int, split_strategy_idx: int,
+                                   split_spans: Callable[[int, int, int], Awaitable[List[Tuple[int, int]]]],
+                                   estimate_spans: Callable[[List[Tuple[int, int]]], Awaitable[List[int]]]) -> List[TextPart]:
+        spans = await split_spans(split_strategy_idx, start, end)
+        return await self._avalidate_spans(source, spans, split_strategy_idx, split_spans, estimate_spans)
+
     def split_text(self, text: str) -> Generator [TextPart, None, None]:
         """ Split the provided text into smaller parts based on the configured text splitters and chunk size.
 
+        The text is never copied while splitting: each TextPart is a (start, end) span into the provided text.
+
         Args:
             text (str): The text to be split.
 
         Yields:
             Generator [TextPart, None, None]: A generator yielding TextPart objects, each containing a piece of text and its estimated size.
         """
+        yield from self._split_text(text)
+
+    def _split_text(self, text: str, first_spans: List[Tuple[int, int]] = None,
+                    stats: ChunkingStats = None) -> Generator [TextPart, None, None]:
+        # first_spans are the spans of the highest strategy, when already known
         split_strategy_idx = 0  # start with the highest strategy
-        yield from self._validate_and_split(text, split_strategy_idx)
+        if stats is None:
+            split_spans = self._span_splitter(text)
+            estimate_spans = self._span_size_estimator(text)
+        else:
+            start = time.perf_counter()
+            split_spans = self._span_splitter(text)  # e.g. the BoundaryScan of the text
+            stats.splitter_seconds[0] += time.perf_counter() - start
+            start = time.perf_counter()
+            estimate_spans = self._span_size_estimator(text)
+            if self.tokenize_once:  # the text is tokenized right away
+                stats.estimate_calls += 1
+                stats.estimated_texts += 1
+                stats.estimate_seconds += time.perf_counter() - start
+            split_spans, estimate_spans = self._instrument(stats, split_spans, estimate_spans, self.tokenize_once)
+        if first_spans is None:
+            yield from self._validate_and_split(text, 0, len(text), split_strategy_idx, split_spans, estimate_spans)
+        else:
+            yield from self._validate_spans(text, first_spans, split_strategy_idx, split_spans, estimate_spans)
+
+    @staticmethod
+    def _instrument(stats: ChunkingStats,
+                    split_spans: Callable[[int, int, int], List[Tuple[int, int]]],
+                    estimate_spans: Callable[[List[Tuple[int, int]]], List[int]],
+                    index_lookups: bool = False
+                    ) -> Tuple[Callable[[int, int, int], List[Tuple[int, int]]], Callable[[List[Tuple[int, int]]], List[int]]]:
+        # Wrap the span splitter and the span size estimator to time and count their calls.
+        # With index_lookups, the sizes are looked up in a token index and counted apart from the estimator calls
+        def timed_split_spans(split_strategy_idx: int, start: int, end: int) -> List[Tuple[int, int]]:
+            split_start = time.perf_counter()
+            spans = split_spans(split_strategy_idx, start, end)
+            stats.splitter_seconds[split_strategy_idx] += time.perf_counter() - split_start
+            stats.splitter_calls[split_strategy_idx] += 1
+            if split_strategy_idx > 0:  # a text part exceeding the chunk size
+                stats.resplit_parts += 1
+                stats.max_depth = max(stats.max_depth, split_strategy_idx)
+            return spans
+
+        def timed_estimate_spans(spans: List[Tuple[int, int]]) -> List[int]:
+            estimate_start = time.perf_counter()
+            sizes = estimate_spans(spans)
+            if index_lookups:
+                stats.index_lookup_seconds += time.perf_counter() - estimate_start
+                stats.index_lookups += 1
+            else:
+                stats.estimate_seconds += time.perf_counter() - estimate_start
+                stats.estimate_calls += 1
+                stats.estimated_texts += len(spans)
+            return sizes
+
+        return timed_split_spans, timed_estimate_spans
+
+    @staticmethod
+    def _iter_blocks(source: Union[TextIO, Iterable[str]], buffer_size: int) -> Generator[str, None, None]:
+        if hasattr(source, "read"):
+            while block := source.read(buffer_size):
+                yield block
+        else:
+            for block in source:
+                if not isinstance(block, str):
+                    raise TypeError(f"source must yield strings. Block type: {type(block)}")
+                yield block
+
+    def _split_stream(self, source: Union[TextIO, Iterable[str]], buffer_size: int) -> Generator[TextPart, None, None]:
+        buffer = ""
+        offset = 0  # offset of the buffer within the whole source
+        for block in self._iter_blocks(source, buffer_size):
+            buffer += block
+            while len(buffer) >= buffer_size:
+                consumed = yield from self._split_buffer_prefix(buffer, offset, buffer_size)
+                buffer = buffer[consumed:]
+                offset += consumed
+
+        if buffer.strip():
+            split_spans = self._span_splitter(buffer)
+            estimate_spans = self._span_size_estimator(buffer)
+            for text_part in self._validate_and_split(buffer, 0, len(buffer), 0, split_spans, estimate_spans):
+                yield self._detach_text_part(text_part, offset)
+
+    def _split_buffer_prefix(self, buffer: str, offset: int, buffer_size: int) -> Generator[TextPart, None, int]:
+        # Yield the text parts of the longest prefix of buffer that can be split safely, and return its length
+        if not buffer.strip():
+            return len(buffer)
+
+        split_spans = self._span_splitter(buffer)
+        estimate_spans = self._span_size_estimator(buffer)
+        for split_strategy_idx in range(len(self.text_splitters)):
+            spans = split_spans(split_strategy_idx, 0, len(buffer))
+            if len(spans) < 2:
+                continue
+            # The last part may continue in the next block: carry over everything from its beginning
+            consumed = spans.pop()[0]
+            for text_part in self._validate_spans(buffer, spans, split_strategy_idx, split_spans, estimate_spans):
+                yield self._detach_text_part(text_part, offset)
+            return consumed
+
+        # No boundary at all within the buffer: hard cut it
+        last_split_strategy_idx = len(self.text_splitters) - 1
+        for text_part in self._validate_and_split(buffer, 0, buffer_size, last_split_strategy_idx,
+                                                  split_spans, estimate_spans):
+            yield self._detach_text_part(text_part, offset)
+        return buffer_size
+
+    @staticmethod
+    def _detach_text_part(text_part: TextPart, offset: int) -> TextPart:
+        # Stream buffers are discarded, so text parts hold their own text and global offsets
+        return TextPart(size=text_part.size, text=text_part.text,
+                        start=offset + text_part.start, end=offset + text_part.end)
         
     def _validate_text(self, text: str):
         if text is None or not isinstance(text, str):
@@ -68,50 +653,149 @@ class TextChunker:
         if not text.strip():
             raise ValueError("Text cannot be empty or whitespace only.")
             
-    def _validate_and_split(self, text: str, split_strategy_idx: int) -> Generator [TextPart, None, None]:
-        text_splitter = self.text_splitters[split_strategy_idx]
-        logging.debug(f"Text Splitter: {text_splitter}")
-        text_parts = text_splitter.split(text)
+    def _span_splitter(self, source: str) -> Callable[[int, int, int], List[Tuple[int, int]]]:
+        # Returns a function splitting source[start:end] with the text splitter at the given index
+        if self.boundary_scanner is not None:
+            # All the boundaries of all the text splitters are found in a single pass over source
+            return self.boundary_scanner.scan(source).split_spans
+        return lambda split_strategy_idx, start, end: \
+            self.text_splitters[split_strategy_idx].split_spans(source, start, end)
+
+    def _span_size_estimator(self, source: str) -> Callable[[List[Tuple[int, int]]], List[int]]:
+        # Returns a function estimating the sizes of spans of source
+        if self.tokenize_once:
+            token_spans_index = TokenSpansIndex(self.size_estimator.token_spans(source), source)
+            return lambda spans: [token_spans_index.count(start, end) for start, end in spans]
+        # All the sibling text parts are estimated in a single batch
+        return lambda spans: self.size_estimator.estimate_sizes([source[start:end] for start, end in spans])
 
-        for text_part in text_parts:
-            text_part_size = self.size_estimator.estimate_size(text_part)
+    def _validate_and_split(self, source: str, start: int, end: int, split_strategy_idx: int,
+                            split_spans: Callable[[int, int, int], List[Tuple[int, int]]],
+                            estimate_spans: Callable[[List[Tuple[int, int]]], List[int]]) -> Generator [TextPart, None, None]:
+        logging.debug(f"Text Splitter: {self.text_splitters[split_strategy_idx]}")
+        spans = split_spans(split_strategy_idx, start, end)
+        yield from self._validate_spans(source, spans, split_strategy_idx, split_spans, estimate_spans)
 
+    def _validate_spans(self, source: str, spans: List[Tuple[int, int]], split_strategy_idx: int,
+                        split_spans: Callable[[int, int, int], List[Tuple[int, int]]],
+                        estimate_spans: Callable[[List[Tuple[int, int]]], List[int]]) -> Generator [TextPart, None, None]:
+        text_part_sizes = estimate_spans(spans)
+        for (start, end), text_part_size in zip(spans, text_part_sizes):
             if split_strategy_idx < len(self.text_splitters)-1 \
                     and text_part_size > self.chunk_size:
-                yield from self._validate_and_split(text_part, split_strategy_idx+1)
+                yield from self._validate_and_split(source, start, end, split_strategy_idx+1,
+                                                    split_spans, estimate_spans)
             else:
-                yield TextPart(text=text_part, size=text_part_size)
+                yield TextPart(size=text_part_size, start=start, end=end, source=source)
 
     def _build_chunks(self, text_parts: Iterable[TextPart]) -> Chunks:
-        chunks = Chunks()
-        curr_chunk = Chunk()  # Current chunk to accumulate text_parts
-        overlap = Overlap()  # Sliding deque of overlapping text_parts
+        return Chunks(self._iter_build_chunks(text_parts))
 
-        for text_part in text_parts:
-            # Add text_part to the current chunk if it fits within the chunk size
-            if curr_chunk.size + text_part.size <= self.chunk_size:
-                curr_chunk.content.append(text_part)
+    def _iter_build_chunks(self, text_parts: Iterable[TextPart]) -> Generator[Chunk, None, None]:
+        window: List[TextPart] = []  # Text parts from the content start of the previous chunk on
+        window_start = 0  # Index of window[0] in the sequence of text parts
 
-                # Handle overlapping text_parts if overlap is configured
-                if self.overlap_enabled:
-                    while overlap.size + text_part.size > self.overlap_size and overlap: 
-                        overlap.popleft() # Remove text_parts from the left until size fits
+        def recorded_text_parts() -> Generator[TextPart, None, None]:
+            for text_part in text_parts:
+                window.append(text_part)
+                yield text_part
+
+        for overlap_start, content_start, content_end in self._iter_chunk_ranges(recorded_text_parts()):
+            overlap = window[overlap_start - window_start:content_start - window_start]
+            content = window[content_start - window_start:content_end - window_start]
+            if self.frozen:
+                yield FrozenChunk(overlap=overlap, content=content)
+            else:
+                yield Chunk(overlap=Overlap(overlap), content=TextParts(content))
+
+            # The overlap of the next chunk is a suffix of the content of this one
+            del window[:content_start - window_start]
+            window_start = content_start
+
+    def _iter_chunk_ranges(self, text_parts: Iterable[TextPart]) -> Generator[Tuple[int, int, int], None, None]:
+        """ Yields the (overlap start, content start, content end) indexes of each chunk into the sequence of text parts.
+
+        A chunk ends when the next text part does not fit in it. The overlap of the next chunk is the longest suffix
+        of its content whose size is at most overlap_size, found by bisecting the prefix sums of the content sizes:
+        each chunk costs O(log n) time and O(1) memory for its overlap, whatever the overlap_ratio.
 
-            else: # Chunk size exceeded, finalize the current chunk and create a new one
-                chunks.append(curr_chunk)
-                curr_chunk = Chunk()
+        With a TieredSizeEstimator, text parts may have a PointEstimate as size. They are added to a chunk as long as
+        the upper bounds of its text parts, recorded when they were estimated, surely fit in chunk_size; beyond, the text parts of the chunk are estimated
+        exactly (updating their size) before deciding whether the next one fits, in a batch with the following text
+        parts of about a chunk.
 
+        Args:
+            text_parts (Iterable[TextPart]): The text parts, in order.
+
+        Yields:
+            Generator [Tuple[int, int, int], None, None]: The index ranges of the overlap and of the content of each chunk.
+        """
+        tiered = self.size_estimator if isinstance(self.size_estimator, TieredSizeEstimator) else None
+        overlap_start = content_start = 0
+        overlap_size = 0  # Size of the overlap of the current chunk
+        content_prefix = [0]  # Cumulative sizes of the content text parts of the current chunk
+        content: List[TextPart] = []  # Content text parts of the current chunk, only kept with a TieredSizeEstimator
+        estimated: List[TextPart] = []  # Text parts of the current chunk whose size is a point estimate
+        chunk_upper = 0  # Upper bound of the size of the current chunk
+        text_parts = iter(text_parts)
+        pending: Deque[TextPart] = deque()  # Text parts pulled ahead to be estimated in a batch, or put back by a cut
+        index = 0
+
+        while True:
+            text_part = pending.popleft() if pending else next(text_parts, None)
+            if tiered is not None:
+                point_estimate = isinstance(getattr(text_part, "size", None), PointEstimate)
+                upper = text_part.size.upper_bound if point_estimate else getattr(text_part, "size", 0)
+                # Near chunk_size, or at the end: estimate the text parts of the chunk exactly
+                if (estimated or point_estimate) and (text_part is None or chunk_upper + upper > self.chunk_size):
+                    to_resolve = estimated + [text_part] if point_estimate else list(estimated)
+                    ahead_size = upper
+                    while text_part is not None and ahead_size <= self.chunk_size \
+                            and (next_text_part := next(text_parts, None)) is not None:
+                        pending.append(next_text_part)
+                        ahead_size += next_text_part.size
+                        if isinstance(next_text_part.size, PointEstimate):
+                            to_resolve.append(next_text_part)
+                    for resolved_text_part, size in zip(to_resolve, tiered.resolve_sizes(
+                            [resolved_text_part.text for resolved_text_part in to_resolve])):
+                        resolved_text_part.size = size
+                    content_prefix = list(accumulate((content_text_part.size for content_text_part in content),
+                                                     initial=0))
+                    estimated = []
+                    chunk_upper, upper = overlap_size + content_prefix[-1], getattr(text_part, "size", 0)
+                    if chunk_upper > self.chunk_size and len(content) > 1:
+                        # Point estimates beyond their upper bounds: cut the chunk where it fits, go on from there
+                        cut = max(bisect_right(content_prefix, self.chunk_size - overlap_size) - 1, 1)
+                        pending.extendleft(reversed(content[cut:] + ([text_part] if text_part is not None else [])))
+                        index -= len(content) - cut
+                        content, content_prefix = content[:cut], content_prefix[:cut + 1]
+                        chunk_upper = overlap_size + content_prefix[-1]
+                        continue
+            if text_part is None:
+                break
+
+            # Chunk size exceeded, finalize the current chunk and start a new one with this text part
+            if overlap_size + content_prefix[-1] + text_part.size > self.chunk_size:
+                yield overlap_start, content_start, index
+
+                overlap_start, overlap_size = index, 0
                 if self.overlap_enabled:
-                    # move current overlap to new curr chunk and reset overlap
-                    curr_chunk.overlap = overlap
-                    overlap = Overlap()
-                
-                curr_chunk.content.append(text_part)
-
-            # Add the text_part to the overlapping deque if it fits within the overlap size
-            if text_part.size <= self.overlap_size:
-                overlap.append(text_part)
-
-        # Add the final chunk after the loop ends
-        chunks.append(curr_chunk)
-        return chunks
+                    suffix_start = bisect_left(content_prefix, content_prefix[-1] - self.overlap_size)
+                    overlap_start = content_start + suffix_start
+                    overlap_size = content_prefix[-1] - content_prefix[suffix_start]
+                content_start = index
+                content_prefix = [0]
+                if tiered is not None:
+                    # The overlap comes from a completed chunk, whose text parts were estimated exactly
+                    content, chunk_upper = [], overlap_size
+
+            content_prefix.append(content_prefix[-1] + text_part.size)
+            if tiered is not None:
+                content.append(text_part)
+                chunk_upper += upper
+                if isinstance(text_part.size, PointEstimate):
+                    estimated.append(text_part)
+            index += 1
+
+        # Yield the final chunk after the loop ends
+        yield overlap_start, content_start, content_start + len(content_prefix) - 1
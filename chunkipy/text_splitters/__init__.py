@@ -8,8 +8,9 @@ from chunkipy.text_splitters.basic_text_splitters import (
     NewlineTextSplitter,
     WordTextSplitter
 )
+from chunkipy.text_splitters.boundary_scanner import BoundaryScanner, BoundaryScan
 
 
 __all__ = ["BaseTextSplitter", "SeparatorTextSplitter", "SemicolonTextSplitter",
               "ColonTextSplitter", "CommaTextSplitter", "FullStopTextSplitter",
-              "NewlineTextSplitter", "WordTextSplitter"]
\ No newline at end of file
+              "NewlineTextSplitter", "WordTextSplitter", "BoundaryScanner", "BoundaryScan"]
\ No newline at end of file
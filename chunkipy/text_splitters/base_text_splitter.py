@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
 
 class BaseTextSplitter(ABC):
@@ -20,6 +21,66 @@ class BaseTextSplitter(ABC):
         self._validate_text(text) 
         return self._split(text)  
 
+    def split_spans(self, text: str, start: int = 0, end: int = None) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] and return the (start, end) offsets of each text part within text,
+        so that parts can be referenced without copying them.
+
+        The default implementation locates, in order, the parts returned by split. If a part is not
+        found verbatim (e.g. a sentence splitter appended a space to it), its stripped content is located
+        instead, and its span is extended over the whitespace that follows it in the text.
+        Subclasses that know the offsets natively should override this method.
+
+        Args:
+            text (str): The source text.
+            start (int): The offset where the text to be split starts.
+            end (int): The offset where the text to be split ends. If None, the end of text.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) offsets of each text part within text.
+        """
+        end = len(text) if end is None else end
+        text_parts = self.split(text[start:end])
+        return self._locate_text_parts(text, text_parts, start, end)
+
+    async def asplit_spans(self, text: str, start: int = 0, end: int = None) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] from a coroutine, see split_spans.
+
+        The default implementation calls split_spans, which is fine for the splitters working in memory.
+        Slow text splitters (e.g. NLP models or remote services) should override it so that
+        they do not block the event loop.
+
+        Args:
+            text (str): The source text.
+            start (int): The offset where the text to be split starts.
+            end (int): The offset where the text to be split ends. If None, the end of text.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) offsets of each text part within text.
+        """
+        return self.split_spans(text, start, end)
+
+    @staticmethod
+    def _locate_text_parts(text: str, text_parts: List[str], start: int, end: int) -> List[Tuple[int, int]]:
+        spans = []
+        cursor = start
+        for text_part in text_parts:
+            idx = text.find(text_part, cursor, end)
+            if idx != -1:
+                cursor = idx + len(text_part)
+            else:
+                stripped_text_part = text_part.strip()
+                idx = text.find(stripped_text_part, cursor, end) if stripped_text_part else -1
+                if idx == -1:
+                    raise ValueError(f"Text part {text_part!r} is not a substring of the text. "
+                                     f"Override split_spans to return its offsets.")
+                cursor = idx + len(stripped_text_part)
+                while cursor < end and text[cursor].isspace():
+                    cursor += 1
+            spans.append((idx, cursor))
+        return spans
+
     def _validate_text(self, text: str):
         """
         Validate the input text.
@@ -1,4 +1,5 @@
-from typing import List
+from itertools import chain
+from typing import Generator, Iterable, List, Tuple
 from typing_extensions import override
 from chunkipy.text_splitters.base_text_splitter import BaseTextSplitter
 
@@ -16,10 +17,53 @@ class SeparatorTextSplitter(BaseTextSplitter):
     
     @override
     def _split(self, text: str) -> List[str]:
-        text_pieces = text.split(self.separator)
-        text_pieces = [t + self.separator for t in text_pieces if t != ' ' and t != '']
-        text_pieces[-1] = text_pieces[-1][:-len(self.separator)]
-        return text_pieces
+        return [text[start:end] for start, end in self.split_spans(text)]
+
+    @override
+    def split_spans(self, text: str, start: int = 0, end: int = None) -> List[Tuple[int, int]]:
+        # Offsets are found in place, without copying the pieces
+        end = len(text) if end is None else end
+        separator_positions = self._find_separator(text, start, end)
+        return self.spans_from_separator_positions(text, start, end, separator_positions, len(self.separator))
+
+    def _find_separator(self, text: str, start: int, end: int) -> Generator[int, None, None]:
+        separator_idx = text.find(self.separator, start, end)
+        while separator_idx != -1:
+            yield separator_idx
+            separator_idx = text.find(self.separator, separator_idx + len(self.separator), end)
+
+    @staticmethod
+    def spans_from_separator_positions(text: str, start: int, end: int,
+                                       separator_positions: Iterable[int], separator_len: int) -> List[Tuple[int, int]]:
+        """
+        Build the spans of the pieces of text[start:end] delimited by the given separator occurrences.
+        Each piece keeps its trailing separator, except the last one; pieces that are empty
+        or a single space are dropped.
+
+        Args:
+            text (str): The source text.
+            start (int): The offset where the text to be split starts.
+            end (int): The offset where the text to be split ends.
+            separator_positions (Iterable[int]): The increasing offsets of the separator occurrences within text[start:end].
+            separator_len (int): The length of the separator.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) offsets of each piece within text.
+        """
+        spans = []
+        piece_start = start
+        for separator_idx in chain(separator_positions, [None]):
+            piece_end = end if separator_idx is None else separator_idx
+            is_dropped = piece_end == piece_start or (piece_end - piece_start == 1 and text[piece_start] == ' ')
+            if separator_idx is None:
+                if not is_dropped:
+                    spans.append((piece_start, piece_end))
+                elif spans:  # the last kept piece loses its trailing separator
+                    spans[-1] = (spans[-1][0], spans[-1][1] - separator_len)
+                return spans
+            if not is_dropped:
+                spans.append((piece_start, piece_end + separator_len))
+            piece_start = separator_idx + separator_len
 
 
 class SemicolonTextSplitter (SeparatorTextSplitter):
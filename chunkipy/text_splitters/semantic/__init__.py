@@ -0,0 +1,19 @@
+from chunkipy.text_splitters.semantic.language_detection import (
+    BaseLanguageDetector,
+    LangdetectLanguageDetector
+)
+from chunkipy.text_splitters.semantic.model_registry import (
+    ModelInfo,
+    ModelRegistry,
+    RegistryInfo,
+    get_default_model_registry
+)
+
+__all__ = [
+    "BaseLanguageDetector",
+    "LangdetectLanguageDetector",
+    "ModelInfo",
+    "ModelRegistry",
+    "RegistryInfo",
+    "get_default_model_registry",
+]
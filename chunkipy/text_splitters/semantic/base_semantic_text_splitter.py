@@ -1,6 +1,10 @@
+import asyncio
 from abc import abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 from chunkipy.text_splitters.base_text_splitter import BaseTextSplitter
+from chunkipy.text_splitters.semantic.language_detection import BaseLanguageDetector
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry, get_default_model_registry
 
 
 class BaseSemanticTextSplitter(BaseTextSplitter):
@@ -13,28 +17,114 @@ class BaseSemanticTextSplitter(BaseTextSplitter):
     It is used to limit the size of text processed at once, which is useful for semantic models that may have constraints on input size.
     text_limit does not affect the splitting logic, but rather the size of the text that is passed to the _split method. 
     For example, if your text is 3500 chars and is text_limit is set to 1000, the text will be split into 4 parts of at most 1000 characters before being passed to the _split method.
+
+    Models are loaded through a ModelRegistry, shared by default by all the splitters of the process.
+    Subclasses backed by a model implement _load_model and _split_with_model, to support preload and warmup,
+    and may override _split_batch to process many windows at once (see split_many).
+    The language of each text is detected once, before windowing, so all its windows go to the same model.
+
+    Subclasses whose model is much faster on many texts at once set BULK_WINDOWS: then all the windows of
+    all the texts are split in bulk (see split_many).
+
+    With the "pre_boundary" windowing, windows are instead cut at cheap pre-boundaries (newlines, else full stops,
+    else spaces, else at text_limit) and are independent of each other: they can be split concurrently by a pool of workers,
+    and the text parts are built from the exact sentence offsets returned by _split_spans_batch.
+    Each text part spans from the start of a sentence to the start of the next one, so it keeps the actual
+    whitespace that follows the sentence (instead of a single space, as with the "carry" windowing).
     
     Args:
         text_limit (int): The maximum length of text to be processed at once.
         If None, defaults to a large value (1,000,000 characters).
+        model_registry (ModelRegistry): The registry the models are loaded through.
+        If None, the process-wide default registry is used.
+        language_detector (BaseLanguageDetector): Detects the language of each text.
+        If None, no language is detected.
+        lang (str): The language of all the texts, when known: no language is detected.
+        windowing (str): Either "carry" (each window starts with the last part of the previous one)
+        or "pre_boundary" (windows are cut at newlines, full stops or spaces).
+        workers (int): The number of threads splitting the windows with the "pre_boundary" windowing.
     Attributes:
         text_limit (int): The maximum length of text to be processed at once.
+        model_registry (ModelRegistry): The registry the models are loaded through.
+        language_detector (BaseLanguageDetector): Detects the language of each text.
+        lang (str): The language of all the texts, when known.
+        windowing (str): Either "carry" or "pre_boundary".
+        workers (int): The number of threads splitting the windows with the "pre_boundary" windowing.
         DEFAULT_TEXT_LIMIT (int): Default value for text_limit if not provided.
     Raises:
         NotImplementedError: If the _split method is not implemented in a subclass.
         
     """
     DEFAULT_TEXT_LIMIT = 1000000
+    BULK_WINDOWS = False
+    TAIL_GUESS_SIZE = 2000
+    WINDOWINGS = ("carry", "pre_boundary")
+    PRE_BOUNDARIES = ("\n", ". ", " ")
+    WARMUP_TEXT = "This is a warmup sentence. This is another one."
 
-    def __init__(self, text_limit: int = None):
+    def __init__(self, text_limit: int = None, model_registry: ModelRegistry = None,
+                 language_detector: BaseLanguageDetector = None, lang: str = None,
+                 windowing: str = "carry", workers: int = 1):
+        if windowing not in self.WINDOWINGS:
+            raise ValueError(f"windowing must be one of {self.WINDOWINGS}. Current value: {windowing}")
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer. Current value: {workers}")
         self.text_limit = text_limit or self.DEFAULT_TEXT_LIMIT
+        self.model_registry = model_registry if model_registry is not None else get_default_model_registry()
+        self.language_detector = language_detector
+        self.lang = lang
+        self.windowing = windowing
+        self.workers = workers
+
+    def _detect_language(self, text: str) -> Optional[str]:
+        if self.lang is not None:
+            return self.lang
+        if self.language_detector is None:
+            return None
+        return self.language_detector.detect(text)
 
     @abstractmethod
     def _split(self, text: str) -> List[str]:
         raise NotImplementedError("Subclasses must implement the _split method.")
 
+    def _load_model(self, lang: str) -> Any:
+        raise NotImplementedError(f"{self.__class__.__name__} does not load models.")
+
+    def _split_with_model(self, model: Any, text: str) -> List[str]:
+        raise NotImplementedError(f"{self.__class__.__name__} does not load models.")
+
+    def _group_by_model(self, texts: List[str], langs: List[Optional[str]]) -> List[Tuple[Any, List[int]]]:
+        # The model of each language, with the indexes of the texts it has to process
+        models = dict()
+        text_idxs_by_model = dict()
+        for text_idx, (text, lang) in enumerate(zip(texts, langs)):
+            model = self._load_model(lang or self._detect_language(text))
+            models[id(model)] = model
+            text_idxs_by_model.setdefault(id(model), []).append(text_idx)
+        return [(models[model_id], text_idxs) for model_id, text_idxs in text_idxs_by_model.items()]
+
+    def preload(self, langs: List[str]):
+        """Load the models of the given languages ahead of time, e.g. at service startup.
+
+        Args:
+            langs (List[str]): The language codes, as detected by langdetect.
+        """
+        for lang in langs:
+            self._load_model(lang)
+
+    def warmup(self, langs: List[str], text: str = None):
+        """Load the models of the given languages and run each of them once, so that the first
+        real text does not pay for lazy initializations.
+
+        Args:
+            langs (List[str]): The language codes, as detected by langdetect.
+            text (str): The text each model is run on. If None, WARMUP_TEXT is used.
+        """
+        for lang in langs:
+            self._split_with_model(self._load_model(lang), text or self.WARMUP_TEXT)
 
-    def split(self, text: str) -> List[str]:
+
+    def split(self, text: str, lang: str = None) -> List[str]:
         """Split the given text into text parts based on semantic rules.
         This method overrides the split method from BaseTextSplitter and uses the
         _split method to perform the actual splitting. It handles large texts by
@@ -44,30 +134,224 @@ class BaseSemanticTextSplitter(BaseTextSplitter):
         
         Args:
             text (str): The text to be split.
+            lang (str): The language of the text. If None, it is detected.
         Returns:
             List[str]: A list of text parts.
         """
-        super()._validate_text(text)
-        text_parts = []
-        len_last_part = 0
-
-        for i in range(0, len(text), self.text_limit):
-            j = i - len_last_part
-            partial_text = text[j : i + self.text_limit]
-            text_parts.extend(self._split(partial_text))
-            if i < (len(text) - self.text_limit):  # if it's not the last iteration
-                # Find the index of the last split part within the partial_text, starting from the end.
-                # This ensures we account for delimiters, spaces, or any semantic split logic.
-                last_part = text_parts.pop() if text_parts else ""
-                # Search for the last_part at the end of partial_text
-                idx = partial_text.rfind(last_part)
-                if idx != -1:
-                    # Compute the length of the last part based on its position in partial_text
-                    # This ensures that we correctly handle cases where the last part is not at the end of partial_text
-                    # (because of spaces, delimiters, or anything else) and we need to adjust the length accordingly.
-                    len_last_part = len(partial_text) - idx
+        return self.split_many([text], [lang])[0]
+
+    def split_many(self, texts: List[str], langs: List[str] = None) -> List[List[str]]:
+        """Split many texts at once, with the same windowing and results of split.
+
+        The texts are processed in rounds: each round gathers the next text_limit window of every text
+        which is not over yet and passes all of them to _split_batch, so that subclasses can batch them
+        through their model. A window starts with the last (possibly incomplete) part of the previous window
+        of the same text, so the rounds keep each text in order. The language of each text is detected once,
+        unless given.
+
+        With BULK_WINDOWS, the windows are not split round by round but all at once: the part carried over by each
+        window is guessed first, by splitting the last TAIL_GUESS_SIZE characters of all the windows in bulk, then
+        all the windows starting at the guessed offsets are split in bulk. Finally, windows are stitched in order as
+        in the rounds, and the (rare) windows whose actual start differs from the guessed one are split again,
+        so the results are exactly the same.
+
+        Args:
+            texts (List[str]): The texts to be split.
+            langs (List[str]): The language of each text, None where it has to be detected.
+        Returns:
+            List[List[str]]: The text parts of each text, in the same order.
+        """
+        langs = self._validate_texts(texts, langs)
+        if self.windowing == "pre_boundary":
+            return [[text[start:end] for start, end in spans]
+                    for text, spans in zip(texts, self._split_spans_pre_boundary(texts, langs))]
+        if self.BULK_WINDOWS and any(len(text) > self.text_limit for text in texts):
+            return self._split_many_in_bulk(texts, langs)
+
+        texts_parts = [[] for _ in texts]
+        len_last_parts = [0] * len(texts)
+
+        for i in range(0, max(map(len, texts), default=0), self.text_limit):
+            text_idxs = [text_idx for text_idx, text in enumerate(texts) if i < len(text)]
+            partial_texts = [texts[text_idx][i - len_last_parts[text_idx] : i + self.text_limit]
+                             for text_idx in text_idxs]
+            partial_texts_parts = self._split_batch(partial_texts, [langs[text_idx] for text_idx in text_idxs])
+            for text_idx, partial_text, partial_text_parts in zip(text_idxs, partial_texts, partial_texts_parts):
+                text, text_parts = texts[text_idx], texts_parts[text_idx]
+                text_parts.extend(partial_text_parts)
+                if i < (len(text) - self.text_limit):  # if it's not the last iteration
+                    len_last_parts[text_idx] = self._carry_last_part(text_parts, partial_text)
+
+        return texts_parts
+
+    def _split_many_in_bulk(self, texts: List[str], langs: List[Optional[str]]) -> List[List[str]]:
+        # Windows are identified by (text index, i), i being the offset where the window would start without carry-over
+        guess_size = min(self.text_limit, self.TAIL_GUESS_SIZE)
+        carried_windows = [(text_idx, i) for text_idx, text in enumerate(texts)
+                           for i in range(0, len(text), self.text_limit) if i < (len(text) - self.text_limit)]
+        tails = [texts[text_idx][i + self.text_limit - guess_size : i + self.text_limit]
+                 for text_idx, i in carried_windows]
+        tails_parts = self._split_batch(tails, [langs[text_idx] for text_idx, _ in carried_windows])
+        guessed_starts = dict()  # offset where each window but the first of a text is guessed to start
+        for (text_idx, i), tail, tail_parts in zip(carried_windows, tails, tails_parts):
+            next_i = i + self.text_limit
+            guessed_starts[(text_idx, next_i)] = next_i - self._carry_last_part(list(tail_parts), tail)
+
+        windows = [(text_idx, i) for text_idx, text in enumerate(texts) for i in range(0, len(text), self.text_limit)]
+        partial_texts = [texts[text_idx][guessed_starts.get((text_idx, i), i) : i + self.text_limit]
+                         for text_idx, i in windows]
+        partial_texts_parts = self._split_batch(partial_texts, [langs[text_idx] for text_idx, _ in windows])
+        partial_texts_parts = dict(zip(windows, partial_texts_parts))
+
+        texts_parts = []
+        for text_idx, text in enumerate(texts):
+            text_parts = []
+            len_last_part = 0
+            for i in range(0, len(text), self.text_limit):
+                start = i - len_last_part
+                partial_text = text[start : i + self.text_limit]
+                if start == guessed_starts.get((text_idx, i), i):
+                    text_parts.extend(partial_texts_parts[(text_idx, i)])
                 else:
-                    # Fallback: use the length of last_part
-                    len_last_part = len(last_part)
+                    text_parts.extend(self._split_batch([partial_text], [langs[text_idx]])[0])
+                if i < (len(text) - self.text_limit):  # if it's not the last iteration
+                    len_last_part = self._carry_last_part(text_parts, partial_text)
+            texts_parts.append(text_parts)
+        return texts_parts
+
+    @staticmethod
+    def _carry_last_part(text_parts: List[str], partial_text: str) -> int:
+        # Remove the last (possibly incomplete) part from text_parts and return its length within partial_text,
+        # since it is carried over to the next window.
+        # Find the index of the last split part within the partial_text, starting from the end.
+        # This ensures we account for delimiters, spaces, or any semantic split logic.
+        last_part = text_parts.pop() if text_parts else ""
+        # Search for the last_part at the end of partial_text
+        idx = partial_text.rfind(last_part)
+        if idx != -1:
+            # Compute the length of the last part based on its position in partial_text
+            # This ensures that we correctly handle cases where the last part is not at the end of partial_text
+            # (because of spaces, delimiters, or anything else) and we need to adjust the length accordingly.
+            return len(partial_text) - idx
+        # Fallback: use the length of last_part
+        return len(last_part)
+
+    def split_spans_many(self, texts: List[str], langs: List[str] = None) -> List[List[Tuple[int, int]]]:
+        """Split many texts at once (see split_many) and return the (start, end) offsets of each text part.
+
+        Args:
+            texts (List[str]): The texts to be split.
+            langs (List[str]): The language of each text, None where it has to be detected.
+        Returns:
+            List[List[Tuple[int, int]]]: The offsets of the text parts within each text, in the same order.
+        """
+        if self.windowing == "pre_boundary":
+            return self._split_spans_pre_boundary(texts, self._validate_texts(texts, langs))
+        return [self._locate_text_parts(text, text_parts, 0, len(text))
+                for text, text_parts in zip(texts, self.split_many(texts, langs))]
+
+    def split_spans(self, text: str, start: int = 0, end: int = None) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] and return the (start, end) offsets of each text part within text.
+        With the "pre_boundary" windowing, the offsets are the exact ones of the sentences.
+
+        Args:
+            text (str): The source text.
+            start (int): The offset where the text to be split starts.
+            end (int): The offset where the text to be split ends. If None, the end of text.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) offsets of each text part within text.
+        """
+        if self.windowing != "pre_boundary":
+            return super().split_spans(text, start, end)
+        end = len(text) if end is None else end
+        spans = self.split_spans_many([text[start:end]])[0]
+        return [(start + span_start, start + span_end) for span_start, span_end in spans]
+
+    async def asplit_spans(self, text: str, start: int = 0, end: int = None) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] from a coroutine, see split_spans.
+        The models run in a thread, so the event loop is not blocked meanwhile.
+
+        Args:
+            text (str): The source text.
+            start (int): The offset where the text to be split starts.
+            end (int): The offset where the text to be split ends. If None, the end of text.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, end) offsets of each text part within text.
+        """
+        return await asyncio.to_thread(self.split_spans, text, start, end)
+
+    async def asplit_spans_many(self, texts: List[str], langs: List[str] = None) -> List[List[Tuple[int, int]]]:
+        """Split many texts at once from a coroutine, see split_spans_many.
+        The models run in a thread, so the event loop is not blocked meanwhile.
+
+        Args:
+            texts (List[str]): The texts to be split.
+            langs (List[str]): The language of each text, None where it has to be detected.
+        Returns:
+            List[List[Tuple[int, int]]]: The offsets of the text parts within each text, in the same order.
+        """
+        return await asyncio.to_thread(self.split_spans_many, texts, langs)
+
+    def _validate_texts(self, texts: List[str], langs: Optional[List[str]]) -> List[Optional[str]]:
+        # Validate the texts and return the language of each of them
+        for text in texts:
+            super()._validate_text(text)
+        return [lang or self._detect_language(text) for text, lang in zip(texts, langs or [None] * len(texts))]
+
+    def _pre_boundary_windows(self, text: str) -> List[Tuple[int, int]]:
+        # Cut the text in windows of at most text_limit characters, after the last pre-boundary of each window
+        windows = []
+        start = 0
+        while len(text) - start > self.text_limit:
+            end = start + self.text_limit
+            for pre_boundary in self.PRE_BOUNDARIES:
+                idx = text.rfind(pre_boundary, start, end)
+                if idx != -1:
+                    end = idx + len(pre_boundary)
+                    break
+            windows.append((start, end))
+            start = end
+        windows.append((start, len(text)))
+        return windows
+
+    def _split_spans_pre_boundary(self, texts: List[str], langs: List[Optional[str]]) -> List[List[Tuple[int, int]]]:
+        windows = [(text_idx, start, end) for text_idx, text in enumerate(texts)
+                   for start, end in self._pre_boundary_windows(text)]
+        partial_texts = [texts[text_idx][start:end] for text_idx, start, end in windows]
+        partial_langs = [langs[text_idx] for text_idx, _, _ in windows]
+
+        if self.workers == 1 or len(windows) == 1:
+            partial_texts_spans = self._split_spans_batch(partial_texts, partial_langs)
+        else:
+            # Contiguous slices of windows, so that results are concatenated back in order
+            slice_size = -(-len(windows) // self.workers)
+            slices = [slice(i, i + slice_size) for i in range(0, len(windows), slice_size)]
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                slices_spans = pool.map(lambda s: self._split_spans_batch(partial_texts[s], partial_langs[s]), slices)
+                partial_texts_spans = [spans for slice_spans in slices_spans for spans in slice_spans]
+
+        # Each text part goes from the start of a sentence to the start of the next one
+        sentence_starts = [[] for _ in texts]
+        for (text_idx, offset, _), partial_text, spans in zip(windows, partial_texts, partial_texts_spans):
+            sentence_starts[text_idx].extend(offset + start for start, end in spans if partial_text[start:end].strip())
+
+        texts_spans = []
+        for text, starts in zip(texts, sentence_starts):
+            # Leading whitespace is dropped, as when locating text parts
+            first_start = len(text) - len(text.lstrip())
+            starts = sorted({start for start in starts if start > first_start} | {first_start})
+            texts_spans.append(list(zip(starts, starts[1:] + [len(text)])))
+        return texts_spans
+
+    def _split_spans_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[Tuple[int, int]]]:
+        # Locate the text parts of each text: subclasses backed by a model override this with the exact offsets
+        return [self._locate_text_parts(text, text_parts, 0, len(text))
+                for text, text_parts in zip(texts, self._split_batch(texts, langs))]
 
-        return text_parts
\ No newline at end of file
+    def _split_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[str]]:
+        # Split each window on its own: subclasses backed by a model override this to batch them
+        return [self._split(text) for text in texts]
\ No newline at end of file
@@ -0,0 +1,107 @@
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from chunkipy.utils import import_dependencies
+
+
+class BaseLanguageDetector(ABC):
+    """
+    Base class for the language detectors used by semantic text splitters.
+
+    The language is detected once per document, on a bounded sample of it: texts longer than sample_size
+    are sampled at their beginning, middle and end. Results are kept in an LRU cache keyed by
+    a hash of the whole text, so detecting the same document again costs a hash.
+    Subclasses implement _detect, e.g. to plug in a faster detector than langdetect.
+
+    Args:
+        sample_size (int): The maximum number of characters the detection runs on.
+        max_entries (int): The maximum number of cached results.
+    """
+    DEFAULT_SAMPLE_SIZE = 3000
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be a positive integer. Current value: {sample_size}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer. Current value: {max_entries}")
+        self.sample_size = sample_size
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+
+    def detect(self, text: str) -> str:
+        """
+        Detect the language of the text.
+
+        Args:
+            text (str): The text, usually a whole document.
+
+        Returns:
+            str: The language code, as the ones returned by langdetect (e.g. "en", "zh-cn").
+        """
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            lang = self._cache.get(key)
+            if lang is not None:
+                self._cache.move_to_end(key)
+                return lang
+
+        lang = self._detect(self._sample(text))
+
+        with self._lock:
+            self._cache[key] = lang
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return lang
+
+    def _sample(self, text: str) -> str:
+        if len(text) <= self.sample_size:
+            return text
+        # Beginning, middle and end of the text, to be robust to titles, headers, ...
+        size = self.sample_size // 3
+        middle = (len(text) - size) // 2
+        return "\n".join([text[:size], text[middle:middle + size], text[-size:]])
+
+    @abstractmethod
+    def _detect(self, text: str) -> str:
+        raise NotImplementedError("Subclasses must implement the _detect method.")
+
+    def __getstate__(self):
+        # Locks cannot be pickled: the cache is not shipped, only the configuration
+        state = self.__dict__.copy()
+        state.update(_lock=None, _cache=OrderedDict())
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class LangdetectLanguageDetector(BaseLanguageDetector):
+    """
+    Language detector based on langdetect.
+
+    langdetect is nondeterministic unless its seed is fixed: the seed is set before each detection,
+    so the same text is always detected as the same language.
+
+    Args:
+        seed (int): The seed of langdetect.
+        sample_size (int): The maximum number of characters the detection runs on.
+        max_entries (int): The maximum number of cached results.
+    """
+
+    def __init__(self, seed: int = 0, sample_size: int = BaseLanguageDetector.DEFAULT_SAMPLE_SIZE,
+                 max_entries: int = BaseLanguageDetector.DEFAULT_MAX_ENTRIES):
+        super().__init__(sample_size, max_entries)
+        self.seed = seed
+
+    def _detect(self, text: str) -> str:
+        langdetect = import_dependencies(
+            extra="langdetect",
+            package_name="langdetect"
+        )
+        langdetect.DetectorFactory.seed = self.seed
+        return langdetect.detect(text)
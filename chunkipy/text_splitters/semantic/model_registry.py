@@ -0,0 +1,228 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+ModelKey = Tuple[str, str, Tuple[Tuple[str, Hashable], ...]]
+
+ModelInfo = namedtuple("ModelInfo", ["library", "model_name", "config", "load_time", "resident_size", "hits"])
+
+RegistryInfo = namedtuple("RegistryInfo", ["hits", "loads", "evictions", "models", "resident_size"])
+
+
+def _resident_memory() -> int:
+    # Resident set size of the current process in bytes, 0 if it cannot be measured
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if os.uname().sysname == "Darwin" else max_rss * 1024  # bytes on macOS, KiB elsewhere
+    except (ImportError, AttributeError, OSError):
+        return 0
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of the NLP models (spaCy pipelines, Stanza pipelines, ...) used by semantic text splitters.
+
+    Models are keyed by (library, model name, configuration), so splitter instances needing the same model
+    share a single copy of it. The registry is bounded by the number of models and by their resident size,
+    i.e. the growth of the process resident memory while loading them: the least recently used models
+    are evicted first. Models are loaded outside of the registry lock, so a cold load never blocks the threads
+    getting other models; a model requested by several threads at once is still loaded once, the other threads
+    waiting for that load. The resident size of models loaded concurrently is approximate.
+
+    Args:
+        max_models (int): The maximum number of loaded models. If None, the number of models is unbounded.
+        max_memory (int): The maximum resident size of the loaded models, in bytes. If None, the memory is unbounded.
+
+    Attributes:
+        hits (int): The number of models served from the registry.
+        loads (int): The number of models loaded.
+        evictions (int): The number of models evicted from the registry.
+    """
+
+    def __init__(self, max_models: int = None, max_memory: int = None):
+        if max_models is not None and max_models < 1:
+            raise ValueError(f"max_models must be a positive integer. Current value: {max_models}")
+        if max_memory is not None and max_memory < 1:
+            raise ValueError(f"max_memory must be a positive integer. Current value: {max_memory}")
+        self.max_models = max_models
+        self.max_memory = max_memory
+        self._lock = threading.RLock()
+        self._models: "OrderedDict[ModelKey, Any]" = OrderedDict()
+        self._infos: Dict[ModelKey, ModelInfo] = dict()
+        self._loading: Dict[ModelKey, Future] = dict()  # Models being loaded, awaited by the other threads
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(library: str, model_name: str, config: Dict[str, Hashable] = None) -> ModelKey:
+        """
+        Build the key of a model.
+
+        Args:
+            library (str): The library the model belongs to, e.g. "spacy" or "stanza".
+            model_name (str): The name of the model, e.g. "en_core_web_sm" or "en".
+            config (Dict[str, Hashable]): The options the model is loaded with.
+
+        Returns:
+            ModelKey: The hashable key of the model.
+        """
+        return library, model_name, tuple(sorted((config or {}).items()))
+
+    def get(self, library: str, model_name: str, loader: Callable[[], Any], config: Dict[str, Hashable] = None) -> Any:
+        """
+        Get a model, loading it with the loader if it is not in the registry.
+
+        Args:
+            library (str): The library the model belongs to, e.g. "spacy" or "stanza".
+            model_name (str): The name of the model.
+            loader (Callable[[], Any]): Loads the model, when it is not in the registry.
+            config (Dict[str, Hashable]): The options the model is loaded with, as part of its key.
+
+        Returns:
+            Any: The model.
+        """
+        key = self.make_key(library, model_name, config)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self._infos[key] = self._infos[key]._replace(hits=self._infos[key].hits + 1)
+                self.hits += 1
+                return model
+            loading = self._loading.get(key)
+            if loading is None:
+                self._loading[key] = future = Future()
+
+        if loading is not None:  # Loaded by another thread: wait for it, raising its error if it fails
+            model = loading.result()
+            with self._lock:
+                self.hits += 1
+            return model
+
+        try:
+            memory_before = _resident_memory()
+            start = time.perf_counter()
+            model = loader()
+            load_time = time.perf_counter() - start
+            resident_size = max(_resident_memory() - memory_before, 0)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+        logging.debug(f"Loaded {library} model '{model_name}' in {load_time:.2f}s ({resident_size} bytes)")
+
+        with self._lock:
+            self._models[key] = model
+            self._infos[key] = ModelInfo(library, model_name, key[2], load_time, resident_size, 0)
+            self.loads += 1
+            del self._loading[key]
+            self._evict(keep=key)
+        future.set_result(model)
+        return model
+
+    def preload(self, models: List[Tuple[str, str, Callable[[], Any]]]):
+        """
+        Load the given models ahead of time, e.g. at service startup, to avoid cold starts.
+
+        Args:
+            models (List[Tuple[str, str, Callable[[], Any]]]): (library, model name, loader) of each model,
+                or (library, model name, loader, config).
+        """
+        for model in models:
+            self.get(*model)
+
+    def __contains__(self, key: ModelKey) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    @property
+    def resident_size(self) -> int:
+        """The resident size of the loaded models, in bytes."""
+        return sum(info.resident_size for info in self._infos.values())
+
+    def model_info(self) -> List[ModelInfo]:
+        """Returns the load time, resident size and hits of each loaded model, from the least recently used.
+
+        Returns:
+            List[ModelInfo]: The statistics of the loaded models.
+        """
+        with self._lock:
+            return [self._infos[key] for key in self._models]
+
+    def registry_info(self) -> RegistryInfo:
+        """Returns the registry statistics.
+
+        Returns:
+            RegistryInfo: The number of hits, loads, evictions, loaded models and their resident size.
+        """
+        return RegistryInfo(self.hits, self.loads, self.evictions, len(self._models), self.resident_size)
+
+    def evict(self, key: ModelKey) -> bool:
+        """
+        Remove a model from the registry.
+
+        Args:
+            key (ModelKey): The key of the model, as built by make_key.
+
+        Returns:
+            bool: Whether the model was in the registry.
+        """
+        with self._lock:
+            if key not in self._models:
+                return False
+            del self._models[key]
+            del self._infos[key]
+            self.evictions += 1
+            return True
+
+    def clear(self):
+        """Removes all the models and resets the registry statistics."""
+        with self._lock:
+            self._models.clear()
+            self._infos.clear()
+            self.hits = self.loads = self.evictions = 0
+
+    def _evict(self, keep: ModelKey):
+        # Evict the least recently used models, but never the one just loaded
+        while len(self._models) > 1 and (
+                (self.max_models is not None and len(self._models) > self.max_models)
+                or (self.max_memory is not None and self.resident_size > self.max_memory)):
+            key = next(iter(self._models))
+            if key == keep:
+                break
+            logging.debug(f"Evicting {key[0]} model '{key[1]}'")
+            self.evict(key)
+
+    def __reduce__(self):
+        # Models and locks are not pickled: the default registry stays the default one in the
+        # unpickling process (e.g. a worker), any other registry is rebuilt empty
+        if self is _default_model_registry:
+            return get_default_model_registry, ()
+        return self.__class__, (self.max_models, self.max_memory)
+
+
+_default_model_registry = ModelRegistry()
+
+
+def get_default_model_registry() -> ModelRegistry:
+    """Returns the process-wide registry used by semantic text splitters when none is given.
+
+    Returns:
+        ModelRegistry: The default model registry.
+    """
+    return _default_model_registry
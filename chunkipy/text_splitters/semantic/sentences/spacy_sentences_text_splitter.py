@@ -1,6 +1,11 @@
+import importlib
 import logging
-from typing import Dict, List
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from chunkipy.text_splitters.semantic.base_semantic_text_splitter import BaseSemanticTextSplitter
+from chunkipy.text_splitters.semantic.language_detection import BaseLanguageDetector, LangdetectLanguageDetector
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry
 
 
 from chunkipy.utils import MissingDependencyError, import_dependencies
@@ -20,22 +25,54 @@ class SpacySentenceTextSplitter(BaseSemanticTextSplitter):
     This class uses spaCy to split text into sentences based on the language detected in the text.
     It supports multiple languages by loading different spaCy models based on the detected language.
     If the language is not supported, it defaults to English.
+    The language is detected once per text (by default with langdetect), unless given with lang.
+    Models are loaded through the model registry, so splitters sharing it share a single copy of each model.
+    The text_limit windows of a text (and of all the texts, in split_many) are grouped by language
+    and streamed through nlp.pipe.
+
+    With the "full" load profile, the whole pipeline is loaded and the pipes not needed for sentence boundaries
+    are disabled on each call. With the "lean" load profile, they are excluded at load time: only the senter
+    is loaded when the model has one (with the tok2vec it listens to, if any), otherwise the parser and its tok2vec.
+    Lean models take less memory and are faster, but senter boundaries may slightly differ from the parser ones.
     
     Attributes:
-        models (Dict[str, str]): A dictionary mapping language codes to spaCy model names.
+        model_registry (ModelRegistry): The registry the spaCy models are loaded through.
         models_map (Dict[str, str]): A dictionary mapping language codes to spaCy model names.
         text_limit (int): The maximum length of text to process at once. If None, DEFAULT_LIMIT from base class is applied.    
+        batch_size (int): The number of texts buffered by nlp.pipe in split_many.
+        n_process (int): The number of processes used by nlp.pipe in split_many.
+        load_profile (str): Either "full" or "lean".
+        language_detector (BaseLanguageDetector): Detects the language of each text. Defaults to langdetect.
+        lang (str): The language of all the texts, when known: no language is detected.
+        windowing (str): Either "carry" or "pre_boundary" (see BaseSemanticTextSplitter).
+        workers (int): The number of threads splitting the windows with the "pre_boundary" windowing.
     """
     
     DEFAULT_LANG = "en"
     DEFAULT_MODELS_MAP = {
         "en": "en_core_web_sm"
     }
+    DEFAULT_BATCH_SIZE = 32
+    BULK_WINDOWS = True
+    SENTENCE_PIPES = ["tok2vec", "parser", "senter"]
+    LOAD_PROFILES = ("full", "lean")
 
-    def __init__(self, models_map: Dict [str, str] = DEFAULT_MODELS_MAP, text_limit: int = None):
-        super().__init__(text_limit)
+    def __init__(self, models_map: Dict [str, str] = DEFAULT_MODELS_MAP, text_limit: int = None,
+                 model_registry: ModelRegistry = None, batch_size: int = DEFAULT_BATCH_SIZE, n_process: int = 1,
+                 load_profile: str = "full", language_detector: BaseLanguageDetector = None, lang: str = None,
+                 windowing: str = "carry", workers: int = 1):
+        language_detector = language_detector if language_detector is not None else LangdetectLanguageDetector()
+        super().__init__(text_limit, model_registry, language_detector, lang, windowing, workers)
+        if load_profile not in self.LOAD_PROFILES:
+            raise ValueError(f"load_profile must be one of {self.LOAD_PROFILES}. Current value: {load_profile}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer. Current value: {batch_size}")
+        if n_process == 0 or n_process < -1:
+            raise ValueError(f"n_process must be a positive integer or -1 (all the CPUs). Current value: {n_process}")
         self.models_map = models_map
-        self.models = dict()
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.load_profile = load_profile
 
     def _load_model(self, lang: str):
         spacy = import_dependencies(
@@ -48,21 +85,68 @@ class SpacySentenceTextSplitter(BaseSemanticTextSplitter):
             logging.warning(
                 f"Language '{lang}' not supported. Defaulting to '{self.DEFAULT_LANG}'. If you want to use a different language, please provide a valid model name in the 'models_map' parameter, e.g. models_map['it'] = 'it_core_news_sm'."
             )
-        if lang not in self.models:
+        model_name = self.models_map[lang]
+
+        def load_model():
             try:
-                self.models[lang] = spacy.load(self.models_map[lang])
+                if self.load_profile == "full":
+                    return spacy.load(model_name)
+                sentence_tokenizer = spacy.load(model_name, exclude=self._lean_exclude(spacy, model_name))
+                if "senter" in sentence_tokenizer.disabled:
+                    sentence_tokenizer.enable_pipe("senter")
+                return sentence_tokenizer
             except OSError as e:
-                raise MissingDependencyError(SPACY_INSTRUCTIONS.format(model_name=self.models_map[lang])) from e
-        return self.models[lang]
+                raise MissingDependencyError(SPACY_INSTRUCTIONS.format(model_name=model_name)) from e
 
+        return self.model_registry.get("spacy", model_name, load_model, config={"load_profile": self.load_profile})
 
-    def _split(self, text: str) -> List[str]:
-        langdetect = import_dependencies(
-            extra="langdetect", 
-            package_name="langdetect"
-        )
-        lang = langdetect.detect(text)
-        sentence_tokenizer = self._load_model(lang)
-        with sentence_tokenizer.select_pipes(enable=["tok2vec", "parser", "senter"]):
+    @staticmethod
+    def _model_data_path(spacy, model_name: str) -> Path:
+        # The folder holding config.cfg, either inside an installed model package or given as a path
+        if not spacy.util.is_package(model_name):
+            return Path(model_name)
+        package_path = Path(importlib.import_module(model_name).__file__).parent
+        meta = spacy.util.get_model_meta(package_path)
+        return package_path / f"{meta['lang']}_{meta['name']}-{meta['version']}"
+
+    def _lean_exclude(self, spacy, model_name: str) -> List[str]:
+        # The components not needed for sentence boundaries, read from the config without loading the model
+        config = spacy.util.load_config(self._model_data_path(spacy, model_name) / "config.cfg")
+        components = list(config["nlp"]["pipeline"])
+        if "senter" in components:
+            keep = {"senter"}
+            if "Listener" in str(config["components"]["senter"]):
+                keep.update({"tok2vec", "transformer"})
+        else:
+            keep = {"tok2vec", "transformer", "parser"}
+        return [component for component in components if component not in keep]
+
+    def _sentence_pipes(self, sentence_tokenizer):
+        # Lean models only have the sentence pipes, full models run them alone
+        if self.load_profile == "lean":
+            return nullcontext()
+        return sentence_tokenizer.select_pipes(enable=self.SENTENCE_PIPES)
+
+    def _split_with_model(self, sentence_tokenizer, text: str) -> List[str]:
+        with self._sentence_pipes(sentence_tokenizer):
             doc = sentence_tokenizer(text)
-        return [s.text + " " for s in doc.sents]
\ No newline at end of file
+        return [s.text + " " for s in doc.sents]
+
+    def _process_batch(self, texts: List[str], langs: List[Optional[str]]) -> list:
+        docs = [None] * len(texts)
+        for sentence_tokenizer, text_idxs in self._group_by_model(texts, langs):
+            with self._sentence_pipes(sentence_tokenizer):
+                model_docs = sentence_tokenizer.pipe((texts[text_idx] for text_idx in text_idxs),
+                                                     batch_size=self.batch_size, n_process=self.n_process)
+                for text_idx, doc in zip(text_idxs, model_docs):
+                    docs[text_idx] = doc
+        return docs
+
+    def _split_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[str]]:
+        return [[s.text + " " for s in doc.sents] for doc in self._process_batch(texts, langs)]
+
+    def _split_spans_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[Tuple[int, int]]]:
+        return [[(s.start_char, s.end_char) for s in doc.sents] for doc in self._process_batch(texts, langs)]
+
+    def _split(self, text: str) -> List[str]:
+        return self._split_with_model(self._load_model(self._detect_language(text)), text)
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import List
+from typing import List, Optional, Tuple
 from chunkipy.text_splitters.semantic.base_semantic_text_splitter import BaseSemanticTextSplitter
+from chunkipy.text_splitters.semantic.language_detection import BaseLanguageDetector, LangdetectLanguageDetector
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry
 from chunkipy.utils import import_dependencies
 
 
@@ -7,9 +9,21 @@ class StanzaSentenceTextSplitter(BaseSemanticTextSplitter):
     """Sentence splitter using Stanza for semantic text splitting.
     This class uses Stanza to split text into sentences based on the language detected in the text.
     It supports multiple languages by loading different Stanza models based on the detected language.
+    The language is detected once per text (by default with langdetect), unless given with lang.
+    All the text_limit windows of a text (and of all the texts, in split_many) are processed in bulk,
+    grouped by language, as a list of Stanza Documents.
+    Each Stanza Pipeline is built once per language, in the model registry, and reused by all the following calls
+    (and text_limit windows) of all the splitters sharing the registry.
     
     Attributes:
         text_limit (int): The maximum length of text to process at once. If None, DEFAULT_LIMIT from base class is applied.
+        preload_langs (List[str]): The languages (langdetect codes) whose pipelines are loaded at construction,
+            instead of on first use.
+        model_registry (ModelRegistry): The registry the pipelines are loaded through.
+        language_detector (BaseLanguageDetector): Detects the language of each text. Defaults to langdetect.
+        lang (str): The language of all the texts (langdetect code), when known: no language is detected.
+        windowing (str): Either "carry" or "pre_boundary" (see BaseSemanticTextSplitter).
+        workers (int): The number of threads splitting the windows with the "pre_boundary" windowing.
         
     """
 
@@ -77,23 +91,56 @@ class StanzaSentenceTextSplitter(BaseSemanticTextSplitter):
     }
 
 
-    def _split(self, text: str) -> List[str]:
-        langdetect = import_dependencies(
-            extra="langdetect", 
-            package_name="langdetect"
-        )
-        _, DownloadMethod, Pipeline = import_dependencies(
-            extra="sentence",
-            package_name="stanza",
-            attribute_names=["DownloadMethod", "Pipeline"]
-        )
-        lang = langdetect.detect(text)
-        
+    PROCESSORS = "tokenize"
+    BULK_WINDOWS = True
+
+    def __init__(self, text_limit: int = None, preload_langs: List[str] = None, model_registry: ModelRegistry = None,
+                 language_detector: BaseLanguageDetector = None, lang: str = None,
+                 windowing: str = "carry", workers: int = 1):
+        language_detector = language_detector if language_detector is not None else LangdetectLanguageDetector()
+        super().__init__(text_limit, model_registry, language_detector, lang, windowing, workers)
+        self.preload_langs = list(preload_langs or [])
+        self.preload(self.preload_langs)
+
+    def _load_model(self, lang: str):
         stanza_lang = self.langdetect_stanza_mapping.get(lang, None)
         if stanza_lang is None:
             raise ValueError(f"Language '{lang}' is not supported by Stanza for sentence splitting.")
-        
-        sentence_tokenizer = Pipeline(
-            lang=stanza_lang, processors="tokenize", download_method=DownloadMethod.REUSE_RESOURCES
-        )
+
+        def load_pipeline():
+            _, DownloadMethod, Pipeline = import_dependencies(
+                extra="sentence",
+                package_name="stanza",
+                attribute_names=["DownloadMethod", "Pipeline"]
+            )
+            return Pipeline(
+                lang=stanza_lang, processors=self.PROCESSORS, download_method=DownloadMethod.REUSE_RESOURCES
+            )
+
+        return self.model_registry.get("stanza", stanza_lang, load_pipeline, config={"processors": self.PROCESSORS})
+
+    def _split_with_model(self, sentence_tokenizer, text: str) -> List[str]:
         return [s.text + " " for s in sentence_tokenizer(text).sentences]
+
+    def _process_batch(self, texts: List[str], langs: List[Optional[str]]) -> list:
+        _, Document = import_dependencies(
+            extra="sentence",
+            package_name="stanza",
+            attribute_names=["Document"]
+        )
+        processed_documents = [None] * len(texts)
+        for pipeline, text_idxs in self._group_by_model(texts, langs):
+            documents = [Document([], text=texts[text_idx]) for text_idx in text_idxs]
+            for text_idx, document in zip(text_idxs, pipeline.bulk_process(documents)):
+                processed_documents[text_idx] = document
+        return processed_documents
+
+    def _split_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[str]]:
+        return [[s.text + " " for s in document.sentences] for document in self._process_batch(texts, langs)]
+
+    def _split_spans_batch(self, texts: List[str], langs: List[Optional[str]]) -> List[List[Tuple[int, int]]]:
+        return [[(s.tokens[0].start_char, s.tokens[-1].end_char) for s in document.sentences if s.tokens]
+                for document in self._process_batch(texts, langs)]
+
+    def _split(self, text: str) -> List[str]:
+        return self._split_with_model(self._load_model(self._detect_language(text)), text)
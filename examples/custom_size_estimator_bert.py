@@ -16,6 +16,10 @@ if __name__ == "__main__":
         def estimate_size(self, text):
             return len(self.bert_tokenizer.encode(text))
 
+        def estimate_sizes(self, texts):
+            # fast tokenizers encode a whole batch at once, in parallel (Rust)
+            return [len(input_ids) for input_ids in self.bert_tokenizer(texts)["input_ids"]]
+
 
     word_size_estimator = WordSizeEstimator()
     bert_size_estimator = BertSizeEstimator()
@@ -0,0 +1,21 @@
+from chunkipy import TextChunker
+from chunkipy.size_estimators import HuggingFaceSizeEstimator
+
+
+if __name__ == "__main__":
+
+    with open("examples/texts/napoleon.txt", "r") as file:
+        text = file.read()
+
+    # the tokenizer.json of the model, e.g. downloaded from the HuggingFace Hub
+    bert_size_estimator = HuggingFaceSizeEstimator("bert-base-uncased/tokenizer.json")
+
+    print(f"Num of chars: {len(text)}")
+    print(f"Num of tokens (using HuggingFaceSizeEstimator): {bert_size_estimator.estimate_size(text)}")
+
+    # the text is tokenized once, and the size of each text part is derived from the token offsets
+    text_chunker = TextChunker(512, size_estimator=bert_size_estimator, tokenize_once=True)
+    chunks = text_chunker.chunk(text)
+
+    for i, chunk in enumerate(chunks):
+        print(f"Chunk {i + 1}: {chunk}")
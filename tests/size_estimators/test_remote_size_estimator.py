@@ -0,0 +1,167 @@
+import asyncio
+import os
+import pickle
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from chunkipy import TextChunker
+from chunkipy.size_estimators import (
+    RemoteSizeEstimationError,
+    RemoteSizeEstimator,
+    SizeEstimatorServer,
+    WordSizeEstimator
+)
+
+
+class SlowWordSizeEstimator(WordSizeEstimator):
+    def __init__(self, delay=0.05, failures=0):
+        self.delay = delay
+        self.failures = failures
+
+    def estimate_sizes(self, texts):
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("tokenizer not ready")
+        return super().estimate_sizes(texts)
+
+
+class TestRemoteSizeEstimator(unittest.TestCase):
+
+    def setUp(self):
+        self.server = SizeEstimatorServer(WordSizeEstimator()).start()
+        self.estimator = RemoteSizeEstimator(self.server.url)
+
+    def tearDown(self):
+        self.estimator.close()
+        self.server.stop()
+
+    def test_estimate_sizes(self):
+        self.assertEqual(self.estimator.estimate_size("Hello remote world"), 3)
+        self.assertEqual(self.estimator.estimate_sizes(["a b", "", "c d e"]), [2, 0, 3])
+        self.assertEqual(self.estimator.estimate_sizes([]), [])
+
+    def test_connection_is_kept_alive(self):
+        for _ in range(5):
+            self.estimator.estimate_size("Hello")
+        self.assertEqual(self.estimator.requests, 5)
+        self.assertEqual(len(self.estimator._idle_connections), 1)
+
+    def test_large_calls_are_split(self):
+        estimator = RemoteSizeEstimator(self.server.url, max_batch_size=2)
+        self.assertEqual(estimator.estimate_sizes(["a", "b c", "d", "e f g", "h"]), [1, 2, 1, 3, 1])
+        self.assertEqual(estimator.requests, 3)
+
+    def test_unknown_path_is_not_retried(self):
+        estimator = RemoteSizeEstimator(self.server.url + "/unknown", retries=3)
+        with self.assertRaises(RemoteSizeEstimationError):
+            estimator.estimate_size("Hello")
+        self.assertEqual(estimator.requests, 1)
+
+    def test_chunk_matches_local_estimator(self):
+        text = "This is a sentence, with a comma; and a semicolon: and a colon. " * 5
+        remote_chunks = TextChunker(chunk_size=10, size_estimator=self.estimator).chunk(text)
+        local_chunks = TextChunker(chunk_size=10, size_estimator=WordSizeEstimator()).chunk(text)
+        self.assertEqual(remote_chunks.get_all_text(), local_chunks.get_all_text())
+
+    def test_pickle_rebuilds_the_pool(self):
+        self.estimator.estimate_size("Hello")
+        estimator = pickle.loads(pickle.dumps(self.estimator))
+        self.assertEqual(estimator._idle_connections, [])
+        self.assertEqual(estimator.estimate_size("Hello world"), 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RemoteSizeEstimator("ftp://localhost/estimate")
+        with self.assertRaises(ValueError):
+            RemoteSizeEstimator(self.server.url, max_connections=0)
+        with self.assertRaises(ValueError):
+            RemoteSizeEstimator(self.server.url, retries=-1)
+
+
+class TestRemoteSizeEstimatorBatchingAndRetries(unittest.TestCase):
+
+    def test_concurrent_calls_are_micro_batched(self):
+        with SizeEstimatorServer(SlowWordSizeEstimator()) as server:
+            estimator = RemoteSizeEstimator(server.url, max_connections=1)
+            texts = [" ".join(["word"] * i) for i in range(12)]
+            results = [None] * len(texts)
+
+            def estimate(i):
+                results[i] = estimator.estimate_size(texts[i])
+
+            threads = [threading.Thread(target=estimate, args=(i,)) for i in range(len(texts))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results, list(range(12)))
+            self.assertLess(server.requests, len(texts))
+
+    def test_coroutines_are_micro_batched(self):
+        with SizeEstimatorServer(SlowWordSizeEstimator()) as server:
+            estimator = RemoteSizeEstimator(server.url, max_connections=1)
+
+            async def estimate_all():
+                return await asyncio.gather(*(estimator.aestimate_sizes([f"text {i}"]) for i in range(8)))
+
+            self.assertEqual(asyncio.run(estimate_all()), [[2]] * 8)
+            self.assertLess(server.requests, 8)
+
+    def test_server_errors_are_retried(self):
+        with SizeEstimatorServer(SlowWordSizeEstimator(delay=0, failures=2)) as server:
+            estimator = RemoteSizeEstimator(server.url, retries=2, backoff=0.001)
+            self.assertEqual(estimator.estimate_size("Hello world"), 2)
+            self.assertEqual(estimator.requests, 3)
+
+    def test_retries_exhausted(self):
+        with SizeEstimatorServer(SlowWordSizeEstimator(delay=0, failures=5)) as server:
+            estimator = RemoteSizeEstimator(server.url, retries=1, backoff=0.001)
+            with self.assertRaises(RemoteSizeEstimationError):
+                estimator.estimate_size("Hello world")
+
+    def test_timeout(self):
+        with SizeEstimatorServer(SlowWordSizeEstimator(delay=0.5)) as server:
+            estimator = RemoteSizeEstimator(server.url, timeout=0.05, retries=0)
+            with self.assertRaises(RemoteSizeEstimationError) as context:
+                estimator.estimate_size("Hello world")
+            self.assertIsInstance(context.exception.__cause__, TimeoutError)
+
+    def test_unreachable_service(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        estimator = RemoteSizeEstimator(f"http://127.0.0.1:{port}/estimate", retries=1, backoff=0.001)
+        with self.assertRaises(RemoteSizeEstimationError):
+            estimator.estimate_size("Hello world")
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "UNIX sockets are not available.")
+class TestRemoteSizeEstimatorUnixSocket(unittest.TestCase):
+
+    def test_estimate_sizes_over_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            unix_socket = os.path.join(tmp_dir, "tokenizer.sock")
+            with SizeEstimatorServer(WordSizeEstimator(), unix_socket=unix_socket) as server:
+                estimator = RemoteSizeEstimator(server.url, unix_socket=unix_socket)
+                self.assertEqual(estimator.estimate_sizes(["a b", "c"]), [2, 1])
+                self.assertEqual(estimator.estimate_size("one two three"), 3)
+                self.assertEqual(estimator.requests, 2)
+            self.assertFalse(os.path.exists(unix_socket))
+
+    def test_achunk_over_unix_socket(self):
+        text = "This is a sentence, with a comma; and a semicolon: and a colon. " * 5
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            unix_socket = os.path.join(tmp_dir, "tokenizer.sock")
+            with SizeEstimatorServer(WordSizeEstimator(), unix_socket=unix_socket) as server:
+                estimator = RemoteSizeEstimator(server.url, unix_socket=unix_socket)
+                chunks = asyncio.run(TextChunker(chunk_size=10, size_estimator=estimator).achunk(text))
+        expected = TextChunker(chunk_size=10).chunk(text)
+        self.assertEqual(chunks.get_all_text(), expected.get_all_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,18 @@
 # FILE: tests/size_estimators/test_size_estimators.py
 
+import asyncio
+import sys
 import unittest
-from chunkipy.size_estimators import CharSizeEstimator, WordSizeEstimator, OpenAISizeEstimator
+import pickle
+import re
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+from chunkipy.size_estimators import AsyncBaseSizeEstimator, CharSizeEstimator, WordSizeEstimator, OpenAISizeEstimator, CachedSizeEstimator, TokenSpansIndex
+from chunkipy.size_estimators import HuggingFaceSizeEstimator, PointEstimate, TieredSizeEstimator
+from chunkipy.size_estimators.tiered_size_estimator import script_key
 from chunkipy.size_estimators.base_size_estimator import BaseSizeEstimator
+from chunkipy import TextChunker
 from chunkipy.utils import MissingDependencyError
 
 class TestCharSizeEstimator(unittest.TestCase):
@@ -17,6 +27,12 @@ class TestWordSizeEstimator(unittest.TestCase):
         text = "This is a test."
         self.assertEqual(estimator.estimate_size(text), 4)  # 4 words
 
+    def test_token_spans(self):
+        estimator = WordSizeEstimator()
+        text = " This is  a\ntest."
+        self.assertTrue(estimator.supports_token_spans)
+        self.assertEqual([text[start:end] for start, end in estimator.token_spans(text)], ["This", "is", "a", "test."])
+
 class TestOpenAISizeEstimator(unittest.TestCase):
     def test_estimate_size(self):
         try:
@@ -25,8 +41,115 @@ class TestOpenAISizeEstimator(unittest.TestCase):
             size = estimator.estimate_size(text)
             self.assertIsInstance(size, int)
             self.assertGreater(size, 0)
+            texts = ["This is a test.", "Another, longer, test text."]
+            self.assertEqual(estimator.estimate_sizes(texts), [estimator.estimate_size(t) for t in texts])
+            token_spans = estimator.token_spans(text)
+            self.assertEqual(len(token_spans), size)
+            self.assertEqual("".join(text[start:end] for start, end in token_spans), text)
+        except MissingDependencyError:
+            self.skipTest("tiktoken dependencies are not installed.")
+
+    def test_token_spans_of_byte_split_characters(self):
+        try:
+            estimator = OpenAISizeEstimator()
         except MissingDependencyError:
             self.skipTest("tiktoken dependencies are not installed.")
+        self._assert_token_spans_never_underestimate(estimator, estimator.tokenizer)
+
+    def test_token_spans_of_byte_split_characters_stand_in(self):
+        with patch.object(OpenAISizeEstimator, "_load_tokenizer", return_value=ByteEncoding()):
+            estimator = OpenAISizeEstimator()
+        self._assert_token_spans_never_underestimate(estimator, estimator.tokenizer)
+
+    def _assert_token_spans_never_underestimate(self, estimator, encoding):
+        text = "\u6f22\u5b57 chunk \U0001F600\U0001F680 \u6f22\u5b57\u304b\u306a"
+        index = TokenSpansIndex(estimator.token_spans(text), text)
+        self.assertEqual(index.count(0, len(text)), len(encoding.encode(text)))
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                self.assertGreaterEqual(index.count(start, end), len(encoding.encode(text[start:end])))
+
+class ByteEncoding:
+    # Stand-in of a tiktoken encoding with one token per UTF-8 byte, and tiktoken's decode_with_offsets
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode_with_offsets(self, tokens):
+        offsets, text_len = [], 0
+        for token in tokens:
+            # a continuation byte belongs to the character started by the previous tokens
+            offsets.append(max(0, text_len - (0x80 <= token < 0xC0)))
+            text_len += not 0x80 <= token < 0xC0
+        return bytes(tokens).decode("utf-8"), offsets
+
+class FakeTokenizer:
+    # Stand-in of tokenizers.Tokenizer: one token per word, plus [CLS] and [SEP] as special tokens
+    loaded_files = []
+
+    def __init__(self):
+        self.truncation = self.padding = True
+        self.batches = []
+
+    @classmethod
+    def from_file(cls, path):
+        cls.loaded_files.append(path)
+        return cls()
+
+    def no_truncation(self):
+        self.truncation = False
+
+    def no_padding(self):
+        self.padding = False
+
+    def encode(self, text, add_special_tokens=True):
+        offsets = [match.span() for match in re.finditer(r"\S+", text)]
+        if add_special_tokens:
+            offsets = [(0, 0)] + offsets + [(0, 0)]
+        return SimpleNamespace(ids=list(range(len(offsets))), offsets=offsets)
+
+    def encode_batch(self, texts, add_special_tokens=True):
+        self.batches.append(texts)
+        return [self.encode(text, add_special_tokens) for text in texts]
+
+class TestHuggingFaceSizeEstimator(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chunkipy.size_estimators.huggingface_size_estimator.import_dependencies",
+                        return_value=(None, FakeTokenizer))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.estimator = HuggingFaceSizeEstimator("tokenizer.json")
+
+    def test_estimate_size_without_special_tokens(self):
+        self.assertFalse(self.estimator.tokenizer.truncation)
+        self.assertFalse(self.estimator.tokenizer.padding)
+        self.assertEqual(self.estimator.estimate_size("This is a test."), 4)
+
+    def test_estimate_sizes_in_one_batch(self):
+        self.assertEqual(self.estimator.estimate_sizes(["a b", "c", ""]), [2, 1, 0])
+        self.assertEqual(self.estimator.estimate_sizes([]), [])
+        self.assertEqual(self.estimator.tokenizer.batches, [["a b", "c", ""]])
+
+    def test_token_spans(self):
+        text = "Hello  world, again"
+        self.assertTrue(self.estimator.supports_token_spans)
+        self.assertEqual([text[start:end] for start, end in self.estimator.token_spans(text)],
+                         ["Hello", "world,", "again"])
+
+    def test_pickle_reloads_tokenizer(self):
+        FakeTokenizer.loaded_files.clear()
+        estimator = pickle.loads(pickle.dumps(self.estimator))
+        self.assertEqual(FakeTokenizer.loaded_files, ["tokenizer.json"])
+        self.assertEqual(estimator.estimate_size("one two"), 2)
+
+    def test_missing_dependency(self):
+        patch.stopall()
+        try:
+            import tokenizers  # noqa: F401
+        except ImportError:
+            with self.assertRaises(MissingDependencyError):
+                HuggingFaceSizeEstimator("tokenizer.json")
+        else:
+            self.skipTest("tokenizers is installed.")
 
 class TestBaseSizeEstimator(unittest.TestCase):
     def test_abstract_method(self):
@@ -36,5 +159,263 @@ class TestBaseSizeEstimator(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             DummySizeEstimator().estimate_size("test")
 
+    def test_token_spans_not_supported(self):
+        self.assertFalse(CharSizeEstimator().supports_token_spans)
+        with self.assertRaises(NotImplementedError):
+            CharSizeEstimator().token_spans("test")
+
+    def test_estimate_sizes_default(self):
+        self.assertEqual(CharSizeEstimator().estimate_sizes(["a", "bb", ""]), [1, 2, 0])
+        self.assertEqual(WordSizeEstimator().estimate_sizes([]), [])
+
+class SleepingSizeEstimator(AsyncBaseSizeEstimator):
+    async def aestimate_size(self, text):
+        await asyncio.sleep(0)
+        return len(text)
+
+class TestAsyncBaseSizeEstimator(unittest.TestCase):
+    def test_estimate_sizes_run_coroutines(self):
+        estimator = SleepingSizeEstimator()
+        self.assertEqual(estimator.estimate_size("test"), 4)
+        self.assertEqual(estimator.estimate_sizes(["a", "bb", ""]), [1, 2, 0])
+        self.assertEqual(asyncio.run(estimator.aestimate_sizes(["a", "bb"])), [1, 2])
+
+    def test_sync_call_from_running_loop(self):
+        async def estimate():
+            return SleepingSizeEstimator().estimate_size("test")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(estimate())
+
+    def test_sync_size_estimator_async_default(self):
+        self.assertEqual(asyncio.run(CharSizeEstimator().aestimate_sizes(["a", "bb"])), [1, 2])
+
+class TestTokenSpansIndex(unittest.TestCase):
+    def setUp(self):
+        # "Hello world, again" tokenized as "Hello", " world", ",", " again"
+        self.index = TokenSpansIndex([(0, 5), (5, 11), (11, 12), (12, 18)])
+
+    def test_count_aligned_parts(self):
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.count(0, 18), 4)
+        self.assertEqual(self.index.count(0, 5), 1)
+        self.assertEqual(self.index.count(5, 12), 2)
+        self.assertEqual(self.index.count(7, 7), 0)
+
+    def test_count_tokens_crossing_split_points(self):
+        # splitting at 8 cuts " world": it is counted in both parts
+        self.assertEqual(self.index.count(0, 8), 2)
+        self.assertEqual(self.index.count(8, 18), 3)
+
+    def test_count_pieces_of_a_token_split_across_parts(self):
+        # "chunkipy" is a single token, but its pieces may be re-tokenized into a token per character
+        text = "chunkipy rocks"
+        index = TokenSpansIndex([(0, 8), (8, 9), (9, 14)], text)
+        self.assertEqual(index.count(0, 14), 3)
+        self.assertEqual(index.count(0, 4), 4)
+        self.assertEqual(index.count(4, 14), 4 + 2)
+        self.assertEqual(index.count(2, 5), 3)
+        self.assertEqual(index.count(7, 10), 1 + 1 + 1)
+        # Without the text, each piece is counted as a single token
+        self.assertEqual(TokenSpansIndex([(0, 8), (8, 9), (9, 14)]).count(0, 4), 1)
+
+    def test_count_pieces_per_utf8_byte(self):
+        text = "d\u00e9j\u00e0 vu"
+        index = TokenSpansIndex([(0, 4), (4, 7)], text)
+        self.assertEqual(index.count(0, 2), 3)
+        self.assertEqual(index.count(3, 7), 2 + 1)
+
+    def test_count_zero_width_tokens(self):
+        # a token with the lead byte of the first character, which ends where it starts
+        index = TokenSpansIndex([(0, 0), (0, 1), (1, 2)])
+        self.assertEqual(index.count(0, 2), 3)
+        self.assertEqual(index.count(0, 1), 2)
+        self.assertEqual(index.count(1, 2), 1)
+
+class CountingSizeEstimator(BaseSizeEstimator):
+    def __init__(self):
+        self.calls = 0
+
+    def estimate_size(self, text):
+        self.calls += 1
+        return len(text)
+
+class TestCachedSizeEstimator(unittest.TestCase):
+    def test_hits_and_misses(self):
+        inner = CountingSizeEstimator()
+        estimator = CachedSizeEstimator(inner)
+        sizes = [estimator.estimate_size(text) for text in ["a", "bb", "a", "a", "bb", "ccc"]]
+        self.assertEqual(sizes, [1, 2, 1, 1, 2, 3])
+        self.assertEqual(inner.calls, 3)
+        self.assertEqual((estimator.hits, estimator.misses, estimator.evictions), (3, 3, 0))
+        self.assertEqual(estimator.hit_rate, 0.5)
+
+    def test_lru_eviction_by_entries(self):
+        estimator = CachedSizeEstimator(CountingSizeEstimator(), max_entries=2)
+        for text in ["a", "b", "a", "c", "b"]:  # "b" is the least recently used when "c" is added
+            estimator.estimate_size(text)
+        self.assertEqual(estimator.evictions, 2)
+        self.assertEqual(estimator.cache_info().entries, 2)
+        self.assertEqual(estimator.misses, 4)
+
+    def test_eviction_by_bytes(self):
+        text_bytes = sys.getsizeof("x" * 100)
+        estimator = CachedSizeEstimator(CountingSizeEstimator(), max_entries=None, max_bytes=2 * text_bytes)
+        for char in "xyz":
+            estimator.estimate_size(char * 100)
+        self.assertEqual(estimator.cache_info().entries, 2)
+        self.assertLessEqual(estimator.cache_info().bytes, 2 * text_bytes)
+        self.assertEqual(estimator.evictions, 1)
+
+    def test_thread_safe(self):
+        inner = CountingSizeEstimator()
+        estimator = CachedSizeEstimator(inner, max_entries=50, thread_safe=True)
+        threads = [threading.Thread(target=lambda: [estimator.estimate_size(str(i % 80)) for i in range(1000)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(estimator.hits + estimator.misses, 4000)
+        self.assertLessEqual(estimator.cache_info().entries, 50)
+
+    def test_estimate_sizes_batches_misses(self):
+        class BatchCountingSizeEstimator(CountingSizeEstimator):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def estimate_sizes(self, texts):
+                self.batches.append(list(texts))
+                return [len(text) for text in texts]
+
+        inner = BatchCountingSizeEstimator()
+        estimator = CachedSizeEstimator(inner)
+        estimator.estimate_size("a")
+        self.assertEqual(estimator.estimate_sizes(["a", "bb", "ccc", "bb"]), [1, 2, 3, 2])
+        self.assertEqual(inner.batches, [["bb", "ccc"]])
+        self.assertEqual(estimator.estimate_sizes(["ccc", "bb"]), [3, 2])
+        self.assertEqual(len(inner.batches), 1)
+
+    def test_pickle_and_clear(self):
+        estimator = CachedSizeEstimator(CountingSizeEstimator(), thread_safe=True)
+        estimator.estimate_size("text")
+        unpickled = pickle.loads(pickle.dumps(estimator))
+        self.assertEqual(unpickled.cache_info().entries, 0)
+        self.assertEqual(unpickled.estimate_size("text"), 4)
+        estimator.cache_clear()
+        self.assertEqual(estimator.cache_info(), (0, 0, 0, 0, 0))
+
+class CountingWordSizeEstimator(WordSizeEstimator):
+    def __init__(self):
+        self.estimated_texts = 0
+
+    def estimate_sizes(self, texts):
+        self.estimated_texts += len(texts)
+        return super().estimate_sizes(texts)
+
+class TestTieredSizeEstimator(unittest.TestCase):
+    def setUp(self):
+        self.exact = CountingWordSizeEstimator()
+        self.estimator = TieredSizeEstimator(self.exact, chunk_size=50, min_samples=5)
+        self.samples = [f"This is calibration sentence number {i} with some words." for i in range(5)]
+
+    def test_exact_until_calibrated(self):
+        self.assertIsNone(self.estimator.bounds("Some text that is long enough."))
+        self.assertEqual(self.estimator.estimate_sizes(["Short text here, with words."]), [5])
+        self.assertEqual(self.estimator.approximate_estimations, 0)
+
+    def test_bounds_decide_far_from_chunk_size(self):
+        self.estimator.calibrate(self.samples)
+        self.assertEqual(self.exact.estimated_texts, 5)
+        short_text = "A short sentence."
+        long_text = " ".join(self.samples * 4)
+        near_text = " ".join(self.samples)
+        sizes = self.estimator.estimate_sizes([short_text, long_text, near_text])
+        self.assertGreaterEqual(sizes[0], 3)
+        self.assertLessEqual(sizes[0], 50)
+        self.assertGreater(sizes[1], 50)
+        self.assertEqual(sizes[2], 45)  # estimated exactly
+        self.assertEqual(self.exact.estimated_texts, 6)
+        self.assertEqual(self.estimator.approximate_estimations, 2)
+
+    def test_calibrates_on_a_sample_of_the_batch(self):
+        texts = self.samples * 10
+        sizes = self.estimator.estimate_sizes(texts)
+        self.assertEqual(self.exact.estimated_texts, 5)
+        for text, size in zip(texts, sizes):
+            self.assertGreaterEqual(size, WordSizeEstimator().estimate_size(text))
+
+    def test_chunks_never_exceed_chunk_size(self):
+        text = " ".join(f"Sentence {i} is made of a few words, and a clause." for i in range(200))
+        text_chunker = TextChunker(chunk_size=50, size_estimator=self.estimator)
+        chunks = text_chunker.chunk(text)
+        self.assertEqual(" ".join(chunks.get_all_text()).split(), text.split())
+        for chunk in chunks:
+            self.assertLessEqual(WordSizeEstimator().estimate_size(chunk.text), 50)
+        self.assertGreater(self.estimator.resolutions, 0)
+
+    def test_point_estimates_carry_their_upper_bound(self):
+        self.estimator.calibrate(self.samples)
+        text = "A short sentence."
+        size = self.estimator.estimate_size(text)
+        self.assertIsInstance(size, PointEstimate)
+        self.assertEqual(size.upper_bound, self.estimator.bounds(text)[1])
+        self.assertLessEqual(size, size.upper_bound)
+        unpickled = pickle.loads(pickle.dumps(size))
+        self.assertEqual((unpickled, unpickled.upper_bound), (size, size.upper_bound))
+
+    def test_chunks_within_chunk_size_when_calibration_widens(self):
+        estimator = TieredSizeEstimator(WordSizeEstimator(), chunk_size=20, min_samples=2)
+        estimator.calibrate(["aaaaaaaaa " * 10, "aaaa " * 10])
+        # The last clause is estimated exactly in the same batch as the first two, and widens their bounds
+        text = "; ".join(["aaaa " * 12, "aaaa " * 12, "aa " * 30])
+        upper_bound = estimator.bounds("aaaa " * 12)[1]
+        chunks = TextChunker(chunk_size=20, size_estimator=estimator).chunk(text)
+        self.assertGreater(estimator.bounds("aaaa " * 12)[1], 20)
+        self.assertLessEqual(upper_bound, 20)
+        self.assertEqual(" ".join(chunks.get_all_text()).split(), text.split())
+        for chunk in chunks:
+            self.assertLessEqual(WordSizeEstimator().estimate_size(chunk.text), 20)
+
+    def test_chunk_above_chunk_size_once_resolved_is_cut(self):
+        estimator = TieredSizeEstimator(WordSizeEstimator(), chunk_size=20, min_samples=2)
+        # Calibrated on longer words: the clauses are bigger than their upper bounds
+        estimator.calibrate(["aaaaaaaaa " * 10, "aaaaaaaa " * 10])
+        text = "; ".join(["aa aa aa aa aa aa aa aa"] * 30)
+        chunks = TextChunker(chunk_size=20, size_estimator=estimator).chunk(text)
+        self.assertEqual(chunks.get_all_text(), TextChunker(chunk_size=20).chunk(text).get_all_text())
+        for chunk in chunks:
+            self.assertEqual(chunk.size, WordSizeEstimator().estimate_size(chunk.text))
+
+    def test_chunks_and_fill_close_to_exact(self):
+        log_lines = "\n".join(f"2024-01-01 12:00:{i % 60:02d} INFO worker-{i % 7} handled request {i} in {i % 13} ms"
+                               for i in range(300))
+        paragraphs = "\n\n".join(" ".join(f"Paragraph {p} has sentence {i}, which is short." for i in range(12))
+                                   for p in range(10))
+        for text in (log_lines, paragraphs):
+            exact_chunks = TextChunker(chunk_size=50, size_estimator=WordSizeEstimator()).chunk(text)
+            estimator = TieredSizeEstimator(WordSizeEstimator(), chunk_size=50, min_samples=5)
+            tiered_chunks = TextChunker(chunk_size=50, size_estimator=estimator).chunk(text)
+            self.assertLessEqual(len(tiered_chunks), len(exact_chunks) * 1.05 + 1)
+            fills = []
+            for chunks in (exact_chunks, tiered_chunks):
+                sizes = [WordSizeEstimator().estimate_size(chunk.text) for chunk in chunks]
+                self.assertLessEqual(max(sizes), 50)
+                fills.append(sum(sizes) / (len(chunks) * 50))
+            self.assertGreaterEqual(fills[1], fills[0] * 0.95)
+
+    def test_chunk_size_must_match(self):
+        with self.assertRaises(ValueError):
+            TextChunker(chunk_size=100, size_estimator=self.estimator)
+        with self.assertRaises(ValueError):
+            TieredSizeEstimator(self.exact, chunk_size=0)
+
+    def test_script_key(self):
+        self.assertEqual(script_key("Hello"), "ascii")
+        self.assertEqual(script_key("Perché"), "latin")
+        self.assertEqual(script_key("Привет"), "other")
+        self.assertEqual(script_key("你好, world"), "cjk")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,80 @@
+import pickle
+import unittest
+
+from chunkipy import ChunkTable, TextChunker
+from chunkipy.text_chunker.data_models import Chunk, Chunks, Overlap, TextPart, TextParts
+
+
+TEXT = " ".join(f"Sentence number {i} is short, but it counts." for i in range(40))
+
+
+class TestChunkTable(unittest.TestCase):
+
+    def setUp(self):
+        self.text_chunker = TextChunker(chunk_size=20, overlap_ratio=0.5)
+        self.chunks = self.text_chunker.chunk(TEXT)
+        self.table = self.text_chunker.chunk_table(TEXT)
+
+    def test_views_match_chunks(self):
+        self.assertEqual(len(self.table), len(self.chunks))
+        self.assertTrue(any(chunk.overlap for chunk in self.chunks))
+        for view, chunk in zip(self.table, self.chunks):
+            self.assertEqual(view.text, chunk.text)
+            self.assertEqual(view.size, chunk.size)
+            self.assertEqual(view.text_parts, chunk.text_parts)
+            self.assertEqual(view.overlap, chunk.overlap)
+            self.assertEqual(view.content, chunk.content)
+            self.assertEqual((view.start, view.end), (chunk.start, chunk.end))
+            self.assertEqual(view, chunk)
+        self.assertEqual(self.table.get_all_text(), self.chunks.get_all_text())
+
+    def test_round_trip(self):
+        self.assertEqual(list(self.table.to_chunks()), list(self.chunks))
+        table = ChunkTable.from_chunks(self.chunks)
+        self.assertEqual(table.get_all_text(), self.table.get_all_text())
+        self.assertEqual(list(table.part_starts), list(self.table.part_starts))
+
+    def test_high_overlap_ratio(self):
+        text_chunker = TextChunker(chunk_size=20, overlap_ratio=0.9)
+        table = text_chunker.chunk_table(TEXT)
+        self.assertEqual(table.get_all_text(), text_chunker.chunk(TEXT).get_all_text())
+        self.assertEqual([view.overlap for view in table], [chunk.overlap for chunk in text_chunker.chunk(TEXT)])
+        self.assertTrue(any(view.overlap for view in table))
+
+    def test_indexing(self):
+        self.assertEqual(self.table[-1].text, self.chunks[-1].text)
+        self.assertEqual([view.text for view in self.table[1:3]], [chunk.text for chunk in self.chunks[1:3]])
+        with self.assertRaises(IndexError):
+            self.table[len(self.table)]
+
+    def test_detached_text_parts_are_copied_to_a_buffer(self):
+        chunks = list(self.text_chunker.chunk_stream(iter([TEXT[:100], TEXT[100:]]), buffer_size=64))
+        table = ChunkTable.from_chunks(chunks)
+        self.assertEqual(table.get_all_text(), [chunk.text for chunk in chunks])
+        self.assertEqual([view.size for view in table], [chunk.size for chunk in chunks])
+
+    def test_non_contiguous_text_parts(self):
+        source = "aa bb cc"
+        parts = [TextPart(size=1, start=0, end=2, source=source), TextPart(size=1, start=6, end=8, source=source)]
+        table = ChunkTable.from_chunks(Chunks([Chunk(content=TextParts(parts))]))
+        self.assertFalse(table.contiguous)
+        self.assertEqual(table[0].text, "aacc")
+
+    def test_overlap_must_be_a_suffix_of_the_previous_content(self):
+        parts = [TextPart(size=1, text=text) for text in "abc"]
+        chunks = [Chunk(content=TextParts(parts[:2])), Chunk(overlap=Overlap(parts[:1]), content=TextParts(parts[2:]))]
+        with self.assertRaises(ValueError):
+            ChunkTable.from_chunks(chunks)
+
+    def test_empty(self):
+        table = ChunkTable.from_chunks([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.to_chunks(), Chunks())
+
+    def test_pickle(self):
+        table = pickle.loads(pickle.dumps(self.table))
+        self.assertEqual(table.get_all_text(), self.table.get_all_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+
+from chunkipy.text_chunker.data_models import Chunk, FrozenChunk, Overlap, TextPart, TextParts
+
+
+def text_parts(*sizes):
+    return [TextPart(size=size, text="x" * size) for size in sizes]
+
+
+class TestTextParts(unittest.TestCase):
+
+    def test_size_is_tracked_by_mutations(self):
+        parts = TextParts(text_parts(1, 2))
+        self.assertEqual(parts.size, 3)
+        parts.append(TextPart(size=4, text="xxxx"))
+        parts.extend(text_parts(5))
+        parts += text_parts(6)
+        parts.insert(0, TextPart(size=7, text="x" * 7))
+        self.assertEqual(parts.size, 25)
+        parts.pop()
+        parts.pop(0)
+        del parts[0]
+        parts[0] = TextPart(size=10, text="x" * 10)
+        self.assertEqual(parts.size, sum(part.size for part in parts))
+        size = parts.size
+        parts *= 2
+        self.assertIsInstance(parts, TextParts)
+        self.assertEqual(parts.size, 2 * size)
+        parts.clear()
+        self.assertEqual(parts.size, 0)
+
+    def test_pickle_keeps_size(self):
+        parts = pickle.loads(pickle.dumps(TextParts(text_parts(1, 2, 3))))
+        self.assertIsInstance(parts, TextParts)
+        self.assertEqual(parts.size, 6)
+
+
+class TestOverlap(unittest.TestCase):
+
+    def test_size_is_tracked_by_mutations(self):
+        overlap = Overlap(text_parts(1, 2))
+        overlap.append(TextPart(size=3, text="xxx"))
+        overlap.appendleft(TextPart(size=4, text="xxxx"))
+        overlap.extend(text_parts(5))
+        overlap.extendleft(text_parts(6))
+        self.assertEqual(overlap.size, 21)
+        self.assertEqual(overlap.popleft().size, 6)
+        self.assertEqual(overlap.pop().size, 5)
+        self.assertEqual(overlap.size, 10)
+        overlap.insert(1, TextPart(size=7, text="x" * 7))
+        self.assertEqual(overlap.size, 17)
+        overlap *= 2
+        self.assertIsInstance(overlap, Overlap)
+        self.assertEqual(overlap.size, 34)
+        overlap.clear()
+        self.assertEqual(overlap.size, 0)
+
+
+class TestChunk(unittest.TestCase):
+
+    def test_size_sums_overlap_and_content(self):
+        chunk = Chunk(overlap=Overlap(text_parts(1, 2)), content=TextParts(text_parts(3)))
+        self.assertEqual(chunk.size, 6)
+        chunk.content.append(TextPart(size=4, text="xxxx"))
+        self.assertEqual(chunk.size, 10)
+
+    def test_plain_collections_are_converted(self):
+        chunk = Chunk(overlap=text_parts(1), content=text_parts(2, 3))
+        self.assertIsInstance(chunk.overlap, Overlap)
+        self.assertIsInstance(chunk.content, TextParts)
+        self.assertEqual(chunk.size, 6)
+        self.assertEqual(chunk.text, "xxxxxx")
+
+
+class TestFrozenChunk(unittest.TestCase):
+
+    def setUp(self):
+        source = "aa bb cc"
+        self.chunk = Chunk(overlap=[TextPart(size=1, start=0, end=3, source=source)],
+                           content=[TextPart(size=1, start=3, end=6, source=source),
+                                    TextPart(size=1, start=6, end=8, source=source)])
+        self.frozen = self.chunk.freeze()
+
+    def test_same_api_as_chunk(self):
+        self.assertIsInstance(self.frozen, FrozenChunk)
+        self.assertEqual(self.frozen, self.chunk)
+        self.assertEqual(self.chunk, self.frozen)
+        self.assertEqual((self.frozen.size, self.frozen.text), (3, "aa bb cc"))
+        self.assertEqual(self.frozen.text_parts, tuple(self.chunk.text_parts))
+        self.assertEqual(self.frozen.text_parts.size, 3)
+        self.assertEqual((self.frozen.start, self.frozen.end), (0, 8))
+        self.assertEqual(self.frozen.thaw(), self.chunk)
+
+    def test_text_is_cached(self):
+        self.assertIs(self.frozen.text, self.frozen.text)
+
+    def test_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            self.frozen.content = TextParts()
+        with self.assertRaises(AttributeError):
+            self.frozen.content.append(TextPart(size=1, text="x"))
+        # Mutating the original chunk does not change the frozen one
+        self.chunk.content.append(TextPart(size=1, text="x"))
+        self.assertEqual(self.frozen.size, 3)
+
+    def test_hashable_and_picklable(self):
+        unpickled = pickle.loads(pickle.dumps(self.frozen))
+        self.assertEqual(unpickled, self.frozen)
+        self.assertEqual(len({self.frozen, unpickled, self.chunk.freeze()}), 1)
@@ -1,10 +1,19 @@
+import asyncio
+import io
+import json
+import os
+import socket
+import tempfile
+import time
+import types
 import unittest
 
-from chunkipy import TextChunker
-from chunkipy.size_estimators import BaseSizeEstimator
+from chunkipy import FrozenChunk, TextChunker, TextPart
+from chunkipy.size_estimators import AsyncBaseSizeEstimator, BaseSizeEstimator
 from chunkipy.size_estimators.char_size_estimator import CharSizeEstimator
 from chunkipy.size_estimators.word_size_estimator import WordSizeEstimator
 from chunkipy.text_splitters import SeparatorTextSplitter
+from chunkipy.text_splitters.semantic.base_semantic_text_splitter import BaseSemanticTextSplitter
 
 
 class DashSizeEstimator(BaseSizeEstimator):
@@ -22,6 +31,69 @@ class SpaceAndDotTextSplitter(SeparatorTextSplitter):
         super().__init__(separator=" .")
 
 
+class FullStopSemanticTextSplitter(BaseSemanticTextSplitter):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _split(self, text):
+        sentences = text.split(". ")
+        return [sentence + ". " for sentence in sentences[:-1]] + sentences[-1:]
+
+    def _split_batch(self, texts, langs):
+        self.batches.append(texts)
+        return super()._split_batch(texts, langs)
+
+
+
+class StandInTokenizerServer:
+    """Local stand-in of a tokenizer sidecar: a UNIX socket server answering a JSON line of texts
+    with a JSON line of their word counts, after a delay."""
+
+    def __init__(self, path, delay=0.01):
+        self.path = path
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        while line := await reader.readline():
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(self.delay)
+            self.in_flight -= 1
+            writer.write(json.dumps([len(text.split()) for text in json.loads(line)]).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+
+class StandInTokenizerSizeEstimator(AsyncBaseSizeEstimator):
+    def __init__(self, path):
+        self.path = path
+
+    async def aestimate_size(self, text):
+        return (await self.aestimate_sizes([text]))[0]
+
+    async def aestimate_sizes(self, texts):
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        try:
+            writer.write(json.dumps(texts).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
 
 class TestTextChunker(unittest.TestCase):
 
@@ -154,3 +226,402 @@ class TestTextChunker(unittest.TestCase):
         chunks_text = chunks.get_all_text()
         self.assertEqual(expected_chunks, chunks_text)
 
+        frozen_chunks = TextChunker(50, overlap_ratio=0.3, frozen=True).chunk(text)
+        self.assertTrue(all(isinstance(chunk, FrozenChunk) for chunk in frozen_chunks))
+        self.assertEqual(list(frozen_chunks), list(chunks))
+        self.assertEqual(expected_chunks, frozen_chunks.get_all_text())
+
+    def test_overlap_ranges(self):
+        def text_parts(sizes):
+            return [TextPart(size=size, text=str(i)) for i, size in enumerate(sizes)]
+
+        text_chunker = TextChunker(10, overlap_ratio=0.5)
+        # Overlap: the longest suffix of the previous content with size <= 5
+        ranges = list(text_chunker._iter_chunk_ranges(text_parts([2, 3, 4, 1, 5, 3, 1, 1])))
+        self.assertEqual(ranges, [(0, 0, 4), (2, 4, 5), (4, 5, 8)])
+        # Empty after a part larger than the overlap size
+        ranges = list(text_chunker._iter_chunk_ranges(text_parts([4, 6, 3])))
+        self.assertEqual(ranges, [(0, 0, 2), (2, 2, 3)])
+        ranges = list(TextChunker(10)._iter_chunk_ranges(text_parts([2, 3, 4, 1, 5, 3, 1, 1])))
+        self.assertEqual(ranges, [(0, 0, 4), (4, 4, 8)])
+        self.assertEqual(list(text_chunker._iter_chunk_ranges(text_parts([]))), [(0, 0, 0)])
+
+        chunks = text_chunker._build_chunks(text_parts([2, 3, 4, 1, 5, 3, 1, 1]))
+        self.assertEqual([(chunk.overlap.text, chunk.content.text) for chunk in chunks],
+                         [("", "0123"), ("23", "4"), ("4", "567")])
+
+
+
+class TestTextChunkerChunkMany(unittest.TestCase):
+
+    def setUp(self):
+        self.text_chunker = TextChunker(chunk_size=30, size_estimator=CharSizeEstimator())
+        self.texts = [f"This is text number {i}. This is another phrase, with a comma." for i in range(20)]
+        self.expected = [self.text_chunker.chunk(text).get_all_text() for text in self.texts]
+
+    def test_config_round_trip(self):
+        text_chunker = TextChunker(chunk_size=10, overlap_ratio=0.2, text_splitters=[DashTextSplitter()])
+        rebuilt = TextChunker.from_config(text_chunker.config)
+        self.assertEqual(rebuilt.chunk_size, 10)
+        self.assertEqual(rebuilt.overlap_size, text_chunker.overlap_size)
+        self.assertEqual(len(rebuilt.text_splitters), len(text_chunker.text_splitters))
+        self.assertTrue(TextChunker.from_config(TextChunker(frozen=True).config).frozen)
+
+    def test_chunk_many_thread_ordered(self):
+        results = self.text_chunker.chunk_many(self.texts, workers=3, executor="thread", chunksize=4)
+        self.assertEqual([chunks.get_all_text() for chunks in results], self.expected)
+
+    def test_chunk_many_thread_unordered(self):
+        results = dict(self.text_chunker.chunk_many(self.texts, workers=3, executor="thread", ordered=False))
+        self.assertEqual([results[i].get_all_text() for i in range(len(self.texts))], self.expected)
+
+    def test_chunk_many_process(self):
+        results = self.text_chunker.chunk_many(iter(self.texts), workers=2, executor="process", chunksize=5)
+        self.assertEqual([chunks.get_all_text() for chunks in results], self.expected)
+
+    def test_chunk_many_batches_semantic_text_splitter(self):
+        text_splitter = FullStopSemanticTextSplitter()
+        text_chunker = TextChunker(chunk_size=30, size_estimator=CharSizeEstimator(), text_splitters=[text_splitter])
+        expected = [text_chunker.chunk(text).get_all_text() for text in self.texts]
+        text_splitter.batches.clear()
+
+        results = text_chunker.chunk_many(self.texts, workers=1, executor="thread", chunksize=5)
+        self.assertEqual([chunks.get_all_text() for chunks in results], expected)
+        self.assertEqual([len(batch) for batch in text_splitter.batches], [5, 5, 5, 5])
+
+    def test_chunk_many_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.text_chunker.chunk_many(self.texts, executor="gpu")
+        with self.assertRaises(ValueError):
+            self.text_chunker.chunk_many(self.texts, chunksize=0)
+
+
+class TestTextChunkerIterChunks(unittest.TestCase):
+
+    def test_iter_chunks_matches_chunk(self):
+        text_chunker = TextChunker(chunk_size=20, overlap_ratio=0.3)
+        text = "This is a very long text, with commas; and semicolons. " * 30
+        chunks = text_chunker.iter_chunks(text)
+        self.assertIsInstance(chunks, types.GeneratorType)
+        self.assertEqual([chunk.text for chunk in chunks], text_chunker.chunk(text).get_all_text())
+
+    def test_iter_chunks_yields_before_consuming_all_parts(self):
+        text_chunker = TextChunker(chunk_size=5, overlap_ratio=0.4)
+        consumed = []
+
+        def text_parts():
+            for i in range(100):
+                consumed.append(i)
+                yield TextPart(size=1, text=f"w{i} ")
+
+        first_chunk = next(text_chunker._iter_build_chunks(text_parts()))
+        self.assertEqual(first_chunk.text, "w0 w1 w2 w3 w4 ")
+        self.assertEqual(len(consumed), 6)
+
+    def test_iter_chunks_carries_overlap(self):
+        text_chunker = TextChunker(chunk_size=5, overlap_ratio=0.4)
+        chunks = list(text_chunker.iter_chunks("a b c d e f g h i j"))
+        self.assertEqual(chunks[1].overlap.text, "d e ")
+        self.assertEqual(chunks[1].content.text, "f g h ")
+
+    def test_iter_chunks_invalid_text(self):
+        text_chunker = TextChunker(chunk_size=5)
+        with self.assertRaises(ValueError):
+            next(text_chunker.iter_chunks("   "))
+
+
+class TestTextChunkerChunkStream(unittest.TestCase):
+
+    def setUp(self):
+        self.text_chunker = TextChunker(chunk_size=20, overlap_ratio=0.2)
+        self.text = "In this unit test, we are evaluating the streaming functionality; the text is read " \
+                    "in blocks: chunks should be the same as the ones produced by chunk, with global offsets. " * 20
+
+    def test_chunk_stream_from_file_matches_chunk(self):
+        chunks = list(self.text_chunker.chunk_stream(io.StringIO(self.text), buffer_size=500))
+        self.assertEqual([chunk.text for chunk in chunks], self.text_chunker.chunk(self.text).get_all_text())
+
+    def test_chunk_stream_global_offsets(self):
+        blocks = (self.text[i:i + 37] for i in range(0, len(self.text), 37))
+        for chunk in self.text_chunker.chunk_stream(blocks, buffer_size=300):
+            for text_part in chunk.text_parts:
+                self.assertEqual(self.text[text_part.start:text_part.end], text_part.text)
+        self.assertEqual(chunk.end, len(self.text))
+
+    def test_chunk_stream_is_lazy(self):
+        consumed = []
+
+        def blocks():
+            for i in range(1000):
+                consumed.append(i)
+                yield "one two three four five six seven eight nine ten. "
+
+        first_chunk = next(self.text_chunker.chunk_stream(blocks(), buffer_size=100))
+        self.assertEqual(first_chunk.size, 20)
+        self.assertLess(len(consumed), 10)
+
+    def test_chunk_stream_hard_cut_without_boundaries(self):
+        text_chunker = TextChunker(chunk_size=100, size_estimator=CharSizeEstimator())
+        chunks = list(text_chunker.chunk_stream(["x" * 250], buffer_size=100))
+        self.assertEqual("".join(chunk.text for chunk in chunks), "x" * 250)
+        self.assertEqual([(chunk.start, chunk.end) for chunk in chunks], [(0, 100), (100, 200), (200, 250)])
+
+    def test_chunk_stream_invalid_source(self):
+        with self.assertRaises(TypeError):
+            list(self.text_chunker.chunk_stream("a string"))
+        with self.assertRaises(TypeError):
+            list(self.text_chunker.chunk_stream([b"bytes"]))
+        with self.assertRaises(ValueError):
+            list(self.text_chunker.chunk_stream([self.text], buffer_size=0))
+
+
+class TestTextChunkerSpans(unittest.TestCase):
+
+    def test_split_text_yields_spans_of_the_source(self):
+        text_chunker = TextChunker(chunk_size=4)
+        text = "This is a text; it is split in spans, without copies."
+        text_parts = list(text_chunker.split_text(text))
+        for text_part in text_parts:
+            self.assertIs(text_part.source, text)
+            self.assertEqual(text_part.text, text[text_part.start:text_part.end])
+
+    def test_chunk_offsets(self):
+        text_chunker = TextChunker(chunk_size=5, overlap_ratio=0.4)
+        text = "a b c d e f g h i j"
+        for chunk in text_chunker.chunk(text):
+            self.assertEqual(chunk.text, text[chunk.start:chunk.end])
+
+    def test_text_part_requires_text_or_span(self):
+        self.assertEqual(TextPart(size=1, text="abc").text, "abc")
+        self.assertEqual(TextPart(size=1, start=1, end=3, source="abcd").text, "bc")
+        with self.assertRaises(ValueError):
+            TextPart(size=1, start=1, end=3)
+
+
+class TestTextChunkerBatchEstimation(unittest.TestCase):
+
+    def test_siblings_are_estimated_in_one_batch(self):
+        class BatchSizeEstimator(WordSizeEstimator):
+            def __init__(self):
+                self.batches = []
+
+            def estimate_sizes(self, texts):
+                self.batches.append(texts)
+                return super().estimate_sizes(texts)
+
+        size_estimator = BatchSizeEstimator()
+        text_chunker = TextChunker(chunk_size=3, size_estimator=size_estimator)
+        text_chunker.chunk("one two; three four five, six seven; eight")
+        self.assertEqual(size_estimator.batches[0], ["one two; ", "three four five, six seven; ", "eight"])
+        self.assertEqual(size_estimator.batches[1], ["three four five, six seven; "])  # no colons
+        self.assertEqual(size_estimator.batches[2], ["three four five, ", "six seven; "])
+
+
+class TestTextChunkerTokenizeOnce(unittest.TestCase):
+
+    def test_tokenize_once_matches_estimation(self):
+        text = "In this unit test, we are evaluating the tokenize once functionality; the text is tokenized " \
+               "once: the sizes of its parts are derived from the token offsets. " * 5
+        for chunk_size in [3, 10, 40]:
+            expected = TextChunker(chunk_size=chunk_size, overlap_ratio=0.3).chunk(text)
+            chunks = TextChunker(chunk_size=chunk_size, overlap_ratio=0.3, tokenize_once=True).chunk(text)
+            self.assertEqual(chunks.get_all_text(), expected.get_all_text())
+            self.assertEqual([chunk.size for chunk in chunks], [chunk.size for chunk in expected])
+
+    def test_tokenize_once_tokenizes_once(self):
+        class CountingWordSizeEstimator(WordSizeEstimator):
+            def __init__(self):
+                self.calls = []
+
+            def estimate_sizes(self, texts):
+                self.calls.append("estimate_sizes")
+                return super().estimate_sizes(texts)
+
+            def token_spans(self, text):
+                self.calls.append("token_spans")
+                return super().token_spans(text)
+
+        size_estimator = CountingWordSizeEstimator()
+        text_chunker = TextChunker(chunk_size=3, size_estimator=size_estimator, tokenize_once=True)
+        text_chunker.chunk("one two; three four five, six seven; eight")
+        self.assertEqual(size_estimator.calls, ["token_spans"])
+
+    def test_tokenize_once_requires_token_spans(self):
+        with self.assertRaisesRegex(ValueError, "tokenize_once"):
+            TextChunker(chunk_size=3, size_estimator=CharSizeEstimator(), tokenize_once=True)
+
+
+class TestTextChunkerScannerEngine(unittest.TestCase):
+
+    def test_scanner_matches_recursive(self):
+        text = "In this unit test, we are evaluating the scanner engine; the boundaries of all the text splitters " \
+               "are found once: parts are split. Then - at lower levels - by binary search.\n" * 5
+        text_splitters = [DashTextSplitter(), SpaceAndDotTextSplitter()]
+        for chunk_size in [3, 10, 40]:
+            for custom_text_splitters in [[], text_splitters]:
+                expected = TextChunker(chunk_size=chunk_size, overlap_ratio=0.3,
+                                       text_splitters=custom_text_splitters).chunk(text)
+                chunks = TextChunker(chunk_size=chunk_size, overlap_ratio=0.3, text_splitters=custom_text_splitters,
+                                     engine="scanner").chunk(text)
+                self.assertEqual(chunks.get_all_text(), expected.get_all_text())
+                self.assertEqual([chunk.size for chunk in chunks], [chunk.size for chunk in expected])
+
+    def test_scanner_stream(self):
+        text = "one two; three four five, six seven; eight " * 20
+        expected = TextChunker(chunk_size=5).chunk_stream(io.StringIO(text), buffer_size=50)
+        chunks = TextChunker(chunk_size=5, engine="scanner").chunk_stream(io.StringIO(text), buffer_size=50)
+        self.assertEqual([chunk.text for chunk in chunks], [chunk.text for chunk in expected])
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            TextChunker(engine="regex")
+
+    def test_config_keeps_engine(self):
+        text_chunker = TextChunker.from_config(TextChunker(chunk_size=5, engine="scanner").config)
+        self.assertEqual(text_chunker.engine, "scanner")
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "UNIX sockets are not available.")
+class TestTextChunkerAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = StandInTokenizerServer(os.path.join(self.tmp_dir.name, "tokenizer.sock"))
+        await self.server.start()
+        self.text_chunker = TextChunker(chunk_size=8, overlap_ratio=0.25,
+                                        size_estimator=StandInTokenizerSizeEstimator(self.server.path))
+        self.texts = [f"Text number {i}; it has a clause, another clause: and a long tail of words "
+                      f"that must be split by word." for i in range(12)]
+        self.expected = [TextChunker(chunk_size=8, overlap_ratio=0.25).chunk(text).get_all_text() for text in self.texts]
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+        self.tmp_dir.cleanup()
+
+    async def test_achunk_matches_chunk(self):
+        chunks = await self.text_chunker.achunk(self.texts[0])
+        self.assertEqual(chunks.get_all_text(), self.expected[0])
+
+    async def test_achunk_scanner_engine(self):
+        text_chunker = TextChunker(chunk_size=8, overlap_ratio=0.25, engine="scanner",
+                                   size_estimator=StandInTokenizerSizeEstimator(self.server.path))
+        chunks = await text_chunker.achunk(self.texts[0])
+        self.assertEqual(chunks.get_all_text(), self.expected[0])
+
+    async def test_achunk_many_ordered(self):
+        results = [chunks.get_all_text() async for chunks in self.text_chunker.achunk_many(iter(self.texts))]
+        self.assertEqual(results, self.expected)
+
+    async def test_achunk_many_unordered(self):
+        results = dict([result async for result in self.text_chunker.achunk_many(self.texts, ordered=False)])
+        self.assertEqual([results[i].get_all_text() for i in range(len(self.texts))], self.expected)
+
+    async def test_achunk_many_overlaps_estimations(self):
+        results = [chunks async for chunks in self.text_chunker.achunk_many(self.texts, concurrency=4)]
+        self.assertEqual(len(results), len(self.texts))
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    async def test_achunk_many_concurrency_limit(self):
+        consumed = 0
+
+        async def texts():
+            nonlocal consumed
+            for text in self.texts:
+                consumed += 1
+                yield text
+
+        async for _ in self.text_chunker.achunk_many(texts(), concurrency=3):
+            self.assertLessEqual(consumed, 3)
+            break
+
+    async def test_achunk_many_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            self.text_chunker.achunk_many(self.texts, concurrency=0)
+
+    async def test_sync_chunk_from_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            self.text_chunker.chunk(self.texts[0])
+
+
+class TestTextChunkerStats(unittest.TestCase):
+
+    def setUp(self):
+        self.text = " ".join(f"Sentence number {i} has a clause, and another clause with many words in it."
+                             for i in range(30))
+
+    def test_chunk_with_stats_matches_chunk(self):
+        text_chunker = TextChunker(chunk_size=8, overlap_ratio=0.25)
+        chunks, stats = text_chunker.chunk_with_stats(self.text)
+        self.assertEqual(chunks.get_all_text(), text_chunker.chunk(self.text).get_all_text())
+        self.assertEqual(stats.chunks, len(chunks))
+        self.assertEqual(stats.text_parts, sum(len(chunk.content) for chunk in chunks))
+        self.assertEqual(stats.text_length, len(self.text))
+
+    def test_stats_levels(self):
+        text_chunker = TextChunker(chunk_size=8)
+        _, stats = text_chunker.chunk_with_stats(self.text)
+        # semicolon, colon, comma and word splitters: the whole text is split at each level
+        self.assertEqual(stats.splitter_calls[0], 1)
+        self.assertEqual(stats.max_depth, 3)
+        self.assertEqual(stats.resplit_parts, sum(stats.splitter_calls[1:]))
+        self.assertEqual(stats.estimate_calls, sum(stats.splitter_calls))
+        self.assertGreater(stats.estimated_texts, stats.text_parts)
+        self.assertGreater(stats.total_seconds, 0)
+        self.assertGreaterEqual(stats.build_seconds, 0)
+        self.assertGreater(stats.fill_ratio, 0.5)
+        self.assertLessEqual(stats.fill_ratio, 1)
+
+    def test_tokenize_once_counts_one_estimation(self):
+        text_chunker = TextChunker(chunk_size=8, tokenize_once=True)
+        _, stats = text_chunker.chunk_with_stats(self.text)
+        # one call to tokenize the text, then the sizes are looked up in the token index
+        self.assertEqual(stats.estimate_calls, 1)
+        self.assertEqual(stats.estimated_texts, 1)
+        self.assertEqual(stats.index_lookups, sum(stats.splitter_calls))
+        self.assertGreaterEqual(stats.build_seconds, 0)
+
+    def test_boundary_scan_is_timed(self):
+        text_chunker = TextChunker(chunk_size=8, engine="scanner")
+        scan = text_chunker.boundary_scanner.scan
+
+        def slow_scan(text):
+            time.sleep(0.05)
+            return scan(text)
+        text_chunker.boundary_scanner.scan = slow_scan
+        _, stats = text_chunker.chunk_with_stats(self.text)
+        self.assertGreaterEqual(stats.split_seconds, 0.05)
+        self.assertGreaterEqual(stats.build_seconds, 0)
+
+    def test_observers(self):
+        collected = []
+        text_chunker = TextChunker(chunk_size=8, observers=[collected.append])
+        chunks = text_chunker.chunk(self.text)
+        self.assertEqual(len(collected), 1)
+        self.assertEqual(collected[0].chunks, len(chunks))
+        text_chunker.chunk_with_stats(self.text)
+        self.assertEqual(len(collected), 2)
+
+    def test_iter_chunks_observed_once_exhausted(self):
+        collected = []
+        text_chunker = TextChunker(chunk_size=8, observers=[collected.append])
+        chunks = text_chunker.iter_chunks(self.text)
+        all_chunks = [next(chunks)]
+        self.assertEqual(collected, [])
+        all_chunks.extend(chunks)
+        self.assertEqual(len(collected), 1)
+        self.assertEqual(collected[0].chunks, len(all_chunks))
+        self.assertEqual(collected[0].text_parts, sum(len(chunk.content) for chunk in all_chunks))
+        self.assertEqual([chunk.text for chunk in text_chunker.iter_chunks(self.text)],
+                         [chunk.text for chunk in text_chunker.chunk(self.text)])
+
+    def test_chunk_many_threads_observed(self):
+        collected = []
+        text_chunker = TextChunker(chunk_size=8, observers=[collected.append])
+        list(text_chunker.chunk_many([self.text] * 3, workers=2, executor="thread"))
+        self.assertEqual(len(collected), 3)
+
+    def test_no_stats_without_observers(self):
+        text_chunker = TextChunker(chunk_size=8)
+        text_chunker._instrument = None  # never used by chunk when there are no observers
+        self.assertEqual(text_chunker.chunk(self.text).get_all_text(),
+                         TextChunker(chunk_size=8).chunk(self.text).get_all_text())
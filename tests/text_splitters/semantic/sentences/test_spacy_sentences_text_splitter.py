@@ -2,6 +2,7 @@ import unittest
 import pytest
 from unittest.mock import patch, MagicMock
 from chunkipy.utils import MissingDependencyError
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry
 
 from chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter import (
     SpacySentenceTextSplitter, SPACY_INSTRUCTIONS
@@ -12,10 +13,12 @@ class TestSpacySentenceTextSplitter(unittest.TestCase):
 
     def setUp(self):
         self.example_text = "This is the first sentence. Here is another one!"
-        self.splitter = SpacySentenceTextSplitter()
+        self.model_registry = ModelRegistry()
+        self.mock_langdetect = MagicMock()
+        self.splitter = SpacySentenceTextSplitter(model_registry=self.model_registry,
+                                                  language_detector=self.mock_langdetect)
         
         # Shared Mocks
-        self.mock_langdetect = MagicMock()
         self.mock_spacy = MagicMock()
         self.mock_model = MagicMock()
         self.mock_spacy.load.return_value = self.mock_model
@@ -62,7 +65,8 @@ class TestSpacySentenceTextSplitter(unittest.TestCase):
 
     def test_split_with_custom_models_map(self):
         models_map = {"it": "it_core_news_sm"}
-        splitter = SpacySentenceTextSplitter(models_map=models_map)
+        splitter = SpacySentenceTextSplitter(models_map=models_map, model_registry=self.model_registry,
+                                             language_detector=self.mock_langdetect)
         with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
             import_deps.side_effect = self.import_deps_side_effect
     
@@ -71,3 +75,112 @@ class TestSpacySentenceTextSplitter(unittest.TestCase):
 
             result = splitter._split("Ciao mondo.")
             self.assertEqual(result, ["Ciao mondo. "])
+
+    def test_models_are_loaded_once(self):
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            self.mock_langdetect.detect.return_value = "en"
+            self.mock_model.return_value.sents = []
+
+            self.splitter._split(self.example_text)
+            SpacySentenceTextSplitter(model_registry=self.model_registry,
+                                      language_detector=self.mock_langdetect)._split(self.example_text)
+            self.mock_spacy.load.assert_called_once_with("en_core_web_sm")
+
+    def test_warmup(self):
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            self.mock_model.return_value.sents = []
+
+            self.splitter.warmup(["en"])
+            self.mock_spacy.load.assert_called_once_with("en_core_web_sm")
+            self.mock_model.assert_called_once_with(SpacySentenceTextSplitter.WARMUP_TEXT)
+
+    def test_split_many_pipes_texts_by_language(self):
+        models = {"en_core_web_sm": MagicMock(), "it_core_news_sm": MagicMock()}
+        for model_name, model in models.items():
+            model.pipe.side_effect = lambda texts, **kwargs: [MagicMock(sents=[MagicMock(text=text)]) for text in texts]
+        self.mock_spacy.load.side_effect = lambda model_name: models[model_name]
+        self.mock_langdetect.detect.side_effect = lambda text: "it" if text.startswith("Ciao") else "en"
+
+        splitter = SpacySentenceTextSplitter(models_map={"en": "en_core_web_sm", "it": "it_core_news_sm"},
+                                             model_registry=self.model_registry, batch_size=8, n_process=2,
+                                             language_detector=self.mock_langdetect)
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            result = splitter.split_many(["Hello world.", "Ciao mondo.", "Hi there."])
+
+        self.assertEqual(result, [["Hello world. "], ["Ciao mondo. "], ["Hi there. "]])
+        self.assertEqual(models["en_core_web_sm"].pipe.call_count, 1)
+        self.assertEqual(models["it_core_news_sm"].pipe.call_count, 1)
+        self.assertEqual(models["en_core_web_sm"].pipe.call_args.kwargs, {"batch_size": 8, "n_process": 2})
+
+    def test_lean_profile_keeps_senter_only(self):
+        self.mock_spacy.util.load_config.return_value = {
+            "nlp": {"pipeline": ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]},
+            "components": {"senter": {"model": {"tok2vec": {"@architectures": "spacy.HashEmbedCNN.v2"}}}}
+        }
+        self.mock_model.disabled = ["senter"]
+        splitter = SpacySentenceTextSplitter(model_registry=self.model_registry, load_profile="lean",
+                                             language_detector=self.mock_langdetect)
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps, \
+                patch.object(SpacySentenceTextSplitter, "_model_data_path"):
+            import_deps.side_effect = self.import_deps_side_effect
+            self.mock_model.return_value.sents = [MagicMock(text="Hello world.")]
+
+            self.assertEqual(splitter._split("Hello world."), ["Hello world. "])
+
+        self.mock_spacy.load.assert_called_once_with(
+            "en_core_web_sm", exclude=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"])
+        self.mock_model.enable_pipe.assert_called_once_with("senter")
+        self.mock_model.select_pipes.assert_not_called()
+
+    def test_lean_profile_falls_back_to_parser(self):
+        self.mock_spacy.util.load_config.return_value = {
+            "nlp": {"pipeline": ["tok2vec", "tagger", "parser", "ner"]}, "components": {}
+        }
+        self.mock_model.disabled = []
+        splitter = SpacySentenceTextSplitter(model_registry=self.model_registry, load_profile="lean",
+                                             language_detector=self.mock_langdetect)
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps, \
+                patch.object(SpacySentenceTextSplitter, "_model_data_path"):
+            import_deps.side_effect = self.import_deps_side_effect
+            splitter._load_model("en")
+
+        self.mock_spacy.load.assert_called_once_with("en_core_web_sm", exclude=["tagger", "ner"])
+        self.mock_model.enable_pipe.assert_not_called()
+
+    def test_invalid_load_profile(self):
+        with self.assertRaises(ValueError):
+            SpacySentenceTextSplitter(load_profile="tiny")
+
+    def test_language_is_detected_once_per_text(self):
+        splitter = SpacySentenceTextSplitter(model_registry=self.model_registry, text_limit=20,
+                                             language_detector=self.mock_langdetect)
+        self.mock_langdetect.detect.return_value = "en"
+        self.mock_model.pipe.side_effect = lambda texts, **kwargs: [MagicMock(sents=[MagicMock(text=text)]) for text in texts]
+        text = "This is the first sentence. Here is another one! And a third one."
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            splitter.split(text)
+            splitter.split(text, lang="it")
+        self.mock_langdetect.detect.assert_called_once_with(text)
+
+    def test_lang_hint_skips_detection(self):
+        splitter = SpacySentenceTextSplitter(model_registry=self.model_registry, lang="en",
+                                             language_detector=self.mock_langdetect)
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            self.mock_model.pipe.return_value = [MagicMock(sents=[MagicMock(text="Hello world.")])]
+            self.assertEqual(splitter.split("Hello world."), ["Hello world. "])
+        self.mock_langdetect.detect.assert_not_called()
+
+    def test_pre_boundary_windowing_uses_sentence_offsets(self):
+        splitter = SpacySentenceTextSplitter(model_registry=self.model_registry, lang="en", windowing="pre_boundary",
+                                             language_detector=self.mock_langdetect)
+        text = "Hello world.  Hello world."
+        self.mock_model.pipe.return_value = [MagicMock(sents=[MagicMock(start_char=0, end_char=12),
+                                                              MagicMock(start_char=14, end_char=26)])]
+        with patch("chunkipy.text_splitters.semantic.sentences.spacy_sentences_text_splitter.import_dependencies") as import_deps:
+            import_deps.side_effect = self.import_deps_side_effect
+            self.assertEqual(splitter.split_spans(text), [(0, 14), (14, 26)])
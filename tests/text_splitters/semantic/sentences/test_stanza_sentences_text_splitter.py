@@ -1,14 +1,17 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry
 from chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter import StanzaSentenceTextSplitter
 
             
 class TestStanzaSentenceTextSplitter(unittest.TestCase):
     def setUp(self):
-        self.splitter = StanzaSentenceTextSplitter()
+        self.model_registry = ModelRegistry()
+        self.mock_langdetect = MagicMock()
+        self.splitter = StanzaSentenceTextSplitter(model_registry=self.model_registry,
+                                                   language_detector=self.mock_langdetect)
         
         # Shared Mocks
-        self.mock_langdetect = MagicMock()
         self.mock_download_method = MagicMock()
         self.mock_download_method.REUSE_RESOURCES = "reuse"
         self.mock_pipeline_cls = MagicMock()
@@ -84,5 +87,72 @@ class TestStanzaSentenceTextSplitter(unittest.TestCase):
             self.assertEqual(result, [])
 
 
+    def test_pipeline_is_cached_per_language(self):
+        with patch("chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter.import_dependencies") as mock_import_deps:
+            mock_import_deps.side_effect = self.import_deps_side_effect
+            self.mock_pipeline_instance.return_value.sentences = []
+
+            self.mock_langdetect.detect.return_value = "en"
+            self.splitter._split("Hello world.")
+            self.splitter._split("How are you?")
+            self.mock_langdetect.detect.return_value = "it"
+            self.splitter._split("Ciao mondo.")
+
+            self.assertEqual(self.mock_pipeline_cls.call_count, 2)
+            self.assertEqual([info.model_name for info in self.model_registry.model_info()], ["en", "it"])
+
+    def test_pipelines_are_shared_by_splitters(self):
+        with patch("chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter.import_dependencies") as mock_import_deps:
+            mock_import_deps.side_effect = self.import_deps_side_effect
+            self.mock_langdetect.detect.return_value = "en"
 
+            self.splitter._split("Hello world.")
+            StanzaSentenceTextSplitter(model_registry=self.model_registry,
+                                       language_detector=self.mock_langdetect)._split("Hello world.")
+            self.assertEqual(self.mock_pipeline_cls.call_count, 1)
 
+    def test_preload_langs(self):
+        with patch("chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter.import_dependencies") as mock_import_deps:
+            mock_import_deps.side_effect = self.import_deps_side_effect
+
+            splitter = StanzaSentenceTextSplitter(preload_langs=["en", "zh-cn"], model_registry=self.model_registry,
+                                                  language_detector=self.mock_langdetect)
+            self.assertEqual([info.model_name for info in self.model_registry.model_info()], ["en", "zh-hans"])
+
+            self.mock_langdetect.detect.return_value = "en"
+            splitter._split("Hello world.")
+            self.assertEqual(self.mock_pipeline_cls.call_count, 2)
+
+    def test_preload_unsupported_language(self):
+        with self.assertRaises(ValueError):
+            StanzaSentenceTextSplitter(preload_langs=["th"], model_registry=self.model_registry,
+                                       language_detector=self.mock_langdetect)
+
+    def test_split_processes_windows_in_bulk(self):
+        mock_document_cls = MagicMock(side_effect=lambda sentences, text: MagicMock(text=text))
+        import_deps_side_effect = lambda *args, **kwargs: (
+            (None, mock_document_cls) if kwargs.get("attribute_names") == ["Document"]
+            else self.import_deps_side_effect(*args, **kwargs)
+        )
+        # Each window is a single sentence, except for its last word
+        def bulk_process(documents):
+            return [MagicMock(sentences=[MagicMock(text=text) for text in document.text.rsplit(" ", 1)])
+                    for document in documents]
+        self.mock_pipeline_instance.bulk_process.side_effect = bulk_process
+        self.mock_langdetect.detect.return_value = "en"
+
+        splitter = StanzaSentenceTextSplitter(text_limit=20, model_registry=self.model_registry,
+                                              language_detector=self.mock_langdetect)
+        text = "one two three four five six seven eight nine ten"
+        with patch("chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter.import_dependencies") as mock_import_deps:
+            mock_import_deps.side_effect = import_deps_side_effect
+            result = splitter.split(text)
+        # The tails of the windows, then all the windows
+        self.assertEqual(self.mock_pipeline_instance.bulk_process.call_count, 2)
+
+        sequential_splitter = StanzaSentenceTextSplitter(text_limit=20, model_registry=self.model_registry,
+                                                         language_detector=self.mock_langdetect)
+        sequential_splitter.BULK_WINDOWS = False
+        with patch("chunkipy.text_splitters.semantic.sentences.stanza_sentences_text_splitter.import_dependencies") as mock_import_deps:
+            mock_import_deps.side_effect = import_deps_side_effect
+            self.assertEqual(result, sequential_splitter.split(text))
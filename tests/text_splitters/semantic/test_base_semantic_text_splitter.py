@@ -49,3 +49,83 @@ class TestBaseSemanticTextSplitter(unittest.TestCase):
         self.assertIn("b", result)
         self.assertIn("a", result)
         self.assertIn("x" * 100, result)
+
+    def test_split_many_matches_split(self):
+        texts = ["This is a test", "word " * 50, "a b c d e f g", "a " + "x" * 100 + " b"]
+        self.assertEqual(self.splitter.split_many(texts), [self.splitter.split(text) for text in texts])
+
+    def test_split_many_batches_windows(self):
+        batches = []
+
+        class BatchSemanticTextSplitter(DummySemanticTextSplitter):
+            def _split_batch(self, texts, langs):
+                batches.append(texts)
+                return super()._split_batch(texts, langs)
+
+        splitter = BatchSemanticTextSplitter(text_limit=10)
+        splitter.split_many(["one two three", "four five", "six seven eight nine"])
+        self.assertEqual(batches[0], ["one two th", "four five", "six seven "])
+        self.assertEqual(batches[1], ["three", "seven eight nine"])  # the last part of each window is carried over
+
+    def test_split_spans_many(self):
+        texts = ["one two three", "four five"]
+        self.assertEqual(self.splitter.split_spans_many(texts), [self.splitter.split_spans(text) for text in texts])
+
+    def test_bulk_windows_match_rounds(self):
+        class FullStopSemanticTextSplitter(BaseSemanticTextSplitter):
+            def _split(self, text):
+                sentences = text.split(". ")
+                return [sentence + ". " for sentence in sentences[:-1]] + sentences[-1:]
+
+        class BulkFullStopSemanticTextSplitter(FullStopSemanticTextSplitter):
+            BULK_WINDOWS = True
+            TAIL_GUESS_SIZE = 12
+
+        texts = ["One two. Three four five six. Seven. Eight nine ten eleven twelve thirteen. Fourteen.",
+                 "Short one.", "A very long sentence without any full stop until the very end. Then a short one."]
+        for text_limit in [5, 10, 20, 40]:
+            self.assertEqual(BulkFullStopSemanticTextSplitter(text_limit=text_limit).split_many(texts),
+                             FullStopSemanticTextSplitter(text_limit=text_limit).split_many(texts))
+
+    def test_pre_boundary_windows(self):
+        splitter = DummySemanticTextSplitter(text_limit=12, windowing="pre_boundary")
+        text = "One. Two\nthree four. Five six seven eightnineteneleven"
+        self.assertEqual([text[start:end] for start, end in splitter._pre_boundary_windows(text)],
+                         ["One. Two\n", "three four. ", "Five six ", "seven ", "eightnineten", "eleven"])
+
+    def test_pre_boundary_uses_exact_sentence_offsets(self):
+        class OffsetSemanticTextSplitter(BaseSemanticTextSplitter):
+            def _split(self, text):
+                raise AssertionError("Sentences are located from their offsets")
+
+            def _split_spans_batch(self, texts, langs):
+                # Sentences end with a full stop
+                texts_spans = []
+                for text in texts:
+                    spans, start = [], 0
+                    for idx, char in enumerate(text):
+                        if char == ".":
+                            spans.append((start, idx + 1))
+                            start = idx + 2
+                    texts_spans.append(spans + ([(start, len(text))] if text[start:].strip() else []))
+                return texts_spans
+
+        text = "  Yes. No. Yes.\nYes. A longer sentence. Yes."
+        expected = ["Yes. ", "No. ", "Yes.\n", "Yes. ", "A longer sentence. ", "Yes."]
+        for text_limit, workers in [(100, 1), (20, 1), (20, 3)]:
+            splitter = OffsetSemanticTextSplitter(text_limit=text_limit, windowing="pre_boundary", workers=workers)
+            self.assertEqual(splitter.split(text), expected)
+            spans = splitter.split_spans("__" + text, 2)
+            self.assertEqual([("__" + text)[start:end] for start, end in spans], expected)
+
+    def test_pre_boundary_split_many(self):
+        splitter = DummySemanticTextSplitter(text_limit=10, windowing="pre_boundary", workers=2)
+        texts = ["one two three four five", "six seven", "eight nine ten eleven"]
+        self.assertEqual(splitter.split_many(texts), [splitter.split(text) for text in texts])
+        self.assertEqual(splitter.split_many(texts)[1], ["six ", "seven"])
+
+    def test_invalid_windowing(self):
+        with self.assertRaises(ValueError):
+            DummySemanticTextSplitter(windowing="sliding")
+        with self.assertRaises(ValueError):
+            DummySemanticTextSplitter(workers=0)
@@ -0,0 +1,65 @@
+import pickle
+import unittest
+from unittest.mock import MagicMock, patch
+
+from chunkipy.text_splitters.semantic.language_detection import BaseLanguageDetector, LangdetectLanguageDetector
+
+
+class RecordingLanguageDetector(BaseLanguageDetector):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.detected = []
+
+    def _detect(self, text):
+        self.detected.append(text)
+        return "it" if "ciao" in text else "en"
+
+
+class TestLanguageDetection(unittest.TestCase):
+
+    def test_detection_is_cached_by_content(self):
+        detector = RecordingLanguageDetector()
+        self.assertEqual(detector.detect("hello world"), "en")
+        self.assertEqual(detector.detect("ciao mondo"), "it")
+        self.assertEqual(detector.detect("hello " + "world"), "en")
+        self.assertEqual(detector.detected, ["hello world", "ciao mondo"])
+
+    def test_detection_runs_on_bounded_sample(self):
+        detector = RecordingLanguageDetector(sample_size=30)
+        text = "a" * 100 + "b" * 100 + "c" * 100
+        detector.detect(text)
+        self.assertEqual(detector.detected, ["a" * 10 + "\n" + "b" * 10 + "\n" + "c" * 10])
+
+    def test_cache_is_bounded(self):
+        detector = RecordingLanguageDetector(max_entries=2)
+        for text in ["one", "two", "three", "one"]:
+            detector.detect(text)
+        self.assertEqual(detector.detected, ["one", "two", "three", "one"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RecordingLanguageDetector(sample_size=0)
+        with self.assertRaises(ValueError):
+            RecordingLanguageDetector(max_entries=0)
+
+    def test_langdetect_is_seeded(self):
+        mock_langdetect = MagicMock()
+        mock_langdetect.detect.return_value = "de"
+        with patch("chunkipy.text_splitters.semantic.language_detection.import_dependencies",
+                   return_value=mock_langdetect):
+            detector = LangdetectLanguageDetector(seed=42)
+            self.assertEqual(detector.detect("Hallo Welt"), "de")
+        self.assertEqual(mock_langdetect.DetectorFactory.seed, 42)
+        mock_langdetect.detect.assert_called_once_with("Hallo Welt")
+
+    def test_pickling(self):
+        detector = RecordingLanguageDetector(sample_size=100)
+        detector.detect("hello world")
+        unpickled = pickle.loads(pickle.dumps(detector))
+        self.assertEqual(unpickled.sample_size, 100)
+        unpickled.detect("hello world")
+        self.assertEqual(unpickled.detected, ["hello world", "hello world"])
+
+
+if __name__ == "__main__":
+    unittest.main()
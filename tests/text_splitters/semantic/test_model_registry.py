@@ -0,0 +1,146 @@
+import pickle
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from chunkipy.text_splitters.semantic.model_registry import ModelRegistry, get_default_model_registry
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def test_models_are_loaded_once(self):
+        registry = ModelRegistry()
+        loader = MagicMock(return_value="model")
+        self.assertEqual(registry.get("spacy", "en_core_web_sm", loader), "model")
+        self.assertEqual(registry.get("spacy", "en_core_web_sm", loader), "model")
+        loader.assert_called_once_with()
+        self.assertEqual(registry.registry_info().hits, 1)
+        self.assertEqual(registry.registry_info().loads, 1)
+        self.assertEqual(registry.model_info()[0].hits, 1)
+
+    def test_config_is_part_of_the_key(self):
+        registry = ModelRegistry()
+        registry.get("stanza", "en", lambda: "tokenize", config={"processors": "tokenize"})
+        registry.get("stanza", "en", lambda: "tokenize,pos", config={"processors": "tokenize,pos"})
+        self.assertEqual(len(registry), 2)
+        self.assertIn(ModelRegistry.make_key("stanza", "en", {"processors": "tokenize"}), registry)
+
+    def test_max_models_evicts_least_recently_used(self):
+        registry = ModelRegistry(max_models=2)
+        registry.get("spacy", "a", lambda: "a")
+        registry.get("spacy", "b", lambda: "b")
+        registry.get("spacy", "a", lambda: "a")
+        registry.get("spacy", "c", lambda: "c")
+        self.assertEqual([info.model_name for info in registry.model_info()], ["a", "c"])
+        self.assertEqual(registry.evictions, 1)
+
+    def test_max_memory_evicts_least_recently_used(self):
+        registry = ModelRegistry(max_memory=150)
+        memory = iter([0, 100, 100, 200, 200, 300])
+        with patch("chunkipy.text_splitters.semantic.model_registry._resident_memory", lambda: next(memory)):
+            registry.get("spacy", "a", lambda: "a")
+            registry.get("spacy", "b", lambda: "b")
+            self.assertEqual([info.model_name for info in registry.model_info()], ["b"])
+            registry.get("spacy", "c", lambda: "c")  # bigger than the budget, but kept as the only model
+        self.assertEqual([info.model_name for info in registry.model_info()], ["c"])
+        self.assertEqual(registry.resident_size, 100)
+
+    def test_failed_load_is_not_cached(self):
+        registry = ModelRegistry()
+        with self.assertRaises(OSError):
+            registry.get("spacy", "missing", MagicMock(side_effect=OSError))
+        self.assertEqual(len(registry), 0)
+
+    def test_slow_load_does_not_block_other_models(self):
+        registry = ModelRegistry()
+        registry.get("spacy", "b", lambda: "b")
+        loading, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            loading.set()
+            release.wait(5)
+            return "a"
+
+        thread = threading.Thread(target=registry.get, args=("spacy", "a", slow_loader))
+        thread.start()
+        try:
+            self.assertTrue(loading.wait(5))
+            start = time.perf_counter()
+            self.assertEqual(registry.get("spacy", "b", lambda: "b"), "b")
+            self.assertEqual(registry.get("spacy", "c", lambda: "c"), "c")
+            self.assertLess(time.perf_counter() - start, 1)
+            self.assertNotIn(ModelRegistry.make_key("spacy", "a"), registry)
+        finally:
+            release.set()
+            thread.join()
+        self.assertIn(ModelRegistry.make_key("spacy", "a"), registry)
+
+    def test_concurrent_gets_load_once(self):
+        registry = ModelRegistry()
+        loader_calls = []
+
+        def slow_loader():
+            loader_calls.append(1)
+            time.sleep(0.05)
+            return "a"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("spacy", "a", slow_loader)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["a"] * 8)
+        self.assertEqual(len(loader_calls), 1)
+        self.assertEqual((registry.loads, registry.hits), (1, 7))
+
+    def test_failed_concurrent_load_is_raised_to_waiting_threads(self):
+        registry = ModelRegistry()
+        loading, release = threading.Event(), threading.Event()
+
+        def failing_loader():
+            loading.set()
+            release.wait(5)
+            raise OSError("missing model")
+
+        errors = []
+
+        def get():
+            try:
+                registry.get("spacy", "missing", failing_loader)
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get)]
+        threads[0].start()
+        self.assertTrue(loading.wait(5))
+        threads.append(threading.Thread(target=get))
+        threads[1].start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(len(registry), 0)
+        # A later get loads it again
+        self.assertEqual(registry.get("spacy", "missing", lambda: "found"), "found")
+
+    def test_preload_and_clear(self):
+        registry = ModelRegistry()
+        registry.preload([("spacy", "a", lambda: "a"), ("stanza", "en", lambda: "en", {"processors": "tokenize"})])
+        self.assertEqual(len(registry), 2)
+        registry.clear()
+        self.assertEqual(registry.registry_info(), (0, 0, 0, 0, 0))
+
+    def test_pickling(self):
+        registry = ModelRegistry(max_models=3)
+        registry.get("spacy", "a", lambda: "a")
+        unpickled = pickle.loads(pickle.dumps(registry))
+        self.assertEqual(unpickled.max_models, 3)
+        self.assertEqual(len(unpickled), 0)
+        self.assertIs(pickle.loads(pickle.dumps(get_default_model_registry())), get_default_model_registry())
+
+
+if __name__ == "__main__":
+    unittest.main()
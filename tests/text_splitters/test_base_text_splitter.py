@@ -38,3 +38,27 @@ class TestBaseTextSplitter(unittest.TestCase):
         splitter = NotImplementedSplitter()
         with self.assertRaisesRegex(NotImplementedError, "Subclasses must implement the split method"):
             splitter.split("some text")
+
+    def test_split_spans_locates_parts(self):
+        splitter = DummyTextSplitter()
+        text = "Hello  world\nfrom chunkipy"
+        spans = splitter.split_spans(text)
+        self.assertEqual([text[start:end] for start, end in spans], ["Hello", "world", "from", "chunkipy"])
+
+    def test_split_spans_extends_altered_parts_over_whitespace(self):
+        class SentenceTextSplitter(BaseTextSplitter):
+            def _split(self, text: str) -> list[str]:
+                return [s.strip() + " " for s in text.split(".") if s.strip()]
+
+        splitter = SentenceTextSplitter()
+        text = "First sentence.\n\nSecond one"
+        spans = splitter.split_spans(text)
+        self.assertEqual([text[start:end] for start, end in spans], ["First sentence", "Second one"])
+
+    def test_split_spans_not_a_substring_raises(self):
+        class UpperTextSplitter(BaseTextSplitter):
+            def _split(self, text: str) -> list[str]:
+                return [text.upper()]
+
+        with self.assertRaisesRegex(ValueError, "is not a substring"):
+            UpperTextSplitter().split_spans("hello")
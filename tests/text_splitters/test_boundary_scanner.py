@@ -0,0 +1,55 @@
+import unittest
+from chunkipy.text_splitters import BoundaryScanner, SeparatorTextSplitter, SemicolonTextSplitter, ColonTextSplitter, \
+    CommaTextSplitter, WordTextSplitter, NewlineTextSplitter, FullStopTextSplitter
+from chunkipy.text_splitters.base_text_splitter import BaseTextSplitter
+
+
+class TestBoundaryScanner(unittest.TestCase):
+
+    def assert_same_spans(self, text_splitters, text):
+        scan = BoundaryScanner(text_splitters).scan(text)
+        for level, text_splitter in enumerate(text_splitters):
+            for start in range(len(text)):
+                for end in range(start + 1, len(text) + 1):
+                    self.assertEqual(scan.split_spans(level, start, end), text_splitter.split_spans(text, start, end),
+                                     f"separator {text_splitter.separator!r} on {text[start:end]!r}")
+
+    def test_split_spans_match_text_splitters(self):
+        text_splitters = [NewlineTextSplitter(), FullStopTextSplitter(), SemicolonTextSplitter(), ColonTextSplitter(),
+                          CommaTextSplitter(), WordTextSplitter()]
+        self.assert_same_spans(text_splitters, "One; two: three, four.\nFive  six. ; seven, , eight")
+
+    def test_overlapping_separators(self):
+        text_splitters = [SeparatorTextSplitter("--"), SeparatorTextSplitter("-"), WordTextSplitter()]
+        self.assert_same_spans(text_splitters, "a---b -- c----d - e")
+
+    def test_scans_each_separator_once(self):
+        scan = BoundaryScanner([CommaTextSplitter(), WordTextSplitter()]).scan("a b, c d, e")
+        self.assertEqual(scan.positions, {})
+        scan.split_spans(0, 0, 11)
+        scan.split_spans(0, 5, 11)
+        self.assertEqual(scan.positions, {", ": [3, 8]})
+
+    def test_scans_up_to_the_split_parts(self):
+        text = "a b, c d, e f, g h"
+        scan = BoundaryScanner([CommaTextSplitter(), WordTextSplitter()]).scan(text)
+        scan.SCAN_AHEAD = 0
+        self.assertEqual(scan.split_spans(0, 0, 4), [(0, 4)])
+        self.assertEqual(scan.positions, {", ": []})
+        # The occurrence straddling the scanned offset is found by the next scan
+        self.assertEqual(scan.split_spans(0, 0, 10), CommaTextSplitter().split_spans(text, 0, 10))
+        self.assertEqual(scan.positions, {", ": [3, 8]})
+        self.assertEqual(scan.split_spans(0, 0, len(text)), CommaTextSplitter().split_spans(text))
+        self.assertEqual(scan.positions, {", ": [3, 8, 13]})
+
+    def test_rejects_non_separator_text_splitters(self):
+        class ArrowTextSplitter(BaseTextSplitter):
+            def _split(self, text):
+                return text.split("->")
+
+        with self.assertRaises(ValueError):
+            BoundaryScanner([ArrowTextSplitter(), WordTextSplitter()])
+
+
+if __name__ == "__main__":
+    unittest.main()
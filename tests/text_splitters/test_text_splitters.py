@@ -53,4 +53,19 @@ class TestTextSplitter(unittest.TestCase):
         assert result == ["                    word1,word2,word3,word4,word5"]
         
 
+    def test_split_spans_separator(self):
+        splitter = CommaTextSplitter()
+        text = "word1, word2, word3, , word4"
+        spans = splitter.split_spans(text)
+        self.assertEqual([text[start:end] for start, end in spans], splitter.split(text))
+        self.assertEqual(spans, [(0, 7), (7, 14), (14, 21), (23, 28)])
+
+    def test_split_spans_within_range(self):
+        splitter = WordTextSplitter()
+        text = "skip this, split these words, skip"
+        self.assertEqual(splitter.split_spans(text, 11, 28), [(11, 17), (17, 23), (23, 28)])
 
+    def test_split_spans_trailing_separator(self):
+        splitter = SemicolonTextSplitter()
+        text = "a; b; "
+        self.assertEqual(splitter.split_spans(text), [(0, 3), (3, 4)])